@@ -10,6 +10,19 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 # Import your Base (contains metadata)
 from app.infrastructure.database.base import Base
+# Models must be imported so their tables are part of Base.metadata
+from app.infrastructure.database.models import outbox_model  # noqa: F401
+from app.infrastructure.database.models.academic import (  # noqa: F401
+    attendance_model,
+    grade_model,
+)
+from app.infrastructure.database.models.administrative import (  # noqa: F401
+    schedule_model,
+    student_model,
+)
+from app.infrastructure.database.models.financial import (  # noqa: F401
+    invoice_model,
+)
 from app.config.settings import settings
 
 
@@ -0,0 +1,54 @@
+"""attendance records
+
+Revision ID: 5b8e1c7d2a41
+Revises: 02f3404bfc60
+Create Date: 2026-10-18 10:00:00.000000-04:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "5b8e1c7d2a41"
+down_revision = "02f3404bfc60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attendance_records",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("session_date", sa.Date(), nullable=False),
+        sa.Column("period", sa.SmallInteger(), server_default="0", nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("note", sa.String(length=255), nullable=True),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_attendance_records")),
+    )
+    op.create_index(
+        "ix_attendance_records_student_session",
+        "attendance_records",
+        ["student_id", "session_date", "period"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_attendance_records_student_session", table_name="attendance_records")
+    op.drop_table("attendance_records")
@@ -0,0 +1,73 @@
+"""grades and grade aggregates
+
+Revision ID: 9d4f6a2b7c13
+Revises: 5b8e1c7d2a41
+Create Date: 2026-10-18 11:00:00.000000-04:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "9d4f6a2b7c13"
+down_revision = "5b8e1c7d2a41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "grades",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("course_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("assessment", sa.String(length=100), nullable=False),
+        sa.Column("score", sa.Numeric(8, 2), nullable=False),
+        sa.Column("max_score", sa.Numeric(8, 2), nullable=False),
+        sa.Column("weight", sa.Numeric(8, 2), nullable=False),
+        sa.Column("percent", sa.Numeric(5, 2), nullable=False),
+        sa.Column("graded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_grades")),
+    )
+    op.create_index(
+        "ix_grades_student_course_assessment",
+        "grades",
+        ["student_id", "course_id", "assessment"],
+        unique=True,
+    )
+    op.create_table(
+        "grade_aggregates",
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("course_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("grade_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("weight_sum", sa.Numeric(14, 2), server_default="0", nullable=False),
+        sa.Column("weighted_sum", sa.Numeric(18, 4), server_default="0", nullable=False),
+        sa.Column("percent_sum", sa.Numeric(14, 2), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("student_id", "course_id", name=op.f("pk_grade_aggregates")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("grade_aggregates")
+    op.drop_index("ix_grades_student_course_assessment", table_name="grades")
+    op.drop_table("grades")
@@ -0,0 +1,74 @@
+"""schedule entries
+
+Revision ID: c31a8e5f90d2
+Revises: 9d4f6a2b7c13
+Create Date: 2026-10-18 12:00:00.000000-04:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "c31a8e5f90d2"
+down_revision = "9d4f6a2b7c13"
+branch_labels = None
+depends_on = None
+
+RESOURCES = ("room", "teacher", "group")
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    if is_postgresql:
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.create_table(
+        "schedule_entries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("room_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("teacher_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("group_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("course_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("starts_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ends_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "ends_at > starts_at", name=op.f("ck_schedule_entries_valid_period")
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_schedule_entries")),
+    )
+
+    for resource in RESOURCES:
+        if is_postgresql:
+            op.execute(
+                f"ALTER TABLE schedule_entries ADD CONSTRAINT "
+                f"ex_schedule_entries_{resource}_overlap EXCLUDE USING gist "
+                f"({resource}_id WITH =, tstzrange(starts_at, ends_at, '[)') WITH &&) "
+                f"DEFERRABLE INITIALLY DEFERRED"
+            )
+        else:
+            op.create_index(
+                f"ix_schedule_entries_{resource}_starts",
+                "schedule_entries",
+                [f"{resource}_id", "starts_at"],
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        for resource in RESOURCES:
+            op.drop_index(f"ix_schedule_entries_{resource}_starts", table_name="schedule_entries")
+    op.drop_table("schedule_entries")
@@ -0,0 +1,83 @@
+"""students with search indexes
+
+Revision ID: e7a2c9d41b58
+Revises: c31a8e5f90d2
+Create Date: 2026-10-18 13:00:00.000000-04:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "e7a2c9d41b58"
+down_revision = "c31a8e5f90d2"
+branch_labels = None
+depends_on = None
+
+SEARCH_TEXT = "lower(last_name || ' ' || first_name || ' ' || student_number)"
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    if is_postgresql:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        "students",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("institution_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("student_number", sa.String(length=32), nullable=False),
+        sa.Column("first_name", sa.String(length=100), nullable=False),
+        sa.Column("last_name", sa.String(length=100), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("active", sa.Boolean(), server_default=sa.text("true"), nullable=False),
+        sa.Column(
+            "search_text",
+            sa.String(length=240),
+            sa.Computed(SEARCH_TEXT, persisted=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_students")),
+    )
+    op.create_index(
+        "ix_students_student_number", "students", ["student_number"], unique=True
+    )
+    op.create_index("ix_students_search_text", "students", ["search_text", "id"])
+
+    if is_postgresql:
+        op.create_index(
+            "ix_students_search_trgm",
+            "students",
+            ["search_text"],
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_students_search_vector",
+            "students",
+            [sa.text("to_tsvector('simple', search_text)")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_students_search_vector", table_name="students")
+        op.drop_index("ix_students_search_trgm", table_name="students")
+    op.drop_index("ix_students_search_text", table_name="students")
+    op.drop_index("ix_students_student_number", table_name="students")
+    op.drop_table("students")
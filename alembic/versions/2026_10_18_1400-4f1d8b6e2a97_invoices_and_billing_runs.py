@@ -0,0 +1,140 @@
+"""invoices, fees and billing runs
+
+Revision ID: 4f1d8b6e2a97
+Revises: e7a2c9d41b58
+Create Date: 2026-10-18 14:00:00.000000-04:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "4f1d8b6e2a97"
+down_revision = "e7a2c9d41b58"
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    # Billing walks each institution's students in id order
+    op.create_index("ix_students_institution", "students", ["institution_id", "id"])
+
+    op.create_table(
+        "fees",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("institution_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("code", sa.String(length=50), nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=False),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+        sa.Column("active", sa.Boolean(), server_default=sa.text("true"), nullable=False),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_fees")),
+    )
+    op.create_index(
+        "ix_fees_institution_code", "fees", ["institution_id", "code"], unique=True
+    )
+
+    op.create_table(
+        "invoices",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("institution_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("student_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("period", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("total", sa.Numeric(12, 2), nullable=False),
+        sa.Column("issued_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("billing_run_id", postgresql.UUID(as_uuid=True), nullable=True),
+        *_timestamps(),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_invoices")),
+    )
+    op.create_index(
+        "ix_invoices_student_period", "invoices", ["student_id", "period"], unique=True
+    )
+    op.create_index(
+        "ix_invoices_institution_period", "invoices", ["institution_id", "period"]
+    )
+
+    op.create_table(
+        "invoice_lines",
+        sa.Column("invoice_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("fee_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=False),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["invoice_id"],
+            ["invoices.id"],
+            name=op.f("fk_invoice_lines_invoice_id_invoices"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("invoice_id", "fee_id", name=op.f("pk_invoice_lines")),
+    )
+
+    op.create_table(
+        "billing_runs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("period", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("invoices", sa.Integer(), nullable=False),
+        sa.Column("lines", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_billing_runs")),
+    )
+    op.create_index(op.f("ix_billing_runs_period"), "billing_runs", ["period"])
+
+    op.create_table(
+        "billing_checkpoints",
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("institution_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("students", sa.Integer(), nullable=False),
+        sa.Column("invoices", sa.Integer(), nullable=False),
+        sa.Column("lines", sa.Integer(), nullable=False),
+        sa.Column("last_student_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("done", sa.Boolean(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["run_id"],
+            ["billing_runs.id"],
+            name=op.f("fk_billing_checkpoints_run_id_billing_runs"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("run_id", "institution_id", name=op.f("pk_billing_checkpoints")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("billing_checkpoints")
+    op.drop_index(op.f("ix_billing_runs_period"), table_name="billing_runs")
+    op.drop_table("billing_runs")
+    op.drop_table("invoice_lines")
+    op.drop_index("ix_invoices_institution_period", table_name="invoices")
+    op.drop_index("ix_invoices_student_period", table_name="invoices")
+    op.drop_table("invoices")
+    op.drop_index("ix_fees_institution_code", table_name="fees")
+    op.drop_table("fees")
+    op.drop_index("ix_students_institution", table_name="students")
@@ -1,8 +1,19 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Any, Type, TypeVar, Dict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Any, Type, TypeVar, Dict, List, Sequence
 
 T = TypeVar("T", bound="BaseDTO")
 
+# One compiled list serializer per DTO class (building a TypeAdapter is
+# expensive; reusing it is not)
+_LIST_ADAPTERS: Dict[type, TypeAdapter] = {}
+
+
+def _list_adapter(cls: type) -> TypeAdapter:
+    adapter = _LIST_ADAPTERS.get(cls)
+    if adapter is None:
+        adapter = _LIST_ADAPTERS[cls] = TypeAdapter(List[cls])
+    return adapter
+
 
 class BaseDTO(BaseModel):
     """
@@ -31,3 +42,17 @@ class BaseDTO(BaseModel):
         Serialize safely to a native dict.
         """
         return self.model_dump()
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize straight to JSON bytes with the model's compiled
+        pydantic-core serializer, skipping the intermediate dict.
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
+    @classmethod
+    def list_to_json_bytes(cls: Type[T], items: Sequence[T]) -> bytes:
+        """
+        Serialize a list of DTOs to a JSON array in one pydantic-core call.
+        """
+        return _list_adapter(cls).dump_json(list(items))
@@ -5,4 +5,10 @@ This package contains base event definitions, event dispatchers,
 and shared interfaces used by vertical slices that emit or consume events.
 """
 
-__all__ = []
+from .base_event import DomainEvent
+from .dispatcher import Backpressure, EventBus, Subscription
+
+# Process-wide bus (started/stopped with the FastAPI app)
+event_bus = EventBus()
+
+__all__ = ["DomainEvent", "EventBus", "Subscription", "Backpressure", "event_bus"]
@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, ClassVar, Dict, Optional, Type, Union, get_args, get_origin, get_type_hints
+import uuid
+
+# event_name -> event class, filled as subclasses are defined
+_EVENT_TYPES: Dict[str, Type["DomainEvent"]] = {}
+
+
+@dataclass(frozen=True, kw_only=True)
+class DomainEvent:
+    """
+    Base class for events emitted by vertical slices.
+
+    Subclasses are frozen dataclasses that add their own payload:
+
+        @dataclass(frozen=True, kw_only=True)
+        class GradePosted(DomainEvent):
+            student_id: uuid.UUID
+            course_id: uuid.UUID
+            score: float
+    """
+
+    # Stable name used for routing/serialization; defaults to the class name
+    event_name: ClassVar[str] = ""
+
+    event_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get("event_name"):
+            cls.event_name = cls.__name__
+        _EVENT_TYPES[cls.event_name] = cls
+
+    # -------------------------
+    # Serialization
+    # -------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe payload (UUIDs, dates and Decimals become strings)."""
+        return {f.name: _to_json(getattr(self, f.name)) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DomainEvent":
+        """Inverse of to_dict(), coercing values back to the annotated types."""
+        hints = get_type_hints(cls)
+        kwargs = {
+            f.name: _from_json(data[f.name], hints.get(f.name))
+            for f in fields(cls)
+            if f.init and f.name in data
+        }
+        return cls(**kwargs)
+
+    @staticmethod
+    def resolve(event_name: str) -> Optional[Type["DomainEvent"]]:
+        """Event class registered under `event_name`, if any."""
+        return _EVENT_TYPES.get(event_name)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_json(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    return value
+
+
+def _from_json(value: Any, hint: Any) -> Any:
+    if value is None or hint is None:
+        return value
+    if get_origin(hint) is Union:
+        args = [a for a in get_args(hint) if a is not type(None)]
+        return _from_json(value, args[0]) if len(args) == 1 else value
+    if isinstance(hint, type):
+        if issubclass(hint, uuid.UUID):
+            return uuid.UUID(value)
+        if issubclass(hint, datetime):
+            return datetime.fromisoformat(value)
+        if issubclass(hint, date):
+            return date.fromisoformat(value)
+        if issubclass(hint, (Decimal, Enum)):
+            return hint(value)
+    return value
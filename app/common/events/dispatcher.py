@@ -0,0 +1,238 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, Type, TypeVar
+import asyncio
+import logging
+import time
+
+from app.common.events.base_event import DomainEvent
+from app.common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+E = TypeVar("E", bound=DomainEvent)
+
+BatchHandler = Callable[[Sequence[E]], Awaitable[None]]
+
+EVENTS_PUBLISHED = metrics.counter(
+    "events_published_total", "Events accepted by a subscription queue.", labelnames=("subscription",)
+)
+EVENTS_DROPPED = metrics.counter(
+    "events_dropped_total", "Events dropped because a queue was full.", labelnames=("subscription",)
+)
+EVENTS_HANDLED = metrics.counter(
+    "events_handled_total", "Events delivered to a handler successfully.", labelnames=("subscription",)
+)
+EVENTS_FAILED = metrics.counter(
+    "events_failed_total", "Events whose handler raised.", labelnames=("subscription",)
+)
+EVENT_QUEUE_DEPTH = metrics.gauge(
+    "event_queue_depth", "Events waiting in a subscription queue.", labelnames=("subscription",)
+)
+
+
+class Backpressure(str, Enum):
+    """What publish() does when a subscription queue is full."""
+
+    BLOCK = "block"              # wait for room (slows the publisher down)
+    DROP_NEWEST = "drop_newest"  # discard the event being published
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued event
+
+
+@dataclass(eq=False)
+class Subscription(Generic[E]):
+    """One handler bound to an event type, with its own queue and workers."""
+
+    event_type: Type[E]
+    handler: BatchHandler
+    name: str
+    max_queue_size: int = 1000
+    concurrency: int = 1
+    batch_size: int = 1
+    max_batch_wait: float = 0.05
+    backpressure: Backpressure = Backpressure.BLOCK
+    queue: asyncio.Queue = field(init=False)
+    workers: List[asyncio.Task] = field(default_factory=list, init=False)
+
+    def __post_init__(self) -> None:
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+
+
+class EventBus:
+    """
+    In-process async event dispatcher.
+
+    Each subscription owns a bounded queue drained by `concurrency`
+    worker tasks. Workers hand events to the handler in micro-batches
+    of up to `batch_size`, waiting at most `max_batch_wait` seconds to
+    fill a batch, so side effects run off the request path while memory
+    stays bounded by the queue sizes. Handler errors are logged and
+    counted; they never reach the publisher.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: List[Subscription] = []
+        self._running = False
+
+    # -------------------------
+    # Registration
+    # -------------------------
+    def subscribe(
+        self,
+        event_type: Type[E],
+        handler: BatchHandler,
+        *,
+        name: Optional[str] = None,
+        max_queue_size: int = 1000,
+        concurrency: int = 1,
+        batch_size: int = 1,
+        max_batch_wait: float = 0.05,
+        backpressure: Backpressure = Backpressure.BLOCK,
+    ) -> Subscription[E]:
+        subscription = Subscription(
+            event_type=event_type,
+            handler=handler,
+            name=name or f"{event_type.__name__}:{getattr(handler, '__qualname__', handler)}",
+            max_queue_size=max_queue_size,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            max_batch_wait=max_batch_wait,
+            backpressure=Backpressure(backpressure),
+        )
+        self._subscriptions.append(subscription)
+        if self._running:
+            self._start_workers(subscription)
+        return subscription
+
+    def subscriber(self, event_type: Type[E], **options):
+        """
+        Decorator form of subscribe():
+
+            @event_bus.subscriber(AttendanceMarked, batch_size=500)
+            async def update_counters(events): ...
+        """
+        def decorator(handler: BatchHandler) -> BatchHandler:
+            self.subscribe(event_type, handler, **options)
+            return handler
+        return decorator
+
+    # -------------------------
+    # Publishing
+    # -------------------------
+    async def publish(self, event: DomainEvent) -> None:
+        for subscription in self._subscriptions:
+            if isinstance(event, subscription.event_type):
+                await self._enqueue(subscription, event)
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        for event in events:
+            await self.publish(event)
+
+    async def dispatch(self, events: Sequence[DomainEvent]) -> None:
+        """
+        Run the matching handlers on `events` now and wait for them.
+
+        Unlike publish(), nothing is queued: each subscription's handler
+        is awaited with the events it accepts and the first failure is
+        raised to the caller. Callers that must know the side effects
+        happened (the outbox relay) use this instead of publish().
+        """
+        for subscription in self._subscriptions:
+            matching = [e for e in events if isinstance(e, subscription.event_type)]
+            for i in range(0, len(matching), subscription.batch_size):
+                batch = matching[i:i + subscription.batch_size]
+                try:
+                    await subscription.handler(batch)
+                except Exception:
+                    EVENTS_FAILED.inc(len(batch), subscription=subscription.name)
+                    raise
+                EVENTS_HANDLED.inc(len(batch), subscription=subscription.name)
+
+    async def _enqueue(self, subscription: Subscription, event: DomainEvent) -> None:
+        queue = subscription.queue
+        if subscription.backpressure is Backpressure.BLOCK:
+            await queue.put(event)
+        elif queue.full():
+            if subscription.backpressure is Backpressure.DROP_NEWEST:
+                EVENTS_DROPPED.inc(subscription=subscription.name)
+                return
+            queue.get_nowait()
+            queue.task_done()
+            EVENTS_DROPPED.inc(subscription=subscription.name)
+            queue.put_nowait(event)
+        else:
+            queue.put_nowait(event)
+        EVENTS_PUBLISHED.inc(subscription=subscription.name)
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        for subscription in self._subscriptions:
+            if subscription.queue.empty():
+                # asyncio queues bind to the loop that first waits on them
+                subscription.queue = asyncio.Queue(maxsize=subscription.max_queue_size)
+            self._start_workers(subscription)
+
+    async def stop(self, drain: bool = True, timeout: float = 10.0) -> None:
+        """
+        Stop the workers. With `drain`, queued events are delivered first
+        (bounded by `timeout`).
+        """
+        if not self._running:
+            return
+        if drain:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(s.queue.join() for s in self._subscriptions)),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Event bus stopped with undelivered events.")
+        self._running = False
+        for subscription in self._subscriptions:
+            for worker in subscription.workers:
+                worker.cancel()
+            await asyncio.gather(*subscription.workers, return_exceptions=True)
+            subscription.workers.clear()
+
+    def _start_workers(self, subscription: Subscription) -> None:
+        for index in range(subscription.concurrency):
+            subscription.workers.append(
+                asyncio.create_task(
+                    self._worker(subscription), name=f"event-worker:{subscription.name}:{index}"
+                )
+            )
+
+    # -------------------------
+    # Workers
+    # -------------------------
+    async def _worker(self, subscription: Subscription) -> None:
+        queue = subscription.queue
+        while True:
+            batch = [await queue.get()]
+            deadline = time.monotonic() + subscription.max_batch_wait
+            while len(batch) < subscription.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            EVENT_QUEUE_DEPTH.set(queue.qsize(), subscription=subscription.name)
+            try:
+                await subscription.handler(batch)
+                EVENTS_HANDLED.inc(len(batch), subscription=subscription.name)
+            except Exception:
+                EVENTS_FAILED.inc(len(batch), subscription=subscription.name)
+                logger.exception(
+                    "Event handler %s failed for %d event(s)", subscription.name, len(batch)
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
@@ -27,6 +27,11 @@ class ValidationError(DomainError):
     pass
 
 
+class ConflictError(DomainError):
+    """The change clashes with the current state (double booking, ...)."""
+    pass
+
+
 # ------------------------------------------------------------
 # Application layer errors (use case failures)
 # ------------------------------------------------------------
@@ -40,6 +45,16 @@ class PermissionDeniedError(UseCaseError):
     pass
 
 
+class UseCaseTimeoutError(UseCaseError):
+    """A use case exceeded its time budget."""
+    pass
+
+
+class UseCaseBusyError(UseCaseError):
+    """A use case reached its concurrency limit and rejected the call."""
+    pass
+
+
 # ------------------------------------------------------------
 # Infrastructure errors (database, adapters)
 # ------------------------------------------------------------
@@ -67,6 +82,25 @@ def translate_exception(exc: AppError) -> HTTPException:
             detail=str(exc)
         )
 
+    if isinstance(exc, ConflictError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc)
+        )
+
+    if isinstance(exc, UseCaseTimeoutError):
+        return HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(exc)
+        )
+
+    if isinstance(exc, UseCaseBusyError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        )
+
     if isinstance(exc, ValidationError):
         return HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -1,9 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Generic,
+    TypeVar,
+    Optional,
+    List,
+    Sequence,
+    Union,
+)
 
 T = TypeVar("T")      # Entity type
 ID = TypeVar("ID")    # ID type (UUID usually)
 
+OrderBy = Union[str, Sequence[str]]
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """
+    One page of a keyset (cursor) paginated listing.
+
+    `next_cursor` is an opaque token to pass back to `list_after()`;
+    it is None when there are no more rows.
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
 
 class BaseRepository(ABC, Generic[T, ID]):
     """
@@ -22,9 +50,65 @@ class BaseRepository(ABC, Generic[T, ID]):
     async def delete(self, entity_id: ID) -> None:
         raise NotImplementedError
 
+    async def get_by_ids(self, entity_ids: Sequence[ID]) -> List[Optional[T]]:
+        """
+        Fetch several entities, returned in the order of `entity_ids`
+        with None for ids that do not exist.
+        Concrete repositories should override with a single query.
+        """
+        return [await self.get_by_id(entity_id) for entity_id in entity_ids]
+
     async def list(self, limit: int = 100, offset: int = 0) -> List[T]:
         """
         Optional convenience method.
         Concrete repositories may override for efficiency.
         """
         raise NotImplementedError("list() not implemented")
+
+    async def list_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: OrderBy = "id",
+    ) -> CursorPage[T]:
+        """
+        Optional keyset pagination.
+        Returns the page of rows that sort after `cursor`.
+        """
+        raise NotImplementedError("list_after() not implemented")
+
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[T]:
+        """
+        Optional constant-memory iteration over every entity.
+        """
+        raise NotImplementedError("stream() not implemented")
+
+    # ------------------------------------------
+    # Bulk operations
+    # ------------------------------------------
+    async def save_many(self, entities: Sequence[T]) -> List[T]:
+        """
+        Persist several entities.
+        Falls back to one save() per entity; concrete repositories
+        should override with a batched implementation.
+        """
+        return [await self.save(entity) for entity in entities]
+
+    async def upsert_many(
+        self,
+        entities: Sequence[T],
+        conflict_columns: Sequence[str] = ("id",),
+    ) -> List[T]:
+        """
+        Optional batched insert-or-update keyed on `conflict_columns`.
+        """
+        raise NotImplementedError("upsert_many() not implemented")
+
+    async def delete_many(self, entity_ids: Sequence[ID]) -> int:
+        """
+        Delete several entities and return how many ids were processed.
+        Falls back to one delete() per id.
+        """
+        for entity_id in entity_ids:
+            await self.delete(entity_id)
+        return len(entity_ids)
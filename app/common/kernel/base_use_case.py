@@ -1,5 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, Any
+from dataclasses import dataclass
+from typing import Callable, ClassVar, Dict, Generic, List, TypeVar, Optional, Any
+import asyncio
+import logging
+import time
+
+from app.common.exceptions import UseCaseBusyError, UseCaseTimeoutError
+from app.common.kernel.unit_of_work import UnitOfWork
+from app.common.metrics import metrics
+
+logger = logging.getLogger(__name__)
 
 InputType = TypeVar("InputType")
 OutputType = TypeVar("OutputType")
@@ -31,6 +41,72 @@ class Result(Generic[OutputType]):
         return Result(error=error)
 
 
+# ------------------------------------------------------------
+# Execution hooks
+# ------------------------------------------------------------
+@dataclass
+class UseCaseExecution:
+    """Timing and outcome of one execute() call, passed to the hooks."""
+
+    use_case: str
+    outcome: str                  # "ok" | "error" | "timeout" | "rejected"
+    total_seconds: float
+    wait_seconds: float = 0.0     # queued on the concurrency limit
+    validate_seconds: float = 0.0
+    perform_seconds: float = 0.0
+    error_type: Optional[str] = None
+
+
+UseCaseHook = Callable[[UseCaseExecution], None]
+
+_HOOKS: List[UseCaseHook] = []
+
+
+def register_use_case_hook(hook: UseCaseHook) -> None:
+    """Call `hook` after every use case execution (e.g. tracing, audit)."""
+    if hook not in _HOOKS:
+        _HOOKS.append(hook)
+
+
+def unregister_use_case_hook(hook: UseCaseHook) -> None:
+    if hook in _HOOKS:
+        _HOOKS.remove(hook)
+
+
+USE_CASE_SECONDS = metrics.histogram(
+    "use_case_duration_seconds",
+    "Use case execution time per phase (wait, validate, perform, total).",
+    labelnames=("use_case", "phase"),
+)
+USE_CASE_EXECUTIONS = metrics.counter(
+    "use_case_executions_total",
+    "Use case executions by outcome and error type.",
+    labelnames=("use_case", "outcome", "error_type"),
+)
+USE_CASE_IN_FLIGHT = metrics.gauge(
+    "use_case_in_flight",
+    "Use case executions currently running.",
+    labelnames=("use_case",),
+)
+
+
+def _record_metrics(execution: UseCaseExecution) -> None:
+    name = execution.use_case
+    USE_CASE_SECONDS.observe(execution.total_seconds, use_case=name, phase="total")
+    USE_CASE_SECONDS.observe(execution.wait_seconds, use_case=name, phase="wait")
+    USE_CASE_SECONDS.observe(execution.validate_seconds, use_case=name, phase="validate")
+    USE_CASE_SECONDS.observe(execution.perform_seconds, use_case=name, phase="perform")
+    USE_CASE_EXECUTIONS.inc(
+        use_case=name, outcome=execution.outcome, error_type=execution.error_type or ""
+    )
+
+
+register_use_case_hook(_record_metrics)
+
+
+# ------------------------------------------------------------
+# Base use case
+# ------------------------------------------------------------
 class BaseUseCase(ABC, Generic[InputType, OutputType]):
     """
     Base class for application-level use cases.
@@ -38,15 +114,106 @@ class BaseUseCase(ABC, Generic[InputType, OutputType]):
     Override:
       - validate(input)
       - perform(input)
+
+    When `unit_of_work` is set, perform() runs inside it: repositories
+    only flush and everything is committed once when perform() returns
+    (or rolled back when it raises).
+
+    Optional class-level limits:
+      - timeout: seconds for the whole execution (queueing included);
+        exceeding it fails with UseCaseTimeoutError
+      - max_concurrency: executions of this class allowed at once per
+        process; extra calls queue, or fail with UseCaseBusyError when
+        `reject_when_busy` is set
+
+    Every execution is reported to the registered hooks (per-phase
+    durations, outcome and error type are recorded as metrics by default).
     """
 
+    unit_of_work: Optional[UnitOfWork] = None
+
+    timeout: ClassVar[Optional[float]] = None
+    max_concurrency: ClassVar[Optional[int]] = None
+    reject_when_busy: ClassVar[bool] = False
+
+    # One semaphore per use case class, shared by all instances
+    _semaphores: ClassVar[Dict[type, asyncio.Semaphore]] = {}
+
     async def execute(self, input_data: InputType) -> Result[OutputType]:
+        execution = UseCaseExecution(
+            use_case=type(self).__name__, outcome="ok", total_seconds=0.0
+        )
+        start = time.perf_counter()
+        deadline = asyncio.timeout(self.timeout)
         try:
-            await self.validate(input_data)
-            output = await self.perform(input_data)
+            async with deadline:
+                output = await self._execute_limited(input_data, execution)
             return Result.ok(output)
+        except TimeoutError as exc:
+            if not deadline.expired():
+                # Raised inside perform() (a driver or nested timeout), not our deadline
+                execution.outcome, execution.error_type = "error", type(exc).__name__
+                return Result.fail(exc)
+            execution.outcome, execution.error_type = "timeout", type(exc).__name__
+            return Result.fail(
+                UseCaseTimeoutError(f"{execution.use_case} timed out after {self.timeout}s.")
+            )
+        except UseCaseBusyError as exc:
+            execution.outcome, execution.error_type = "rejected", type(exc).__name__
+            return Result.fail(exc)
         except Exception as exc:
+            execution.outcome, execution.error_type = "error", type(exc).__name__
             return Result.fail(exc)
+        finally:
+            execution.total_seconds = time.perf_counter() - start
+            self._run_hooks(execution)
+
+    async def _execute_limited(self, input_data: InputType, execution: UseCaseExecution) -> OutputType:
+        semaphore = self._semaphore()
+        if semaphore is None:
+            return await self._execute_phases(input_data, execution)
+
+        if self.reject_when_busy and semaphore.locked():
+            raise UseCaseBusyError(f"{execution.use_case} is at its concurrency limit.")
+        wait_start = time.perf_counter()
+        async with semaphore:
+            execution.wait_seconds = time.perf_counter() - wait_start
+            return await self._execute_phases(input_data, execution)
+
+    async def _execute_phases(self, input_data: InputType, execution: UseCaseExecution) -> OutputType:
+        USE_CASE_IN_FLIGHT.inc(use_case=execution.use_case)
+        try:
+            phase_start = time.perf_counter()
+            await self.validate(input_data)
+            execution.validate_seconds = time.perf_counter() - phase_start
+
+            phase_start = time.perf_counter()
+            try:
+                if self.unit_of_work is None:
+                    return await self.perform(input_data)
+                async with self.unit_of_work:
+                    return await self.perform(input_data)
+            finally:
+                execution.perform_seconds = time.perf_counter() - phase_start
+        finally:
+            USE_CASE_IN_FLIGHT.dec(use_case=execution.use_case)
+
+    def _semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrency:
+            return None
+        cls = type(self)
+        semaphore = BaseUseCase._semaphores.get(cls)
+        if semaphore is None:
+            semaphore = BaseUseCase._semaphores[cls] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @staticmethod
+    def _run_hooks(execution: UseCaseExecution) -> None:
+        for hook in _HOOKS:
+            try:
+                hook(execution)
+            except Exception:  # a broken hook must not change the result
+                logger.exception("Use case hook %r failed", hook)
 
     async def validate(self, input_data: InputType) -> None:
         """
@@ -0,0 +1,155 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from app.common.kernel.base_repository import BaseRepository
+
+K = TypeVar("K", bound=Hashable)   # Key type (entity id)
+V = TypeVar("V")                   # Loaded value type
+
+BatchLoadFn = Callable[[List[K]], Awaitable[Sequence[Optional[V]]]]
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces individual `load(key)` awaits into batched calls.
+
+    Every key requested during the same event-loop tick is collected and
+    resolved by one call to `batch_load_fn`, which must return values in
+    the same order as the keys it receives (None for misses). Results are
+    memoized for the lifetime of the loader, so create one per request.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: BatchLoadFn,
+        *,
+        max_batch_size: int = 1000,
+        cache: bool = True,
+        lock: Optional[asyncio.Lock] = None,
+    ):
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._cache_enabled = cache
+        # Serializes batches that share one AsyncSession
+        self._lock = lock
+
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._queue: List[Tuple[K, asyncio.Future]] = []
+        self._dispatch_scheduled = False
+        # Strong references: the loop only keeps weak ones to running tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    async def load(self, key: K) -> Optional[V]:
+        if self._cache_enabled and key in self._cache:
+            return await asyncio.shield(self._cache[key])
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self._cache_enabled:
+            self._cache[key] = future
+        self._queue.append((key, future))
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+
+        # Shield so one cancelled caller does not fail everyone sharing the key
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Sequence[K]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(k) for k in keys)))
+
+    def prime(self, key: K, value: Optional[V]) -> None:
+        """Seed the cache with an already known value."""
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: K) -> None:
+        self._cache.pop(key, None)
+
+    def clear_all(self) -> None:
+        self._cache.clear()
+
+    # -------------------------
+    # Batching internals
+    # -------------------------
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        queue, self._queue = self._queue, []
+
+        for start in range(0, len(queue), self._max_batch_size):
+            batch = queue[start:start + self._max_batch_size]
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[K, asyncio.Future]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            if self._lock is not None:
+                async with self._lock:
+                    values = await self._batch_load_fn(keys)
+            else:
+                values = await self._batch_load_fn(keys)
+
+            if len(values) != len(keys):
+                raise ValueError(
+                    "DataLoader batch function must return one value per key "
+                    f"(got {len(values)} for {len(keys)} keys)."
+                )
+        except BaseException as exc:
+            for key, future in batch:
+                # Do not memoize failures; a later load() may retry
+                self._cache.pop(key, None)
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for (_, future), value in zip(batch, values):
+            if not future.done():
+                future.set_result(value)
+
+
+class DataLoaderRegistry:
+    """
+    Request-scoped collection of DataLoaders, one per repository type.
+
+    All loaders share a lock because repositories in the same request
+    share one AsyncSession, which does not allow concurrent queries.
+    """
+
+    def __init__(self) -> None:
+        self._loaders: Dict[Any, DataLoader] = {}
+        self._session_lock = asyncio.Lock()
+
+    def for_repository(self, repository: BaseRepository) -> DataLoader:
+        key = type(repository)
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = DataLoader(repository.get_by_ids, lock=self._session_lock)
+            self._loaders[key] = loader
+        return loader
@@ -0,0 +1,136 @@
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import asyncio
+import inspect
+
+from app.common.metrics import metrics
+
+V = TypeVar("V")
+
+SINGLE_FLIGHT_CALLS = metrics.counter(
+    "single_flight_calls_total",
+    "Calls through a single-flight group; role is leader (executed) or deduplicated.",
+    labelnames=("name", "role"),
+)
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    The first caller (leader) starts the work as a task; callers arriving
+    while it is in flight await the same task instead of repeating it.
+    Nothing is cached: once the task finishes the next call runs again.
+    The task is cancelled only when every waiter has gone away, so one
+    client disconnecting does not fail the others.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[V]]) -> V:
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            SINGLE_FLIGHT_CALLS.inc(name=self.name, role="leader")
+        else:
+            SINGLE_FLIGHT_CALLS.inc(name=self.name, role="deduplicated")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Mark the error as retrieved even if every waiter went away
+        if not call.task.cancelled():
+            call.task.exception()
+
+
+def _freeze(value: Any) -> Hashable:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        if isinstance(value, dict):
+            return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return tuple(_freeze(v) for v in value)
+        dump = getattr(value, "model_dump", None)  # pydantic models / DTOs
+        if callable(dump):
+            return (type(value), _freeze(dump()))
+        return (type(value), repr(value))
+
+
+def single_flight(
+    func: Optional[Callable[..., Awaitable[V]]] = None,
+    *,
+    key: Optional[Callable[..., Hashable]] = None,
+    name: Optional[str] = None,
+):
+    """
+    Decorator sharing one in-flight execution among identical calls.
+
+    The intended use is a read use case keyed on its query that opens
+    its own session, so concurrent requests (each with its own use-case
+    instance) share one execution:
+
+        class GetTimetable(BaseUseCase[TimetableQuery, TimetableDTO]):
+            def __init__(self, session_factory: async_sessionmaker):
+                self.session_factory = session_factory
+
+            @single_flight(key=lambda self, query: (query.group_id, query.week))
+            async def perform(self, query):
+                async with self.session_factory() as session:
+                    ...
+
+    Without `key=`, calls are keyed on their arguments, and for methods
+    that includes the instance's identity: only calls on the same object
+    coalesce. That makes a bare @single_flight on a per-request
+    repository a no-op across requests. Pass `key=` only when the work
+    does not depend on request-bound instance state (such as the
+    caller's session), because it runs on the leader's instance. Use
+    it on reads only: concurrent callers receive the very same result
+    object.
+    """
+
+    def decorate(fn: Callable[..., Awaitable[V]]) -> Callable[..., Awaitable[V]]:
+        group = SingleFlight(name or fn.__qualname__)
+        params = list(inspect.signature(fn).parameters)
+        is_method = bool(params) and params[0] in ("self", "cls")
+
+        def default_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+            if is_method and args and not isinstance(args[0], type):
+                # The call holds the instance, so its id is unique while in flight
+                args = (id(args[0]),) + args[1:]
+            return _freeze(args), _freeze(kwargs)
+
+        @wraps(fn)
+        async def wrapper(*args, **kwargs) -> V:
+            call_key = key(*args, **kwargs) if key else default_key(args, kwargs)
+            return await group.do(call_key, lambda: fn(*args, **kwargs))
+
+        wrapper.single_flight = group
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+from typing import Optional, Type
+from types import TracebackType
+
+
+class UnitOfWork(ABC):
+    """
+    Transaction boundary shared by every repository of a use case.
+
+    Repositories working inside a unit of work only flush their changes;
+    the unit of work commits once when the outermost `async with` block
+    exits cleanly and rolls everything back otherwise:
+
+        async with uow:
+            await students.save(student)
+            await invoices.save(invoice)
+        # one COMMIT here
+
+    Re-entering an active unit of work joins it instead of starting a
+    new transaction, so use cases can call each other freely. Use
+    `savepoint()` for nested work that may fail on its own.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if self._depth == 0:
+            await self._begin()
+        self._depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self._close()
+
+    # -------------------------
+    # Backend hooks
+    # -------------------------
+    @abstractmethod
+    async def _begin(self) -> None:
+        raise NotImplementedError
+
+    async def _close(self) -> None:
+        return None
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """
+        Nested transaction: on error only the work done inside the
+        block is rolled back and the exception propagates.
+        """
+        raise NotImplementedError
@@ -0,0 +1,72 @@
+"""
+Per-request timing spans.
+
+A RequestTimings object is bound to the current request through a
+ContextVar by the API's ServerTimingMiddleware; any layer can add to it
+without knowing about HTTP (DB hooks, serializers, use cases). Outside a
+request every helper is a cheap no-op.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+import time
+
+
+class RequestTimings:
+    """Accumulated durations (nanoseconds) for one request."""
+
+    __slots__ = ("start_ns", "handler_end_ns", "db_ns", "queries", "spans")
+
+    def __init__(self) -> None:
+        self.start_ns = time.perf_counter_ns()
+        self.handler_end_ns = 0
+        self.db_ns = 0
+        self.queries = 0
+        # name -> accumulated nanoseconds (handler, serialize, custom spans)
+        self.spans: Dict[str, int] = {}
+
+    def add(self, name: str, duration_ns: int) -> None:
+        self.spans[name] = self.spans.get(name, 0) + duration_ns
+
+    def add_query(self, duration_ns: int) -> None:
+        self.db_ns += duration_ns
+        self.queries += 1
+
+    def elapsed_ns(self) -> int:
+        return time.perf_counter_ns() - self.start_ns
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+def bind_request_timings(timings: Optional[RequestTimings]):
+    """Bind `timings` to the current context; returns a reset token."""
+    return _current.set(timings)
+
+
+def reset_request_timings(token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block and add it to the current request's breakdown:
+
+        with span("render_pdf"):
+            ...
+    """
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter_ns() - start)
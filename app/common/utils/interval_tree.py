@@ -0,0 +1,63 @@
+"""
+Static interval tree over half-open intervals [start, end).
+
+Intervals are sorted once by start and laid out as an implicit balanced
+binary search tree (the middle element of every range is its root),
+each node augmented with the greatest end in its subtree. Building is
+O(n log n); `overlapping()` costs O((k + 1) log n) for k results,
+because subtrees that end before the query starts, or start after it
+ends, are never visited.
+
+Bounds only need to be mutually comparable (numbers, datetimes, times).
+Adjacent intervals ([9, 10) and [10, 11)) do not overlap.
+"""
+
+from typing import Any, Generic, Iterable, List, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class IntervalTree(Generic[V]):
+    __slots__ = ("_starts", "_ends", "_values", "_max_end")
+
+    def __init__(self, intervals: Iterable[Tuple[Any, Any, V]]):
+        ordered = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self._starts = [item[0] for item in ordered]
+        self._ends = [item[1] for item in ordered]
+        self._values: List[V] = [item[2] for item in ordered]
+        self._max_end: List[Any] = [None] * len(ordered)
+        if ordered:
+            self._build(0, len(ordered))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _build(self, lo: int, hi: int) -> Any:
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: Any, end: Any) -> List[V]:
+        """Values whose interval shares at least one instant with [start, end)."""
+        found: List[V] = []
+        stack = [(0, len(self._values))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            # Nothing in this subtree ends after the query starts
+            if self._max_end[mid] <= start:
+                continue
+            stack.append((lo, mid))
+            if self._starts[mid] < end:
+                if self._ends[mid] > start:
+                    found.append(self._values[mid])
+                # Right subtree starts at or after mid; only useful if mid starts early enough
+                stack.append((mid + 1, hi))
+        return found
@@ -0,0 +1,175 @@
+"""
+In-process word-prefix and trigram index over short texts (names,
+codes), for databases without pg_trgm / full-text search.
+
+Texts are lower-cased and split into words (runs of letters and
+digits), the way `to_tsvector('simple', ...)` and pg_trgm split them.
+
+- `prefix(query)`: entries where every query word starts some word of
+  the text (`'ana gar'` finds "Garcia Ana"), ordered by sort key. Each
+  word is found by bisecting the sorted vocabulary, then the posting
+  lists of the matching words are intersected, rarest first.
+- `similar(query, threshold)`: entries sharing at least `threshold` of
+  the query's trigrams (padded like pg_trgm), best first. This is an
+  approximation of `word_similarity()`: the fraction of the query's
+  trigrams found anywhere in the text.
+
+Both take `limit` and `after` (the order key of the last entry already
+seen) and then select just that page with a bounded heap instead of
+sorting every match, which is what keeps one-letter autocomplete cheap.
+
+Postings are arrays of row ordinals, so a million short texts stay in
+the low hundreds of MB. Removing an entry only tombstones its ordinal.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+import heapq
+import re
+
+K = TypeVar("K", bound=Hashable)
+
+_WORD = re.compile(r"[^\W_]+")
+# Sorts after every word that starts with a given prefix
+_PREFIX_END = "\U0010ffff"
+
+
+def _page(entries: Iterable[Tuple[Any, ...]], limit: Optional[int], after: Optional[Tuple[Any, ...]]):
+    if after is not None:
+        after = tuple(after)
+        entries = (entry for entry in entries if entry > after)
+    if limit is None:
+        return sorted(entries)
+    return heapq.nsmallest(limit, entries)
+
+
+def words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def trigrams(text: str) -> Set[str]:
+    grams: Set[str] = set()
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TextIndex(Generic[K]):
+    __slots__ = ("_keys", "_sort_keys", "_ordinals", "_dead", "_by_word", "_by_trigram", "_vocabulary")
+
+    def __init__(self) -> None:
+        self._keys: List[K] = []
+        self._sort_keys: List[Any] = []
+        self._ordinals: Dict[K, int] = {}
+        self._dead: Set[int] = set()
+        self._by_word: Dict[str, array] = {}
+        self._by_trigram: Dict[str, array] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._ordinals
+
+    # ------------------------------------------
+    # Maintenance
+    # ------------------------------------------
+    def add(self, key: K, text: str, sort_key: Any = None) -> None:
+        """Index `text` under `key`, replacing any previous text for it."""
+        self.remove(key)
+        ordinal = len(self._keys)
+        self._keys.append(key)
+        self._sort_keys.append(text.lower() if sort_key is None else sort_key)
+        self._ordinals[key] = ordinal
+
+        for word in set(words(text)):
+            posting = self._by_word.get(word)
+            if posting is None:
+                posting = self._by_word[word] = array("I")
+                self._vocabulary = None
+            posting.append(ordinal)
+        for gram in trigrams(text):
+            posting = self._by_trigram.get(gram)
+            if posting is None:
+                posting = self._by_trigram[gram] = array("I")
+            posting.append(ordinal)
+
+    def remove(self, key: K) -> None:
+        ordinal = self._ordinals.pop(key, None)
+        if ordinal is not None:
+            self._dead.add(ordinal)
+
+    # ------------------------------------------
+    # Queries
+    # ------------------------------------------
+    def prefix(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[Any, K]] = None,
+    ) -> List[Tuple[Any, K]]:
+        """(sort_key, key) of entries matching all query word prefixes, sorted."""
+        tokens = set(words(query))
+        if not tokens:
+            return []
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._by_word)
+
+        postings = []
+        for token in tokens:
+            lo = bisect_left(self._vocabulary, token)
+            hi = bisect_left(self._vocabulary, token + _PREFIX_END, lo)
+            postings.append([self._by_word[w] for w in self._vocabulary[lo:hi]])
+        postings.sort(key=lambda lists: sum(map(len, lists)))
+
+        matched: Optional[Set[int]] = None
+        for lists in postings:
+            found: Set[int] = set()
+            for posting in lists:
+                found.update(posting)
+            matched = found if matched is None else matched & found
+            if not matched:
+                return []
+        return _page(
+            ((self._sort_keys[o], self._keys[o]) for o in matched if o not in self._dead),
+            limit,
+            after,
+        )
+
+    def similar(
+        self,
+        query: str,
+        threshold: float = 0.5,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[float, Any, K]] = None,
+    ) -> List[Tuple[float, Any, K]]:
+        """
+        (score, sort_key, key) of entries scoring at least `threshold`,
+        best first (`after` is such a triple too).
+        """
+        grams = trigrams(query)
+        if not grams:
+            return []
+        counts: Counter = Counter()
+        for gram in grams:
+            posting = self._by_trigram.get(gram)
+            if posting is not None:
+                counts.update(posting)
+
+        total = len(grams)
+        needed = threshold * total
+        # Ordered by negated score so the best come first
+        found = _page(
+            (
+                (-count / total, self._sort_keys[o], self._keys[o])
+                for o, count in counts.items()
+                if count >= needed and o not in self._dead
+            ),
+            limit,
+            None if after is None else (-after[0], *after[1:]),
+        )
+        return [(-score, sort_key, key) for score, sort_key, key in found]
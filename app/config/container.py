@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict
 import logging
 
 from app.config.settings import settings
@@ -11,32 +11,40 @@ class Container:
     """
     Lightweight application container.
     Stores references to shared services and factories.
+
+    Resources are registered as factories and built on first
+    `resolve()`, so importing the app (and forking autoscaled workers)
+    does not open pools or create clients nobody has asked for yet.
     """
 
     def __init__(self):
         # core shared objects
         self.settings = settings
         self._singletons: Dict[str, Any] = {}
+        self._factories: Dict[str, Callable[[], Any]] = {}
         self._initialized = False
 
     # -------------------------
     # Bootstrapping
     # -------------------------
-    def initialize(self, *, echo: bool = False) -> None:
+    def initialize(self) -> None:
         """
-        Initialize container resources (engines, sessions, adapters).
-        Idempotent.
+        Register factories for container resources (engines, adapters).
+        Nothing is created here. Idempotent.
         """
         if self._initialized:
             return
-        # Initialize DB engines/session factories
-        db_session.init_engines(echo=echo)
-        # Store engines for convenience
-        self._singletons["async_engine"] = db_session.get_async_engine()
-        self._singletons["sync_engine"] = db_session.get_sync_engine()
-        # Could initialize other adapters here (S3 clients, payment clients...)
+        # The async engine is the only DB resource of the web process;
+        # Alembic and scripts build their own sync engines
+        self.register_factory("async_engine", db_session.get_async_engine)
+        self.register_factory("replica_set", db_session.get_replica_set)
+        # Register other adapters here (S3 clients, payment clients...)
         self._initialized = True
-        logger.info("Container initialized.")
+        logger.debug("Container initialized.")
+
+    def reset(self) -> None:
+        """Forget built instances (e.g. after engines are disposed); factories stay."""
+        self._singletons.clear()
 
     # -------------------------
     # Registration helpers
@@ -44,22 +52,29 @@ class Container:
     def register(self, name: str, instance: Any) -> None:
         self._singletons[name] = instance
 
+    def register_factory(self, name: str, factory: Callable[[], Any]) -> None:
+        """Build `name` with `factory` on first resolve() and reuse it afterwards."""
+        self._factories[name] = factory
+        self._singletons.pop(name, None)
+
     def resolve(self, name: str) -> Any:
+        self.initialize()
         try:
             return self._singletons[name]
-        except KeyError as exc:
-            raise RuntimeError(f"Dependency '{name}' not registered in container.") from exc
+        except KeyError:
+            pass
+        factory = self._factories.get(name)
+        if factory is None:
+            raise RuntimeError(f"Dependency '{name}' not registered in container.")
+        instance = self._singletons[name] = factory()
+        return instance
 
     # -------------------------
     # Convenience accessors
     # -------------------------
     @property
     def async_engine(self):
-        return self._singletons.get("async_engine")
-
-    @property
-    def sync_engine(self):
-        return self._singletons.get("sync_engine")
+        return self.resolve("async_engine")
 
 
 # Single global container instance (import this)
@@ -26,6 +26,41 @@ class Settings(BaseSettings):
     APP_ENV: str = Field(default="development")
     APP_NAME: str = Field(default="EdTech Platform API")
     APP_DEBUG: bool = Field(default=True)
+    # Emit a Server-Timing header (db/handler/serialize breakdown). Off by
+    # default: it exposes per-request timings to every client
+    SERVER_TIMING_HEADER: bool = Field(default=False)
+    # Comma-separated router names to mount (academic, financial,
+    # administrative, communication, health, metrics); empty mounts all
+    ENABLED_ROUTERS: str = Field(default="")
+
+    @property
+    def enabled_routers(self) -> list[str]:
+        return [r.strip() for r in self.ENABLED_ROUTERS.split(",") if r.strip()]
+
+    # ------------------------------------------------------------
+    # WEB SERVER (app/infrastructure/api/server.py)
+    # ------------------------------------------------------------
+    WEB_HOST: str = Field(default="0.0.0.0")
+    WEB_PORT: int = Field(default=8000)
+    # Worker processes; 0 starts one per CPU
+    WEB_WORKERS: int = Field(default=0)
+    WEB_BACKLOG: int = Field(default=2048)
+    WEB_KEEPALIVE_TIMEOUT: int = Field(default=5)        # seconds
+    # Per-worker cap on open connections/tasks before 503 (0 disables)
+    WEB_LIMIT_CONCURRENCY: int = Field(default=0)
+    # Recycle a worker after this many requests (0 disables)
+    WEB_MAX_REQUESTS: int = Field(default=0)
+    # Seconds in-flight requests get to finish on SIGTERM (0 waits forever)
+    WEB_TIMEOUT_GRACEFUL_SHUTDOWN: int = Field(default=30)
+    # Trust X-Forwarded-* from these proxy addresses (comma-separated, or
+    # "*"). Also used by the rate limiter to find the real client, so it
+    # must name the reverse proxy in front of the app (Caddy in compose).
+    WEB_PROXY_HEADERS: bool = Field(default=True)
+    WEB_FORWARDED_ALLOW_IPS: str = Field(default="127.0.0.1")
+
+    @property
+    def forwarded_allow_ips(self) -> list[str]:
+        return [ip.strip() for ip in self.WEB_FORWARDED_ALLOW_IPS.split(",") if ip.strip()]
 
     # ------------------------------------------------------------
     # DATABASE CONFIG
@@ -41,6 +76,19 @@ class Settings(BaseSettings):
     
     DB_ECHO: bool = False
 
+    # Connection pool (ignored for SQLite, which has no queue pool)
+    DB_POOL_SIZE: int = Field(default=10)
+    DB_MAX_OVERFLOW: int = Field(default=20)
+    DB_POOL_TIMEOUT: float = Field(default=30.0)    # seconds to wait for a connection
+    DB_POOL_RECYCLE: int = Field(default=1800)      # seconds; -1 disables recycling
+    # Pre-ping costs a round trip on every checkout. Recycling stale
+    # connections is usually enough; enable only behind proxies that
+    # silently drop idle connections.
+    DB_POOL_PRE_PING: bool = Field(default=False)
+    # asyncpg prepared statement cache; set to 0 behind pgbouncer
+    # in transaction pooling mode
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=500)
+
     @validator("DATABASE_URL", pre=True, always=True)
     def assemble_database_url(cls, v, values):
         """
@@ -57,6 +105,111 @@ class Settings(BaseSettings):
 
         return f"postgresql+psycopg2://{user}:{pwd}@{host}:{port}/{db}"
 
+    # ------------------------------------------------------------
+    # READ REPLICAS
+    # ------------------------------------------------------------
+    # Comma-separated SQLAlchemy URLs; empty disables replica routing
+    DATABASE_REPLICA_URLS: str = Field(default="")
+    DB_REPLICA_STRATEGY: str = Field(default="round_robin")  # or "least_connections"
+    # Eject a replica after this many consecutive connection errors...
+    DB_REPLICA_FAILURE_THRESHOLD: int = Field(default=3)
+    # ...for this many seconds before trying it again
+    DB_REPLICA_EJECT_SECONDS: float = Field(default=30.0)
+
+    @property
+    def replica_urls(self) -> list[str]:
+        return [u.strip() for u in self.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+
+    # ------------------------------------------------------------
+    # HEALTH CHECKS
+    # ------------------------------------------------------------
+    HEALTH_CHECK_INTERVAL: float = Field(default=5.0)     # seconds between DB checks
+    HEALTH_CHECK_TIMEOUT: float = Field(default=2.0)
+    # /readyz reports 503 once this fraction of the pool is checked out
+    HEALTH_POOL_SATURATION_THRESHOLD: float = Field(default=1.0)
+
+    # ------------------------------------------------------------
+    # CACHE CONFIG
+    # ------------------------------------------------------------
+    # Process-wide entity cache (read-through, LRU + TTL)
+    CACHE_TTL: int = Field(default=300)
+    CACHE_MAX_ENTRIES: int = Field(default=10_000)
+    # Shared HTTP representations (routes using @cache_control(shared=True))
+    HTTP_CACHE_MAX_ENTRIES: int = Field(default=1000)
+    HTTP_CACHE_MAX_BODY_BYTES: int = Field(default=1_048_576)
+
+    # ------------------------------------------------------------
+    # RESPONSE COMPRESSION
+    # ------------------------------------------------------------
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=500)          # bytes
+    # Bodies this large are compressed in a worker thread
+    COMPRESSION_OFFLOAD_THRESHOLD: int = Field(default=65_536)
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4)         # needs `brotli`
+    COMPRESSION_ZSTD_LEVEL: int = Field(default=3)             # needs `zstandard`
+    # Compressed variants of ETag'd responses kept in memory
+    COMPRESSION_VARIANT_CACHE_ENTRIES: int = Field(default=512)
+
+    # ------------------------------------------------------------
+    # RATE LIMITING / LOAD SHEDDING
+    # ------------------------------------------------------------
+    RATE_LIMIT_ENABLED: bool = Field(default=True)
+    # Per-client token buckets (client = X-Forwarded-For behind the proxies
+    # in WEB_FORWARDED_ALLOW_IPS); burst defaults to the per-minute limit
+    RATE_LIMIT_PER_MINUTE: int = Field(default=60)
+    RATE_LIMIT_BURST: int = Field(default=0)
+    RATE_LIMIT_PER_HOUR: int = Field(default=1000)
+    # Comma-separated path prefixes never limited or shed (health probes)
+    RATE_LIMIT_EXEMPT_PATHS: str = Field(default="/api/livez,/api/readyz,/api/health")
+    # 503 once this many requests are in flight in the process (0 disables)
+    LOAD_SHED_MAX_IN_FLIGHT: int = Field(default=512)
+    # 503 while the recent DB pool checkout wait exceeds this (seconds, 0 disables)
+    LOAD_SHED_MAX_POOL_WAIT: float = Field(default=1.0)
+
+    @property
+    def rate_limit_exempt_paths(self) -> list[str]:
+        return [p.strip() for p in self.RATE_LIMIT_EXEMPT_PATHS.split(",") if p.strip()]
+
+    # ------------------------------------------------------------
+    # ATTENDANCE INGESTION
+    # ------------------------------------------------------------
+    # Marks accepted per batch request
+    ATTENDANCE_BATCH_MAX_MARKS: int = Field(default=5000)
+    # Write-behind queue: flush after this many buffered marks or seconds
+    ATTENDANCE_FLUSH_SIZE: int = Field(default=5000)
+    ATTENDANCE_FLUSH_INTERVAL: float = Field(default=0.05)
+    # Batch requests get 503 while this many marks are waiting to be written
+    ATTENDANCE_MAX_PENDING: int = Field(default=100000)
+
+    # ------------------------------------------------------------
+    # STUDENT SEARCH
+    # ------------------------------------------------------------
+    # Results per page when the client does not ask, and the most it may ask for
+    STUDENT_SEARCH_DEFAULT_LIMIT: int = Field(default=20)
+    STUDENT_SEARCH_MAX_LIMIT: int = Field(default=100)
+
+    # ------------------------------------------------------------
+    # BILLING (invoice generation)
+    # ------------------------------------------------------------
+    # Institutions billed concurrently (each worker holds one DB connection)
+    BILLING_WORKERS: int = Field(default=4)
+    # Students invoiced per transaction / checkpoint
+    BILLING_CHUNK_SIZE: int = Field(default=2000)
+    # Seconds between progress log lines (0 disables)
+    BILLING_PROGRESS_INTERVAL: float = Field(default=10.0)
+
+    # ------------------------------------------------------------
+    # OUTBOX RELAY
+    # ------------------------------------------------------------
+    # Disable on processes that should not drain the outbox
+    OUTBOX_RELAY_ENABLED: bool = Field(default=True)
+    OUTBOX_RELAY_CONCURRENCY: int = Field(default=1)
+    OUTBOX_BATCH_SIZE: int = Field(default=100)
+    OUTBOX_POLL_INTERVAL: float = Field(default=1.0)   # seconds when idle
+    OUTBOX_MAX_ATTEMPTS: int = Field(default=10)
+    # Seconds a claimed batch stays leased before another relay may retry it
+    OUTBOX_CLAIM_TIMEOUT: float = Field(default=60.0)
+
 
 # Global settings instance (import anywhere)
 settings = Settings()
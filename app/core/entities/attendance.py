@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import Optional, Tuple
+import uuid
+
+
+class AttendanceStatus(str, Enum):
+    PRESENT = "present"
+    ABSENT = "absent"
+    LATE = "late"
+    EXCUSED = "excused"
+
+
+@dataclass(slots=True)
+class AttendanceMark:
+    """
+    One student's attendance for one class period on one day.
+
+    (student_id, session_date, period) identifies a mark; recording it
+    again replaces the stored status.
+    """
+
+    student_id: uuid.UUID
+    session_date: date
+    status: AttendanceStatus
+    period: int = 0
+    note: Optional[str] = None
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    @property
+    def key(self) -> Tuple[uuid.UUID, date, int]:
+        return (self.student_id, self.session_date, self.period)
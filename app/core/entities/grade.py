@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional, Tuple
+import uuid
+
+from app.common.exceptions import ValidationError
+
+CENT = Decimal("0.01")
+
+
+@dataclass(slots=True)
+class Grade:
+    """
+    Score obtained by a student in one assessment of a course.
+
+    (student_id, course_id, assessment) identifies a grade; saving it
+    again replaces the previous score. `weight` is the assessment's
+    share of the course average.
+    """
+
+    student_id: uuid.UUID
+    course_id: uuid.UUID
+    assessment: str
+    score: Decimal
+    max_score: Decimal = Decimal("100")
+    weight: Decimal = Decimal("1")
+    graded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    def __post_init__(self) -> None:
+        if self.max_score <= 0:
+            raise ValidationError("max_score must be positive.")
+        if not 0 <= self.score <= self.max_score:
+            raise ValidationError("score must be between 0 and max_score.")
+        if self.weight <= 0:
+            raise ValidationError("weight must be positive.")
+
+    @property
+    def key(self) -> Tuple[uuid.UUID, uuid.UUID, str]:
+        return (self.student_id, self.course_id, self.assessment)
+
+    @property
+    def percent(self) -> Decimal:
+        """Score on a 0-100 scale, rounded to cents so sums stay exact."""
+        return (self.score * 100 / self.max_score).quantize(CENT, ROUND_HALF_UP)
+
+
+@dataclass(slots=True)
+class CourseAverage:
+    """Precomputed grade summary of one student in one course."""
+
+    student_id: uuid.UUID
+    course_id: uuid.UUID
+    grade_count: int
+    weight_sum: Decimal
+    weighted_sum: Decimal
+    percent_sum: Decimal
+
+    @property
+    def average(self) -> Optional[Decimal]:
+        if not self.grade_count:
+            return None
+        return (self.percent_sum / self.grade_count).quantize(CENT, ROUND_HALF_UP)
+
+    @property
+    def weighted_average(self) -> Optional[Decimal]:
+        if not self.weight_sum:
+            return None
+        return (self.weighted_sum / self.weight_sum).quantize(CENT, ROUND_HALF_UP)
+
+
+def grade_points(percent: Decimal) -> Decimal:
+    """4.0-scale points for a 0-100 course average (A=90+, B=80+, ...)."""
+    for threshold, points in ((90, 4), (80, 3), (70, 2), (60, 1)):
+        if percent >= threshold:
+            return Decimal(points)
+    return Decimal(0)
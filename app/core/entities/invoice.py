@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+import re
+import uuid
+
+from app.common.exceptions import ValidationError
+
+_PERIOD = re.compile(r"^(\d{4})-(0[1-9]|1[0-2])$")
+
+
+def billing_period(value: str) -> date:
+    """'2026-11' -> date(2026, 11, 1); invoices are issued per calendar month."""
+    match = _PERIOD.match(value)
+    if match is None:
+        raise ValidationError("A billing period looks like 'YYYY-MM'.")
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+class InvoiceStatus(str, Enum):
+    ISSUED = "issued"
+    PAID = "paid"
+    VOID = "void"
+
+
+class BillingRunStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    # Stopped (shutdown, Ctrl-C) before finishing; resumable
+    INTERRUPTED = "interrupted"
+
+
+@dataclass(slots=True)
+class Fee:
+    """A charge billed every month to each active student of an institution."""
+
+    institution_id: uuid.UUID
+    code: str
+    description: str
+    amount: Decimal
+    active: bool = True
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    def __post_init__(self) -> None:
+        if self.amount < 0:
+            raise ValidationError("A fee amount cannot be negative.")
+
+
+@dataclass(slots=True)
+class InvoiceLine:
+    fee_id: uuid.UUID
+    description: str
+    amount: Decimal
+
+
+@dataclass(slots=True)
+class Invoice:
+    """One student's bill for one month; `total` is the sum of its lines."""
+
+    student_id: uuid.UUID
+    institution_id: uuid.UUID
+    period: date
+    total: Decimal
+    lines: List[InvoiceLine] = field(default_factory=list)
+    status: InvoiceStatus = InvoiceStatus.ISSUED
+    issued_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    billing_run_id: Optional[uuid.UUID] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+
+@dataclass(slots=True)
+class BillingProgress:
+    """Checkpoint of one institution within a billing run."""
+
+    institution_id: uuid.UUID
+    students: int
+    invoices: int = 0
+    lines: int = 0
+    last_student_id: Optional[uuid.UUID] = None
+    done: bool = False
+
+
+@dataclass(slots=True)
+class BillingRun:
+    """A (possibly resumed) invoice generation run for one month."""
+
+    period: date
+    status: BillingRunStatus = BillingRunStatus.RUNNING
+    invoices: int = 0
+    lines: int = 0
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    institutions: List[BillingProgress] = field(default_factory=list)
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
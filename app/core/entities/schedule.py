@@ -0,0 +1,127 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import uuid
+
+from app.common.exceptions import ConflictError, ValidationError
+from app.common.utils.interval_tree import IntervalTree
+
+# Resources that can only be in one place at a time
+RESOURCES = ("room", "teacher", "group")
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(slots=True)
+class ScheduleEntry:
+    """
+    A class session booked for a room, optionally with a teacher and a
+    student group, over the half-open interval [starts_at, ends_at).
+    """
+
+    room_id: uuid.UUID
+    starts_at: datetime
+    ends_at: datetime
+    teacher_id: Optional[uuid.UUID] = None
+    group_id: Optional[uuid.UUID] = None
+    course_id: Optional[uuid.UUID] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    def __post_init__(self) -> None:
+        # Compare in UTC; naive datetimes are taken to be UTC already
+        self.starts_at = _utc(self.starts_at)
+        self.ends_at = _utc(self.ends_at)
+        if self.ends_at <= self.starts_at:
+            raise ValidationError("A schedule entry must end after it starts.")
+
+    def resources(self) -> Iterator[Tuple[str, uuid.UUID]]:
+        for kind, resource_id in (
+            ("room", self.room_id),
+            ("teacher", self.teacher_id),
+            ("group", self.group_id),
+        ):
+            if resource_id is not None:
+                yield kind, resource_id
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleConflict:
+    """
+    Proposed entry `entry` (index in the proposal) overlaps another
+    proposed entry (`other_entry`) or an already scheduled one
+    (`scheduled_id`) on the same resource.
+    """
+
+    resource: str
+    resource_id: uuid.UUID
+    entry: int
+    starts_at: datetime
+    ends_at: datetime
+    other_entry: Optional[int] = None
+    scheduled_id: Optional[uuid.UUID] = None
+
+
+class ScheduleConflictError(ConflictError):
+    def __init__(self, conflicts: Sequence[ScheduleConflict], message: str = ""):
+        super().__init__(message or f"{len(conflicts)} schedule conflict(s).")
+        self.conflicts = list(conflicts)
+
+
+def find_conflicts(
+    proposed: Sequence[ScheduleEntry],
+    scheduled: Sequence[ScheduleEntry] = (),
+) -> List[ScheduleConflict]:
+    """
+    Every overlap between proposed entries, and between proposed and
+    already scheduled entries, per room/teacher/group.
+
+    Entries are bucketed by resource and each bucket gets an interval
+    tree, so a timetable of n entries is checked in O(n log n) (plus
+    the number of conflicts) rather than by comparing every pair.
+    Scheduled entries sharing an id with a proposed one are treated as
+    being replaced by it.
+    """
+    replaced = {entry.id for entry in proposed}
+    buckets: Dict[Tuple[str, uuid.UUID], List[Tuple[datetime, datetime, Union[int, ScheduleEntry]]]]
+    buckets = defaultdict(list)
+    for index, entry in enumerate(proposed):
+        for resource in entry.resources():
+            buckets[resource].append((entry.starts_at, entry.ends_at, index))
+    for entry in scheduled:
+        if entry.id in replaced:
+            continue
+        for resource in entry.resources():
+            if resource in buckets:
+                buckets[resource].append((entry.starts_at, entry.ends_at, entry))
+
+    conflicts: List[ScheduleConflict] = []
+    for (kind, resource_id), intervals in buckets.items():
+        if len(intervals) < 2:
+            continue
+        tree = IntervalTree(intervals)
+        for start, end, index in intervals:
+            if not isinstance(index, int):
+                continue
+            for other in tree.overlapping(start, end):
+                # Report each proposed pair once
+                if isinstance(other, int) and other <= index:
+                    continue
+                other_entry = proposed[other] if isinstance(other, int) else other
+                conflicts.append(
+                    ScheduleConflict(
+                        resource=kind,
+                        resource_id=resource_id,
+                        entry=index,
+                        starts_at=max(start, other_entry.starts_at),
+                        ends_at=min(end, other_entry.ends_at),
+                        other_entry=other if isinstance(other, int) else None,
+                        scheduled_id=None if isinstance(other, int) else other.id,
+                    )
+                )
+    conflicts.sort(key=lambda c: (c.entry, c.resource, c.starts_at))
+    return conflicts
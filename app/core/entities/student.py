@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from typing import Optional
+import uuid
+
+from app.common.exceptions import ValidationError
+
+
+def search_text(last_name: str, first_name: str, student_number: str) -> str:
+    """
+    Text students are searched and sorted by: "last first number",
+    lower-cased. Mirrors the `students.search_text` generated column.
+    """
+    return f"{last_name} {first_name} {student_number}".lower()
+
+
+@dataclass(slots=True)
+class Student:
+    """
+    A student enrolled at an institution. `student_number` is the
+    human-facing ID staff search by, unique across the system.
+    """
+
+    student_number: str
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    institution_id: Optional[uuid.UUID] = None
+    active: bool = True
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    def __post_init__(self) -> None:
+        self.student_number = self.student_number.strip().upper()
+        self.first_name = " ".join(self.first_name.split())
+        self.last_name = " ".join(self.last_name.split())
+        if not (self.student_number and self.first_name and self.last_name):
+            raise ValidationError("A student needs a number, a first name and a last name.")
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+    @property
+    def search_text(self) -> str:
+        return search_text(self.last_name, self.first_name, self.student_number)
@@ -0,0 +1,276 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import gzip
+import zlib
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.metrics import metrics
+from app.infrastructure.cache.backends import InMemoryCacheBackend
+
+try:  # optional: pip install ".[compression]"
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+COMPRESSED_BYTES = metrics.counter(
+    "http_compression_bytes_total",
+    "Response bytes before (in) and after (out) compression.",
+    labelnames=("encoding", "direction"),
+)
+COMPRESSION_VARIANT_CACHE = metrics.counter(
+    "http_compression_variant_cache_total",
+    "Lookups of cached compressed variants by result.",
+    labelnames=("result",),
+)
+
+# Types worth compressing; everything else (images, archives, video,
+# already-encoded payloads) is passed through untouched
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+
+
+# ---------------------------------------------------------------------
+# Encoders
+# ---------------------------------------------------------------------
+class _StreamEncoder:
+    """Incremental encoder for streaming responses."""
+
+    def __init__(self, compress: Callable[[bytes], bytes], flush: Callable[[], bytes]):
+        self.compress = compress
+        self.flush = flush
+
+
+@dataclass(frozen=True)
+class Encoding:
+    name: str
+    compress: Callable[[bytes], bytes]
+    stream: Callable[[], _StreamEncoder]
+
+
+def _gzip_encoding(level: int) -> Encoding:
+    def stream() -> _StreamEncoder:
+        obj = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+        return _StreamEncoder(obj.compress, obj.flush)
+
+    # mtime=0 makes the output deterministic, so variants can be cached
+    return Encoding("gzip", lambda body: gzip.compress(body, level, mtime=0), stream)
+
+
+def _brotli_encoding(quality: int) -> Encoding:
+    def stream() -> _StreamEncoder:
+        obj = brotli.Compressor(quality=quality)
+        return _StreamEncoder(obj.process, obj.finish)
+
+    return Encoding("br", lambda body: brotli.compress(body, quality=quality), stream)
+
+
+def _zstd_encoding(level: int) -> Encoding:
+    compressor = zstandard.ZstdCompressor(level=level)
+
+    def stream() -> _StreamEncoder:
+        obj = zstandard.ZstdCompressor(level=level).compressobj()
+        return _StreamEncoder(obj.compress, obj.flush)
+
+    return Encoding("zstd", compressor.compress, stream)
+
+
+def available_encodings(
+    gzip_level: int = 6, brotli_quality: int = 4, zstd_level: int = 3
+) -> List[Encoding]:
+    """Supported encodings in server preference order."""
+    encodings: List[Encoding] = []
+    if brotli is not None:
+        encodings.append(_brotli_encoding(brotli_quality))
+    if zstandard is not None:
+        encodings.append(_zstd_encoding(zstd_level))
+    encodings.append(_gzip_encoding(gzip_level))
+    return encodings
+
+
+def negotiate(accept_encoding: str, encodings: Sequence[Encoding]) -> Optional[Encoding]:
+    """
+    Pick the encoding with the highest q-value in Accept-Encoding;
+    ties go to server preference (order of `encodings`).
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    best: Optional[Encoding] = None
+    best_q = 0.0
+    for encoding in encodings:
+        q = weights.get(encoding.name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _resource(scope: Scope) -> Tuple[str, bytes]:
+    return scope["path"], scope.get("query_string", b"")
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(
+        ("+json", "+xml")
+    )
+
+
+# ---------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------
+class CompressionMiddleware:
+    """
+    Negotiating response compression (br, zstd, gzip).
+
+    - Skips small bodies, non-text content types and responses that
+      already carry a Content-Encoding.
+    - Bodies of `offload_threshold` bytes or more are compressed in a
+      worker thread so the event loop keeps serving other requests.
+    - Responses with an ETag (see HTTPCacheMiddleware) have their
+      compressed variants kept in a bounded LRU keyed by (path, query,
+      ETag, encoding), so unchanged representations are compressed
+      once (ETags are only unique per resource).
+      Compressed responses get a weak ETag, as the bytes differ from
+      the identity representation the tag was computed on.
+    - Streaming responses are compressed incrementally.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 500,
+        offload_threshold: int = 64 * 1024,
+        encodings: Optional[Sequence[Encoding]] = None,
+        variant_cache_entries: int = 512,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_threshold = offload_threshold
+        self.encodings = list(encodings) if encodings is not None else available_encodings()
+        self.variants = InMemoryCacheBackend(max_entries=variant_cache_entries, default_ttl=None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        streamer: Optional[_StreamEncoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, streamer, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if "content-encoding" in headers or not _compressible(headers):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if streamer is None and start_message is not None:
+                # First body chunk decides between buffered and streaming mode
+                initial, start_message = start_message, None
+                headers = MutableHeaders(scope=initial)
+                if not more_body:
+                    if len(body) < self.minimum_size:
+                        passthrough = True
+                        await send(initial)
+                        await send(message)
+                        return
+                    compressed = await self._compress(
+                        body, encoding, headers.get("etag"), _resource(scope)
+                    )
+                    self._set_headers(headers, encoding, len(compressed))
+                    await send(initial)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                streamer = encoding.stream()
+                self._set_headers(headers, encoding, None)
+                await send(initial)
+
+            chunk = streamer.compress(body)
+            if not more_body:
+                chunk += streamer.flush()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _compress(
+        self,
+        body: bytes,
+        encoding: Encoding,
+        etag: Optional[str],
+        resource: Tuple[str, bytes],
+    ) -> bytes:
+        key = (*resource, etag, encoding.name) if etag and not etag.startswith("W/") else None
+        if key is not None:
+            cached = self.variants.get_nowait(key)
+            if cached is not None:
+                COMPRESSION_VARIANT_CACHE.inc(result="hit")
+                return cached
+            COMPRESSION_VARIANT_CACHE.inc(result="miss")
+
+        if len(body) >= self.offload_threshold:
+            compressed = await anyio.to_thread.run_sync(encoding.compress, body)
+        else:
+            compressed = encoding.compress(body)
+
+        COMPRESSED_BYTES.inc(len(body), encoding=encoding.name, direction="in")
+        COMPRESSED_BYTES.inc(len(compressed), encoding=encoding.name, direction="out")
+        if key is not None:
+            self.variants.set_nowait(key, compressed)
+        return compressed
+
+    @staticmethod
+    def _set_headers(headers: MutableHeaders, encoding: Encoding, length: Optional[int]) -> None:
+        headers["content-encoding"] = encoding.name
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = "W/" + etag
+        if length is None:
+            del headers["content-length"]
+        else:
+            headers["content-length"] = str(length)
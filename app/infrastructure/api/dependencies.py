@@ -1,7 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.kernel.data_loader import DataLoaderRegistry
+from app.infrastructure.cache.cached_repository import IdentityMap
 from app.infrastructure.database.session import get_async_session
+from app.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 from app.config.container import container
 
 
@@ -13,6 +16,39 @@ async def get_db_session() -> AsyncSession:
         yield session
 
 
+async def get_unit_of_work(
+    session: AsyncSession = Depends(get_db_session),
+) -> SQLAlchemyUnitOfWork:
+    """
+    Provides a request-scoped unit of work over the request session:
+
+        use_case.unit_of_work = uow
+        result = await use_case.execute(data)   # one commit
+    """
+    return SQLAlchemyUnitOfWork(session=session)
+
+
+def get_data_loaders() -> DataLoaderRegistry:
+    """
+    Provides a request-scoped DataLoader registry.
+    FastAPI caches dependencies per request, so every endpoint and
+    sub-dependency in one request shares the same loaders:
+
+        loader = loaders.for_repository(student_repo)
+        students = await loader.load_many(student_ids)
+    """
+    return DataLoaderRegistry()
+
+
+def get_identity_map() -> IdentityMap:
+    """
+    Provides a request-scoped identity map for CachedRepository:
+
+        repo = CachedRepository(InstitutionRepository(session), identity_map=identity_map)
+    """
+    return IdentityMap()
+
+
 def get_container():
     """
     Provides the global DI container instance.
@@ -0,0 +1,350 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.metrics import metrics
+from app.config.settings import settings
+from app.infrastructure.cache.backends import InMemoryCacheBackend
+
+HTTP_CACHE_REQUESTS = metrics.counter(
+    "http_cache_requests_total",
+    "Cacheable requests by result (hit, not_modified, miss).",
+    labelnames=("result",),
+)
+
+_CREDENTIAL_HEADERS = ("authorization", "cookie")
+# Recomputed for every reply from the store
+_PER_RESPONSE_HEADERS = frozenset((b"content-length", b"etag", b"cache-control", b"age"))
+
+
+# ---------------------------------------------------------------------
+# Per-route policy
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class CachePolicy:
+    max_age: int = 0
+    # Store the representation in the process-wide cache and serve later
+    # requests from it; leave False for per-user responses
+    shared: bool = False
+    vary: Tuple[str, ...] = ()
+
+    @property
+    def cache_control(self) -> bytes:
+        scope = "public" if self.shared else "private"
+        return f"{scope}, max-age={self.max_age}".encode("latin-1")
+
+
+def cache_control(max_age: int = 0, *, shared: bool = False, vary: Sequence[str] = ()):
+    """
+    Opt a GET route into HTTP caching:
+
+        @router.get("/schedules/{group_id}")
+        @cache_control(max_age=60, shared=True)
+        async def get_schedule(group_id: UUID): ...
+
+    The response gets a strong ETag (unless the handler set one) and a
+    Cache-Control header; matching If-None-Match requests get a 304.
+    With `shared=True` the representation is also kept for `max_age`
+    seconds and replayed without running the handler.
+    """
+    policy = CachePolicy(
+        max_age=max_age, shared=shared, vary=tuple(h.lower() for h in vary)
+    )
+
+    def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        endpoint.__http_cache__ = policy
+        return endpoint
+
+    return decorator
+
+
+# ---------------------------------------------------------------------
+# ETag helpers
+# ---------------------------------------------------------------------
+def etag_for_body(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_from_timestamps(*parts: Any) -> str:
+    """
+    Strong ETag from row versions (ids and `updated_at` values of
+    TimestampMixin rows, a max(updated_at) and a count, ...). Cheap to
+    compute before loading or serializing anything.
+    """
+    raw = "|".join(
+        p.isoformat() if hasattr(p, "isoformat") else str(p) for p in parts
+    )
+    return etag_for_body(raw.encode())
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match evaluation (weak comparison, RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(tag) == target for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, etag: str, policy: Optional[CachePolicy] = None) -> Optional[Response]:
+    """
+    Early 304 for handlers that can compute an ETag cheaply:
+
+        etag = etag_from_timestamps(await repo.last_updated_at(group_id))
+        if (response := not_modified(request, etag)) is not None:
+            return response
+    """
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    headers = {"etag": etag}
+    if policy is not None:
+        headers["cache-control"] = policy.cache_control.decode("latin-1")
+    return Response(status_code=304, headers=headers)
+
+
+# ---------------------------------------------------------------------
+# Representation store
+# ---------------------------------------------------------------------
+@dataclass
+class CachedRepresentation:
+    etag: str
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    policy: CachePolicy
+    vary_values: Tuple[Optional[str], ...]
+    stored_at: float = field(default_factory=time.monotonic)
+
+
+class HTTPResponseCache:
+    """Bounded LRU of shared representations, keyed by path and query."""
+
+    def __init__(self, max_entries: int = 1000, max_body_bytes: int = 1_048_576):
+        self.max_body_bytes = max_body_bytes
+        self._store = InMemoryCacheBackend(max_entries=max_entries, default_ttl=None)
+
+    @property
+    def stats(self):
+        return self._store.stats
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[CachedRepresentation]:
+        return self._store.get_nowait(key)
+
+    def put(self, key: Tuple[str, bytes], representation: CachedRepresentation) -> None:
+        if len(representation.body) <= self.max_body_bytes:
+            self._store.set_nowait(key, representation, ttl=representation.policy.max_age)
+
+    def invalidate(self, path_prefix: str = "") -> int:
+        """Drop stored representations whose path starts with `path_prefix`."""
+        keys = [k for k in self._store.keys() if k[0].startswith(path_prefix)]
+        for key in keys:
+            self._store.delete_nowait(key)
+        return len(keys)
+
+
+# ---------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------
+def _route_policy(scope: Scope) -> Optional[CachePolicy]:
+    route = scope.get("route")
+    endpoint = getattr(route, "endpoint", None)
+    return getattr(endpoint, "__http_cache__", None)
+
+
+def _vary_values(headers: Headers, names: Iterable[str]) -> Tuple[Optional[str], ...]:
+    return tuple(headers.get(name) for name in names)
+
+
+def _shareable(headers: Headers, policy: CachePolicy) -> bool:
+    """Requests carrying credentials never read or fill the shared store
+    unless the policy varies on those headers."""
+    return not any(h in headers and h not in policy.vary for h in _CREDENTIAL_HEADERS)
+
+
+class HTTPCacheMiddleware:
+    """
+    Conditional requests and response caching for routes decorated
+    with @cache_control.
+
+    - Adds ETag (hash of the body unless the handler set one) and
+      Cache-Control, and turns matching If-None-Match requests into 304.
+    - For shared policies the representation is kept in a bounded LRU
+      for `max_age` seconds; later requests are answered from it (or
+      with a 304) without running the handler or serializing again.
+
+    Sits inside CompressionMiddleware, which keys its cache of
+    compressed variants on the ETag set here.
+    """
+
+    def __init__(self, app: ASGIApp, cache: Optional[HTTPResponseCache] = None) -> None:
+        self.app = app
+        self.cache = cache or HTTPResponseCache()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        key = (scope["path"], scope.get("query_string", b""))
+
+        cached = self.cache.get(key)
+        if cached is not None and self._usable(cached, request_headers):
+            await self._replay(cached, request_headers, scope, send)
+            return
+
+        await self._call_app(scope, receive, send, request_headers, key)
+
+    # -------------------------
+    # Cache hit
+    # -------------------------
+    @staticmethod
+    def _usable(cached: CachedRepresentation, headers: Headers) -> bool:
+        return (
+            cached.vary_values == _vary_values(headers, cached.policy.vary)
+            and _shareable(headers, cached.policy)
+        )
+
+    async def _replay(
+        self, cached: CachedRepresentation, headers: Headers, scope: Scope, send: Send
+    ) -> None:
+        age = str(int(time.monotonic() - cached.stored_at)).encode()
+        if etag_matches(headers.get("if-none-match"), cached.etag):
+            HTTP_CACHE_REQUESTS.inc(result="not_modified")
+            await self._send_not_modified(send, cached.etag, cached.policy, [(b"age", age)])
+            return
+
+        HTTP_CACHE_REQUESTS.inc(result="hit")
+        body = cached.body
+        response_headers = list(cached.headers) + [
+            (b"content-length", str(len(body)).encode()),
+            (b"etag", cached.etag.encode()),
+            (b"cache-control", cached.policy.cache_control),
+            (b"age", age),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": response_headers})
+        await send({
+            "type": "http.response.body",
+            "body": b"" if scope["method"] == "HEAD" else body,
+        })
+
+    @staticmethod
+    async def _send_not_modified(
+        send: Send, etag: str, policy: CachePolicy, extra: Sequence[Tuple[bytes, bytes]] = ()
+    ) -> None:
+        headers = [(b"etag", etag.encode()), (b"cache-control", policy.cache_control), *extra]
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    # -------------------------
+    # Cache miss
+    # -------------------------
+    async def _call_app(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        request_headers: Headers,
+        key: Tuple[str, bytes],
+    ) -> None:
+        start_message: Optional[Message] = None
+        policy: Optional[CachePolicy] = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, policy, passthrough
+            if message["type"] == "http.response.start":
+                policy = _route_policy(scope)
+                headers = Headers(raw=message.get("headers", []))
+                if policy is None or message["status"] not in (200, 304) or "content-encoding" in headers:
+                    passthrough = True
+                    await send(message)
+                elif message["status"] == 304:
+                    passthrough = True
+                    MutableHeaders(scope=message)["cache-control"] = policy.cache_control.decode()
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._finish(
+                start_message, b"".join(chunks), policy, scope, send, request_headers, key
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _finish(
+        self,
+        start_message: Message,
+        body: bytes,
+        policy: CachePolicy,
+        scope: Scope,
+        send: Send,
+        request_headers: Headers,
+        key: Tuple[str, bytes],
+    ) -> None:
+        headers = MutableHeaders(scope=start_message)
+        etag = headers.get("etag") or etag_for_body(body)
+        if policy.vary:
+            headers.add_vary_header(", ".join(policy.vary))
+
+        if policy.shared and policy.max_age > 0 and _shareable(request_headers, policy):
+            self.cache.put(key, CachedRepresentation(
+                etag=etag,
+                headers=[(k, v) for k, v in headers.raw if k not in _PER_RESPONSE_HEADERS],
+                body=body,
+                policy=policy,
+                vary_values=_vary_values(request_headers, policy.vary),
+            ))
+
+        HTTP_CACHE_REQUESTS.inc(result="miss")
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            await self._send_not_modified(send, etag, policy)
+            return
+
+        headers["etag"] = etag
+        headers["cache-control"] = policy.cache_control.decode()
+        headers["content-length"] = str(len(body))
+
+        await send(start_message)
+        await send({
+            "type": "http.response.body",
+            "body": b"" if scope["method"] == "HEAD" else body,
+        })
+
+
+# ---------------------------------------------------------------------
+# PROCESS-WIDE STORE
+# ---------------------------------------------------------------------
+_HTTP_CACHE: HTTPResponseCache | None = None
+
+
+def get_http_cache() -> HTTPResponseCache:
+    """Lazy-initialize the process-wide representation store."""
+    global _HTTP_CACHE
+
+    if _HTTP_CACHE is None:
+        _HTTP_CACHE = HTTPResponseCache(
+            max_entries=settings.HTTP_CACHE_MAX_ENTRIES,
+            max_body_bytes=settings.HTTP_CACHE_MAX_BODY_BYTES,
+        )
+    return _HTTP_CACHE
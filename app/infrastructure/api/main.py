@@ -1,22 +1,68 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from typing import List, Tuple
+import importlib
 import logging
 
+from app.common.events import event_bus
+from app.config.container import container
 from app.config.settings import settings
+from app.infrastructure.api.compression import CompressionMiddleware, available_encodings
+from app.infrastructure.api.http_cache import HTTPCacheMiddleware, get_http_cache
+from app.infrastructure.api.middleware import (
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+from app.infrastructure.api.rate_limit import (
+    LoadShedder,
+    RateLimit,
+    RateLimitMiddleware,
+    forwarded_client_key,
+)
+from app.infrastructure.api.responses import FastJSONResponse
+from app.infrastructure.api.timing import (
+    ServerTimingMiddleware,
+    instrument_route_handlers,
+)
 from app.infrastructure.database import session as db_session
+from app.infrastructure.database.batch_writer import stop_batch_writers
+from app.infrastructure.database.health import get_health_monitor
+from app.infrastructure.database.outbox import get_outbox_relay
 
-# Import routers (these files may be placeholders initially)
-from app.infrastructure.api.routers import (
-    academic_router,
-    financial_router,
-    administrative_router,
-    communication_router,
-    health as health_router,
-)
 
 logger = logging.getLogger(__name__)
 
+# (name, module, prefix, tags). Modules are imported only for enabled
+# routers (settings.ENABLED_ROUTERS), so a worker serving one domain
+# does not pay for importing the others. Each module exposes `router`.
+ROUTERS: List[Tuple[str, str, str, List[str]]] = [
+    ("academic", "app.infrastructure.api.routers.academic_router", "/api/academic", ["academic"]),
+    ("financial", "app.infrastructure.api.routers.financial_router", "/api/financial", ["financial"]),
+    ("administrative", "app.infrastructure.api.routers.administrative_router", "/api/admin", ["administrative"]),
+    ("communication", "app.infrastructure.api.routers.communication_router", "/api/communication", ["communication"]),
+    ("health", "app.infrastructure.api.routers.health", "/api", ["health"]),
+    # Internal endpoints (metrics) live outside /api; the Caddyfile blocks them
+    ("metrics", "app.infrastructure.api.routers.metrics", "/internal", ["internal"]),
+]
+
+
+def include_routers(app: FastAPI) -> None:
+    """
+    Import and mount the enabled routers. Import errors propagate, so a
+    broken router fails startup instead of leaving its routes 404.
+    """
+    enabled = set(settings.enabled_routers)
+    for name, module_path, prefix, tags in ROUTERS:
+        if enabled and name not in enabled:
+            continue
+        module = importlib.import_module(module_path)
+        router = getattr(module, "router", None)
+        if router is None:
+            # Placeholder slice module without endpoints yet
+            logger.debug("%s router not yet available", name.capitalize())
+            continue
+        app.include_router(router, prefix=prefix, tags=tags)
+
 
 def create_app() -> FastAPI:
     """
@@ -26,12 +72,26 @@ def create_app() -> FastAPI:
         title=settings.APP_NAME,
         debug=settings.APP_DEBUG,
         version="0.1.0",
+        default_response_class=FastJSONResponse,
     )
 
     # --------------------------------------------------------
     # Middleware
     # --------------------------------------------------------
-    app.add_middleware(GZipMiddleware, minimum_size=500)
+    # Innermost: ETag/304 and shared representations for @cache_control routes
+    app.add_middleware(HTTPCacheMiddleware, cache=get_http_cache())
+    # br/zstd/gzip negotiation; large bodies are compressed off the event loop
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        offload_threshold=settings.COMPRESSION_OFFLOAD_THRESHOLD,
+        encodings=available_encodings(
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+            zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+        ),
+        variant_cache_entries=settings.COMPRESSION_VARIANT_CACHE_ENTRIES,
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"] if settings.APP_DEBUG else [],  # restrict in prod
@@ -39,36 +99,34 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(ServerTimingMiddleware, emit_header=settings.SERVER_TIMING_HEADER)
+    if settings.RATE_LIMIT_ENABLED:
+        # Reject bursts and overload before any routing or DB work
+        app.add_middleware(
+            RateLimitMiddleware,
+            limits=[
+                RateLimit.per_minute(settings.RATE_LIMIT_PER_MINUTE, settings.RATE_LIMIT_BURST or None),
+                RateLimit.per_hour(settings.RATE_LIMIT_PER_HOUR),
+            ],
+            shedder=LoadShedder(
+                max_in_flight=settings.LOAD_SHED_MAX_IN_FLIGHT,
+                max_pool_wait=settings.LOAD_SHED_MAX_POOL_WAIT,
+            ),
+            key_func=forwarded_client_key(settings.forwarded_allow_ips),
+            exempt_paths=settings.rate_limit_exempt_paths,
+        )
+    # Outermost, so the logged duration covers the whole stack
+    app.add_middleware(RequestLoggingMiddleware)
 
     # --------------------------------------------------------
     # Routers: keep slice routers small and imported from slice api/router modules
     # Each file should expose `router` (fastapi.APIRouter)
     # --------------------------------------------------------
-    # We register a top-level prefix per high-level domain
-    try:
-        app.include_router(academic_router.router, prefix="/api/academic", tags=["academic"])
-    except Exception as exc:
-        logger.debug("Academic router not yet available: %s", exc)
-
-    try:
-        app.include_router(financial_router.router, prefix="/api/financial", tags=["financial"])
-    except Exception as exc:
-        logger.debug("Financial router not yet available: %s", exc)
-
-    try:
-        app.include_router(administrative_router.router, prefix="/api/admin", tags=["administrative"])
-    except Exception as exc:
-        logger.debug("Admin router not yet available: %s", exc)
-
-    try:
-        app.include_router(communication_router.router, prefix="/api/communication", tags=["communication"])
-    except Exception as exc:
-        logger.debug("Communication router not yet available: %s", exc)
-
-    try:
-        app.include_router(health_router.router, prefix="/api", tags=["health"])
-    except Exception as exc:
-        logger.debug("Health router not available: %s", exc)
+    include_routers(app)
+
+    # Record per-route handler time for the Server-Timing breakdown
+    instrument_route_handlers(app.routes)
 
     # --------------------------------------------------------
     # Startup / Shutdown events
@@ -79,14 +137,29 @@ def create_app() -> FastAPI:
         from app.infrastructure.database.session import get_async_engine
         get_async_engine()
         logger.info("Engines initialized.")
+        # Background readiness check backing /api/readyz
+        get_health_monitor().start()
+        # Workers delivering domain events off the request path
+        await event_bus.start()
+        if settings.OUTBOX_RELAY_ENABLED:
+            get_outbox_relay().start()
 
     @app.on_event("shutdown")
     async def on_shutdown():
-        # Properly dispose async engine to close connection pool
+        await get_health_monitor().stop()
+        await get_outbox_relay().stop()
+        # Deliver queued events before the pools go away
+        await event_bus.stop(drain=True)
+        # Write buffered rows (attendance marks, ...) while the pool is up
+        await stop_batch_writers()
+        # Billing runs stop at their last checkpoint and resume on the next start
+        from app.infrastructure.database.billing import stop_billing_runs
+        await stop_billing_runs()
+        # Properly dispose async engines to close connection pools
         try:
-            engine = db_session.get_async_engine()
-            await engine.dispose()
-            logger.info("Async engine disposed.")
+            await db_session.dispose_engines()
+            container.reset()
+            logger.info("Async engines disposed.")
         except Exception as exc:
             logger.debug("Error disposing engine: %s", exc)
 
@@ -0,0 +1,287 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple
+import ipaddress
+import math
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.common.metrics import metrics
+from app.infrastructure.database import session as db_session
+
+RATE_LIMITED = metrics.counter(
+    "http_rate_limited_total",
+    "Requests rejected with 429 by the token bucket.",
+    labelnames=("limit",),
+)
+LOAD_SHED = metrics.counter(
+    "http_load_shed_total",
+    "Requests rejected with 503 by load shedding.",
+    labelnames=("reason",),
+)
+IN_FLIGHT = metrics.gauge("http_requests_in_flight", "HTTP requests being processed.")
+
+
+# ---------------------------------------------------------------------
+# Limits
+# ---------------------------------------------------------------------
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: `capacity` tokens, refilled at `rate` tokens/second."""
+
+    name: str
+    rate: float
+    capacity: float
+
+    @classmethod
+    def per_minute(cls, limit: int, burst: Optional[int] = None, name: str = "minute") -> "RateLimit":
+        return cls(name, limit / 60.0, float(burst or limit))
+
+    @classmethod
+    def per_hour(cls, limit: int, burst: Optional[int] = None, name: str = "hour") -> "RateLimit":
+        return cls(name, limit / 3600.0, float(burst or limit))
+
+
+def rate_limit(per_minute: int, *, burst: Optional[int] = None):
+    """
+    Per-route limit applied on top of the per-client defaults:
+
+        @router.post("/reports")
+        @rate_limit(per_minute=5, burst=2)
+        async def generate_report(...): ...
+    """
+    limit = RateLimit.per_minute(per_minute, burst, name="route")
+
+    def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        endpoint.__rate_limit__ = limit
+        return endpoint
+
+    return decorator
+
+
+# ---------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------
+@dataclass
+class BucketState:
+    allowed: bool
+    remaining: float
+    retry_after: float
+
+
+class RateLimitBackend(ABC):
+    """
+    Token bucket storage. The in-memory backend limits per process; a
+    shared implementation (e.g. Redis with an atomic script) limits
+    across workers and hosts.
+    """
+
+    @abstractmethod
+    async def consume(self, key: Hashable, limit: RateLimit, cost: float = 1.0) -> BucketState:
+        raise NotImplementedError
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Buckets in an LRU bounded to `max_keys`; idle buckets are evicted first."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at)
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+
+    def consume_nowait(self, key: Hashable, limit: RateLimit, cost: float = 1.0) -> BucketState:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (limit.capacity, now))
+        tokens = min(limit.capacity, tokens + (now - updated_at) * limit.rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        retry_after = 0.0 if allowed else (cost - tokens) / limit.rate
+        return BucketState(allowed, tokens, retry_after)
+
+    async def consume(self, key: Hashable, limit: RateLimit, cost: float = 1.0) -> BucketState:
+        return self.consume_nowait(key, limit, cost)
+
+
+# ---------------------------------------------------------------------
+# Load shedding
+# ---------------------------------------------------------------------
+class LoadShedder:
+    """
+    Rejects new work while the process is overloaded: too many requests
+    in flight, or connections taking too long to come out of the DB pool.
+    A threshold of 0 disables that check.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 0,
+        max_pool_wait: float = 0.0,
+        pool_wait_getter: Callable[[], float] = db_session.primary_pool_wait,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_pool_wait = max_pool_wait
+        self.pool_wait_getter = pool_wait_getter
+        self.in_flight = 0
+
+    def overloaded(self) -> Optional[str]:
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return "in_flight"
+        if self.max_pool_wait and self.pool_wait_getter() >= self.max_pool_wait:
+            return "db_pool_wait"
+        return None
+
+
+# ---------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------
+def client_key(scope: Scope) -> str:
+    """Client address (uvicorn resolves it from X-Forwarded-For with --proxy-headers)."""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _in_networks(host: str, networks) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in networks)
+
+
+def forwarded_client_key(trusted_proxies: Iterable[str]) -> Callable[[Scope], str]:
+    """
+    Key on the real client behind reverse proxies: when the peer is one
+    of `trusted_proxies` (addresses or CIDRs, "*" for any), the client
+    is the right-most X-Forwarded-For address that is not itself a
+    trusted proxy. Otherwise the peer address is the client, as in
+    client_key().
+
+    Without this, every request relayed by a proxy the server does not
+    trust shares the proxy's address and a single bucket.
+    """
+    trusted = [p.strip() for p in trusted_proxies if p.strip()]
+    trust_all = "*" in trusted
+    networks = [ipaddress.ip_network(p, strict=False) for p in trusted if p != "*"]
+
+    def is_trusted(host: str) -> bool:
+        return trust_all or _in_networks(host, networks)
+
+    def key(scope: Scope) -> str:
+        peer = client_key(scope)
+        if not is_trusted(peer):
+            return peer
+        forwarded = [
+            value.decode("latin-1")
+            for name, value in scope.get("headers", ())
+            if name == b"x-forwarded-for"
+        ]
+        hosts = [h.strip() for h in ",".join(forwarded).split(",") if h.strip()]
+        for host in reversed(hosts):
+            if not is_trusted(host):
+                return host
+        return hosts[0] if hosts else peer
+
+    return key
+
+
+def _route_for(scope: Scope) -> Optional[Any]:
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route
+    return None
+
+
+async def _reject(send: Send, status: int, detail: str, retry_after: float, extra=()) -> None:
+    body = ('{"detail":"%s"}' % detail).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+        (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        *extra,
+    ]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class RateLimitMiddleware:
+    """
+    Token-bucket rate limiting per client (and per client and route for
+    routes decorated with @rate_limit), plus adaptive load shedding.
+
+    Over-limit requests get 429 and overloaded moments get 503, both
+    with Retry-After, before any routing, DB or serialization work is
+    done. Paths starting with one of `exempt_paths` (probes, metrics)
+    are never limited or shed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limits: Sequence[RateLimit] = (),
+        backend: Optional[RateLimitBackend] = None,
+        shedder: Optional[LoadShedder] = None,
+        key_func: Callable[[Scope], str] = client_key,
+        exempt_paths: Sequence[str] = (),
+        shed_retry_after: float = 1.0,
+    ) -> None:
+        self.app = app
+        self.limits = list(limits)
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.shedder = shedder or LoadShedder()
+        self.key_func = key_func
+        self.exempt_paths = tuple(exempt_paths)
+        self.shed_retry_after = shed_retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"  # CORS preflights
+            or scope["path"].startswith(self.exempt_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        reason = self.shedder.overloaded()
+        if reason is not None:
+            LOAD_SHED.inc(reason=reason)
+            await _reject(send, 503, "Service overloaded, retry later.", self.shed_retry_after)
+            return
+
+        client = self.key_func(scope)
+        checks: List[Tuple[Hashable, RateLimit]] = [((client, l.name), l) for l in self.limits]
+        route = _route_for(scope)
+        route_limit = getattr(getattr(route, "endpoint", None), "__rate_limit__", None)
+        if route_limit is not None:
+            checks.append(((client, scope["method"], route.path), route_limit))
+
+        for key, limit in checks:
+            state = await self.backend.consume(key, limit)
+            if not state.allowed:
+                RATE_LIMITED.inc(limit=limit.name)
+                await _reject(
+                    send, 429, "Too many requests.", state.retry_after,
+                    extra=[(b"x-ratelimit-limit", str(int(limit.capacity)).encode())],
+                )
+                return
+
+        self.shedder.in_flight += 1
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.shedder.in_flight -= 1
+            IN_FLIGHT.dec()
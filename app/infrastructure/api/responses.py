@@ -0,0 +1,47 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from app.common.dto import BaseDTO
+
+
+def _orjson_default(value: Any) -> Any:
+    """Types orjson does not serialize natively."""
+    if isinstance(value, Decimal):
+        # As a string, like pydantic renders Decimal fields: exact for money
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Default JSON response class.
+
+    - DTOs and homogeneous lists of DTOs are rendered directly by
+      pydantic-core (no model_dump() dict, no jsonable_encoder pass).
+    - Everything else is rendered with orjson.
+
+    Endpoints that return `FastJSONResponse(dtos)` themselves bypass
+    FastAPI's jsonable_encoder step entirely, which matters for large
+    list endpoints.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        if isinstance(content, list) and content and isinstance(content[0], BaseDTO):
+            dto_cls = type(content[0])
+            if all(type(item) is dto_cls for item in content):
+                return dto_cls.list_to_json_bytes(content)
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
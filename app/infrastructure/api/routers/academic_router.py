@@ -0,0 +1,185 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+import asyncio
+import uuid
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.dto import BaseDTO
+from app.common.exceptions import AppError, translate_exception
+from app.config.settings import settings
+from app.core.entities.attendance import AttendanceMark, AttendanceStatus
+from app.core.entities.grade import Grade, grade_points
+from app.infrastructure.api.dependencies import get_unit_of_work
+from app.infrastructure.api.http_cache import cache_control
+from app.infrastructure.api.request_body import parse_body
+from app.infrastructure.api.responses import FastJSONResponse
+from app.infrastructure.database.batch_writer import BatchWriter
+from app.infrastructure.database.repositories.attendance_repository import (
+    get_attendance_writer,
+)
+from app.infrastructure.database.repositories.grade_repository import GradeRepository
+from app.infrastructure.database.session import get_read_session
+from app.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+router = APIRouter()
+
+
+# ------------------------------------------------------------
+# Attendance
+# ------------------------------------------------------------
+class AttendanceMarkDTO(BaseDTO):
+    student_id: uuid.UUID
+    session_date: date
+    status: AttendanceStatus
+    period: int = Field(default=0, ge=0, le=32)
+    note: Optional[str] = Field(default=None, max_length=255)
+
+    def to_entity(self) -> AttendanceMark:
+        return AttendanceMark(
+            student_id=self.student_id,
+            session_date=self.session_date,
+            status=self.status,
+            period=self.period,
+            note=self.note,
+        )
+
+
+class AttendanceBatchDTO(BaseDTO):
+    marks: List[AttendanceMarkDTO] = Field(
+        min_length=1, max_length=settings.ATTENDANCE_BATCH_MAX_MARKS
+    )
+
+
+@router.post("/attendance/batch", status_code=status.HTTP_202_ACCEPTED)
+async def record_attendance_batch(
+    request: Request,
+    wait: bool = Query(default=False, description="Respond only once the marks are stored."),
+    writer: BatchWriter[AttendanceMark] = Depends(get_attendance_writer),
+):
+    """
+    Record up to ATTENDANCE_BATCH_MAX_MARKS marks in one request.
+
+    Body: {"marks": [{"student_id", "session_date", "status",
+    "period"?, "note"?}, ...]}. A mark for an existing (student,
+    session_date, period) replaces it.
+
+    The raw body is validated in a single pydantic-core pass (no
+    intermediate dict) and the whole batch is rejected on any error.
+    Valid marks go to the write-behind queue, which retries failed
+    flushes, and the response is 202; with `?wait=true` it is 200 once
+    they are committed, or the error of the failed flush attempt.
+    """
+    batch = await parse_body(request, AttendanceBatchDTO)
+    marks = [dto.to_entity() for dto in batch.marks]
+    try:
+        stored = writer.submit(marks)
+        if wait:
+            # Shared by every request in the flush; never cancel it
+            await asyncio.shield(stored)
+    except AppError as exc:
+        raise translate_exception(exc) from exc
+
+    body = {"accepted": len(marks), "stored": wait}
+    return FastJSONResponse(
+        body, status_code=status.HTTP_200_OK if wait else status.HTTP_202_ACCEPTED
+    )
+
+
+# ------------------------------------------------------------
+# Grades
+# ------------------------------------------------------------
+class GradeDTO(BaseDTO):
+    student_id: uuid.UUID
+    course_id: uuid.UUID
+    assessment: str = Field(min_length=1, max_length=100)
+    score: Decimal = Field(ge=0, max_digits=8, decimal_places=2)
+    max_score: Decimal = Field(default=Decimal("100"), gt=0, max_digits=8, decimal_places=2)
+    weight: Decimal = Field(default=Decimal("1"), gt=0, max_digits=8, decimal_places=2)
+    graded_at: Optional[datetime] = None
+
+    def to_entity(self) -> Grade:
+        grade = Grade(
+            student_id=self.student_id,
+            course_id=self.course_id,
+            assessment=self.assessment,
+            score=self.score,
+            max_score=self.max_score,
+            weight=self.weight,
+        )
+        if self.graded_at is not None:
+            grade.graded_at = self.graded_at
+        return grade
+
+
+class GradeBatchDTO(BaseDTO):
+    grades: List[GradeDTO] = Field(min_length=1, max_length=1000)
+
+
+class CourseAverageDTO(BaseDTO):
+    course_id: uuid.UUID
+    grade_count: int
+    average: Decimal
+    weighted_average: Decimal
+    grade_points: Decimal
+
+
+class ReportCardDTO(BaseDTO):
+    student_id: uuid.UUID
+    gpa: Optional[Decimal]
+    courses: List[CourseAverageDTO]
+
+
+@router.post("/grades", status_code=status.HTTP_201_CREATED)
+async def record_grades(
+    request: Request,
+    uow: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
+):
+    """
+    Record (or re-grade) up to 1000 assessment scores. The affected
+    per-course aggregates are updated in the same transaction.
+    """
+    batch = await parse_body(request, GradeBatchDTO)
+    try:
+        grades = [dto.to_entity() for dto in batch.grades]
+        async with uow:
+            saved = await uow.repository(GradeRepository).save_grades(grades)
+    except AppError as exc:
+        raise translate_exception(exc) from exc
+    return FastJSONResponse(
+        {"saved": len(saved), "ids": [str(g.id) for g in saved]},
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get("/students/{student_id}/report-card")
+@cache_control(max_age=0)
+async def report_card(
+    student_id: uuid.UUID,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Per-course averages and GPA of a student, read from the
+    precomputed aggregates: one row per course, whatever the number
+    of grades behind it.
+    """
+    averages = await GradeRepository(session).course_averages(student_id)
+    courses = [
+        CourseAverageDTO(
+            course_id=a.course_id,
+            grade_count=a.grade_count,
+            average=a.average,
+            weighted_average=a.weighted_average,
+            grade_points=grade_points(a.weighted_average),
+        )
+        for a in averages
+    ]
+    gpa = (
+        (sum(c.grade_points for c in courses) / len(courses)).quantize(Decimal("0.01"))
+        if courses
+        else None
+    )
+    return FastJSONResponse(ReportCardDTO(student_id=student_id, gpa=gpa, courses=courses))
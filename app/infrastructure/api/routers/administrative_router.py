@@ -0,0 +1,182 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+import uuid
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from pydantic import AwareDatetime, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.dto import BaseDTO
+from app.common.exceptions import AppError, ValidationError, translate_exception
+from app.config.settings import settings
+from app.core.entities.schedule import (
+    ScheduleConflict,
+    ScheduleConflictError,
+    ScheduleEntry,
+    find_conflicts,
+)
+from app.infrastructure.api.dependencies import get_unit_of_work
+from app.infrastructure.api.http_cache import cache_control
+from app.infrastructure.api.request_body import parse_body
+from app.infrastructure.api.responses import FastJSONResponse
+from app.infrastructure.database.repositories.schedule_repository import (
+    ScheduleRepository,
+)
+from app.infrastructure.database.repositories.student_repository import (
+    StudentRepository,
+)
+from app.infrastructure.database.session import get_read_session
+from app.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+router = APIRouter()
+
+
+# ------------------------------------------------------------
+# Schedule
+# ------------------------------------------------------------
+class ScheduleEntryDTO(BaseDTO):
+    room_id: uuid.UUID
+    starts_at: AwareDatetime
+    ends_at: AwareDatetime
+    teacher_id: Optional[uuid.UUID] = None
+    group_id: Optional[uuid.UUID] = None
+    course_id: Optional[uuid.UUID] = None
+    id: Optional[uuid.UUID] = None
+
+    def to_entity(self) -> ScheduleEntry:
+        entry = ScheduleEntry(
+            room_id=self.room_id,
+            starts_at=self.starts_at,
+            ends_at=self.ends_at,
+            teacher_id=self.teacher_id,
+            group_id=self.group_id,
+            course_id=self.course_id,
+        )
+        if self.id is not None:
+            entry.id = self.id
+        return entry
+
+
+class TimetableDTO(BaseDTO):
+    entries: List[ScheduleEntryDTO] = Field(min_length=1, max_length=5000)
+
+
+class ScheduleConflictDTO(BaseDTO):
+    resource: str
+    resource_id: uuid.UUID
+    entry: int
+    starts_at: datetime
+    ends_at: datetime
+    other_entry: Optional[int] = None
+    scheduled_id: Optional[uuid.UUID] = None
+
+
+def _conflicts(conflicts: List[ScheduleConflict]) -> List[ScheduleConflictDTO]:
+    return [ScheduleConflictDTO.from_entity(c) for c in conflicts]
+
+
+async def _timetable(request: Request) -> List[ScheduleEntry]:
+    timetable = await parse_body(request, TimetableDTO)
+    try:
+        return [dto.to_entity() for dto in timetable.entries]
+    except ValidationError as exc:
+        raise translate_exception(exc) from exc
+
+
+@router.post("/schedule/conflicts")
+async def check_schedule(
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Report every overlap in a proposed timetable, between its own
+    entries and against the stored schedule, without saving anything.
+
+    Body: {"entries": [{"room_id", "starts_at", "ends_at",
+    "teacher_id"?, "group_id"?, "course_id"?, "id"?}, ...]}. A room,
+    teacher or group can be in one place at a time; periods are
+    half-open, so back-to-back entries do not conflict. An entry with
+    the `id` of a stored one replaces it.
+    """
+    entries = await _timetable(request)
+    scheduled = await ScheduleRepository(session).overlapping(entries)
+    conflicts = find_conflicts(entries, scheduled)
+    return FastJSONResponse({"checked": len(entries), "conflicts": _conflicts(conflicts)})
+
+
+@router.post("/schedule", status_code=status.HTTP_201_CREATED)
+async def save_schedule(
+    request: Request,
+    uow: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
+):
+    """
+    Save a timetable (same body as /schedule/conflicts) all or
+    nothing: 201 when stored, 409 with the conflicts otherwise.
+    """
+    entries = await _timetable(request)
+    try:
+        async with uow:
+            saved = await uow.repository(ScheduleRepository).save_timetable(entries)
+    except ScheduleConflictError as exc:
+        return FastJSONResponse(
+            {"detail": str(exc), "conflicts": _conflicts(exc.conflicts)},
+            status_code=status.HTTP_409_CONFLICT,
+        )
+    except AppError as exc:
+        raise translate_exception(exc) from exc
+    return FastJSONResponse(
+        {"saved": len(saved), "ids": [str(e.id) for e in saved]},
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+# ------------------------------------------------------------
+# Students
+# ------------------------------------------------------------
+class StudentDTO(BaseDTO):
+    id: uuid.UUID
+    student_number: str
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    institution_id: Optional[uuid.UUID] = None
+    active: bool
+
+
+class StudentSearchDTO(BaseDTO):
+    items: List[StudentDTO]
+    next_cursor: Optional[str] = None
+
+
+@router.get("/students/search")
+@cache_control(max_age=0)
+async def search_students(
+    q: str = Query(min_length=1, max_length=100, description="Name or student number."),
+    mode: Literal["prefix", "similar"] = Query(default="prefix"),
+    limit: int = Query(
+        default=settings.STUDENT_SEARCH_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.STUDENT_SEARCH_MAX_LIMIT,
+    ),
+    cursor: Optional[str] = Query(default=None, max_length=512),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Search the roster by name or student number.
+
+    `mode=prefix` (default) is for autocomplete: every word typed
+    starts a word of the student's last name, first name or number
+    ("gar ana", "S2024-00"), alphabetical by last name. `mode=similar`
+    ranks by trigram similarity and tolerates typos. Pass
+    `next_cursor` back as `cursor` for the next page.
+    """
+    try:
+        page = await StudentRepository(session).search(q, mode=mode, limit=limit, cursor=cursor)
+    except AppError as exc:
+        raise translate_exception(exc) from exc
+    return FastJSONResponse(
+        StudentSearchDTO(
+            items=[StudentDTO.from_entity(s) for s in page.items],
+            next_cursor=page.next_cursor,
+        )
+    )
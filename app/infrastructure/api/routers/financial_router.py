@@ -0,0 +1,133 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+import uuid
+
+from fastapi import APIRouter, Depends, status
+from pydantic import Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.dto import BaseDTO
+from app.common.exceptions import AppError, EntityNotFoundError, translate_exception
+from app.core.entities.invoice import BillingRun, billing_period
+from app.infrastructure.api.http_cache import cache_control
+from app.infrastructure.api.responses import FastJSONResponse
+from app.infrastructure.database.billing import start_billing_run
+from app.infrastructure.database.repositories.invoice_repository import InvoiceRepository
+from app.infrastructure.database.session import get_read_session
+
+router = APIRouter()
+
+
+# ------------------------------------------------------------
+# Billing runs
+# ------------------------------------------------------------
+class BillingRunRequestDTO(BaseDTO):
+    period: str = Field(pattern=r"^\d{4}-\d{2}$", description="Month to bill, 'YYYY-MM'.")
+
+
+class BillingProgressDTO(BaseDTO):
+    institution_id: uuid.UUID
+    students: int
+    invoices: int
+    lines: int
+    done: bool
+
+
+class BillingRunDTO(BaseDTO):
+    id: uuid.UUID
+    period: date
+    status: str
+    invoices: int
+    lines: int
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    institutions: List[BillingProgressDTO]
+
+    @classmethod
+    def from_run(cls, run: BillingRun) -> "BillingRunDTO":
+        return cls(
+            id=run.id,
+            period=run.period,
+            status=run.status.value,
+            # Live totals while running; the run row is summed at the end
+            invoices=max(run.invoices, sum(p.invoices for p in run.institutions)),
+            lines=max(run.lines, sum(p.lines for p in run.institutions)),
+            started_at=run.started_at,
+            finished_at=run.finished_at,
+            error=run.error,
+            institutions=[BillingProgressDTO.from_entity(p) for p in run.institutions],
+        )
+
+
+@router.post("/billing-runs", status_code=status.HTTP_202_ACCEPTED)
+async def create_billing_run(body: BillingRunRequestDTO):
+    """
+    Invoice every active student for a month, in the background.
+
+    Starting a period whose last run did not finish resumes it from its
+    checkpoints; starting a finished period again only bills students
+    added since. Follow progress at GET /billing-runs/{id}. 409 while
+    the period is already being billed by this process.
+    """
+    try:
+        run = await start_billing_run(billing_period(body.period))
+    except AppError as exc:
+        raise translate_exception(exc) from exc
+    return FastJSONResponse(BillingRunDTO.from_run(run), status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/billing-runs/{run_id}")
+async def get_billing_run(
+    run_id: uuid.UUID,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Status of a billing run with per-institution progress."""
+    run = await InvoiceRepository(session).get_run(run_id)
+    if run is None:
+        raise translate_exception(EntityNotFoundError(f"Billing run {run_id} does not exist."))
+    return FastJSONResponse(BillingRunDTO.from_run(run))
+
+
+# ------------------------------------------------------------
+# Invoices
+# ------------------------------------------------------------
+class InvoiceLineDTO(BaseDTO):
+    fee_id: uuid.UUID
+    description: str
+    amount: Decimal
+
+
+class InvoiceDTO(BaseDTO):
+    id: uuid.UUID
+    institution_id: uuid.UUID
+    period: date
+    status: str
+    total: Decimal
+    issued_at: datetime
+    lines: List[InvoiceLineDTO]
+
+
+@router.get("/students/{student_id}/invoices")
+@cache_control(max_age=0)
+async def student_invoices(
+    student_id: uuid.UUID,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """The student's last 24 invoices with their lines, newest first."""
+    invoices = await InvoiceRepository(session).for_student(student_id)
+    return FastJSONResponse(
+        [
+            InvoiceDTO(
+                id=i.id,
+                institution_id=i.institution_id,
+                period=i.period,
+                status=i.status.value,
+                total=i.total,
+                issued_at=i.issued_at,
+                lines=[InvoiceLineDTO.from_entity(line) for line in i.lines],
+            )
+            for i in invoices
+        ]
+    )
@@ -1,20 +1,50 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from app.config.settings import settings
+from app.infrastructure.api.responses import FastJSONResponse
+from app.infrastructure.database.health import DatabaseHealthMonitor, get_health_monitor
 from app.infrastructure.database.session import get_async_session
 
 router = APIRouter()
 
+
+@router.get("/livez", tags=["health"])
+async def livez():
+    """
+    Liveness probe: the process is up and serving requests.
+    Touches no dependency, so it is safe to call at any rate.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/readyz", tags=["health"])
+async def readyz(monitor: DatabaseHealthMonitor = Depends(get_health_monitor)):
+    """
+    Readiness probe: reports the last background DB/pool check.
+    Never opens a connection; 503 while the database is unreachable,
+    the pool is saturated or no check has completed yet.
+    """
+    snapshot = monitor.snapshot()
+    if snapshot["status"] == "ready":
+        return FastJSONResponse(snapshot)
+    return FastJSONResponse(snapshot, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
 @router.get("/health", tags=["health"])
 async def health(db: AsyncSession = Depends(get_async_session)):
     """
-    Simple health check that verifies DB connectivity.
-    Returns 200 {"status":"ok"} if DB responds.
+    Deep health check that verifies DB connectivity on demand.
+    Returns 200 {"status":"ok"} if DB responds, 503 otherwise.
+    Load balancers should probe /livez and /readyz instead.
     """
     try:
         await db.execute(text("SELECT 1"))
         return {"status": "ok"}
     except Exception as exc:
+        body = {"status": "error"}
         # Do not leak internal error details in production
-        return {"status": "error", "detail": str(exc)}
\ No newline at end of file
+        if settings.APP_DEBUG:
+            body["detail"] = str(exc)
+        return FastJSONResponse(body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,102 @@
+"""
+Production entry point.
+
+    python -m app.infrastructure.api.server
+
+Runs uvicorn's process supervisor with `WEB_WORKERS` worker processes
+(default: one per CPU). Each worker imports the app by its import
+string, so engines and pools are created after the fork and never
+shared between processes.
+
+Shutdown: SIGTERM/SIGINT on the supervisor is forwarded to every
+worker. A worker stops accepting connections, waits up to
+`WEB_TIMEOUT_GRACEFUL_SHUTDOWN` seconds for in-flight requests, then
+runs the app's shutdown handlers (event bus drain, engine disposal)
+before exiting. The supervisor waits for all workers.
+"""
+
+from typing import Any, Dict, Optional
+import importlib.util
+import logging
+import os
+
+import uvicorn
+
+from app.config.settings import Settings, settings as default_settings
+
+logger = logging.getLogger(__name__)
+
+APP_IMPORT_STRING = "app.infrastructure.api.main:app"
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def event_loop_impl() -> str:
+    """uvloop when installed (the "server" extra), asyncio otherwise."""
+    return "uvloop" if _installed("uvloop") else "asyncio"
+
+
+def http_impl() -> str:
+    """httptools when installed (the "server" extra), h11 otherwise."""
+    return "httptools" if _installed("httptools") else "h11"
+
+
+def worker_count(configured: int) -> int:
+    """`configured` workers, or one per CPU when it is 0."""
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+def server_options(
+    settings: Optional[Settings] = None,
+    *,
+    reload: bool = False,
+) -> Dict[str, Any]:
+    """
+    Keyword arguments for `uvicorn.run()` built from Settings.
+
+    With `reload` a single auto-reloading process is used (development);
+    otherwise `WEB_WORKERS` processes behind uvicorn's supervisor.
+    """
+    settings = settings or default_settings
+    options: Dict[str, Any] = {
+        "host": settings.WEB_HOST,
+        "port": settings.WEB_PORT,
+        "loop": event_loop_impl(),
+        "http": http_impl(),
+        "log_level": "debug" if settings.APP_DEBUG else "info",
+        "backlog": settings.WEB_BACKLOG,
+        "timeout_keep_alive": settings.WEB_KEEPALIVE_TIMEOUT,
+        "timeout_graceful_shutdown": settings.WEB_TIMEOUT_GRACEFUL_SHUTDOWN or None,
+        "limit_concurrency": settings.WEB_LIMIT_CONCURRENCY or None,
+        "limit_max_requests": settings.WEB_MAX_REQUESTS or None,
+        "proxy_headers": settings.WEB_PROXY_HEADERS,
+        "forwarded_allow_ips": settings.WEB_FORWARDED_ALLOW_IPS,
+        "server_header": False,
+    }
+    if reload:
+        options["reload"] = True
+    else:
+        options["workers"] = worker_count(settings.WEB_WORKERS)
+    return options
+
+
+def run(reload: bool = False) -> None:
+    options = server_options(reload=reload)
+    logger.info(
+        "Starting %s on %s:%s (workers=%s, loop=%s, http=%s)",
+        APP_IMPORT_STRING,
+        options["host"],
+        options["port"],
+        options.get("workers", "reload"),
+        options["loop"],
+        options["http"],
+    )
+    uvicorn.run(APP_IMPORT_STRING, **options)
+
+
+if __name__ == "__main__":
+    run()
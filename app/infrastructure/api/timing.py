@@ -0,0 +1,166 @@
+from functools import wraps
+from typing import Any, Callable, Iterable, List
+import asyncio
+import time
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.metrics import metrics
+from app.common.timing import (
+    RequestTimings,
+    bind_request_timings,
+    current_timings,
+    reset_request_timings,
+)
+
+# ---------------------------------------------------------------------
+# Per-route latency metrics
+# ---------------------------------------------------------------------
+REQUEST_SECONDS = metrics.histogram(
+    "http_request_duration_seconds",
+    "Time from request start to the end of the response.",
+    labelnames=("method", "route"),
+)
+REQUEST_DB_SECONDS = metrics.histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request.",
+    labelnames=("method", "route"),
+)
+REQUEST_QUERIES = metrics.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request.",
+    labelnames=("method", "route"),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+REQUEST_QUANTILES = metrics.gauge(
+    "http_request_duration_quantile_seconds",
+    "p50/p95/p99 request latency estimated from the histogram buckets.",
+    labelnames=("method", "route", "quantile"),
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _collect_quantiles() -> None:
+    for (method, route), series in REQUEST_SECONDS.series().items():
+        for q in QUANTILES:
+            value = REQUEST_SECONDS.quantile(q, method=method, route=route)
+            if value is not None:
+                REQUEST_QUANTILES.set(value, method=method, route=route, quantile=str(q))
+
+
+metrics.register_collector(_collect_quantiles)
+
+
+def _ms(duration_ns: int) -> str:
+    return f"{duration_ns / 1_000_000:.2f}"
+
+
+def server_timing_header(timings: RequestTimings, total_ns: int) -> bytes:
+    """Render the breakdown as a Server-Timing header value."""
+    parts: List[str] = [f'db;dur={_ms(timings.db_ns)};desc="{timings.queries} queries"']
+    for name, duration_ns in timings.spans.items():
+        parts.append(f"{name};dur={_ms(duration_ns)}")
+    parts.append(f"total;dur={_ms(total_ns)}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class ServerTimingMiddleware:
+    """
+    Collects a per-request timing breakdown (DB time and query count,
+    handler time, serialization time, custom spans), emits it as a
+    `Server-Timing` header and records per-route latency histograms.
+
+    Routes are labelled by their path template (e.g. /students/{id}) so
+    metric cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, emit_header: bool = True) -> None:
+        self.app = app
+        self.emit_header = emit_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = bind_request_timings(timings)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                now = time.perf_counter_ns()
+                if timings.handler_end_ns:
+                    timings.add("serialize", now - timings.handler_end_ns)
+                if self.emit_header:
+                    headers = list(message.get("headers", ()))
+                    headers.append(
+                        (b"server-timing", server_timing_header(timings, now - timings.start_ns))
+                    )
+                    message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            reset_request_timings(token)
+            route = scope.get("route")
+            labels = {
+                "method": scope["method"],
+                "route": getattr(route, "path", None) or UNMATCHED_ROUTE,
+            }
+            REQUEST_SECONDS.observe(timings.elapsed_ns() / 1e9, **labels)
+            REQUEST_DB_SECONDS.observe(timings.db_ns / 1e9, **labels)
+            REQUEST_QUERIES.observe(timings.queries, **labels)
+
+
+# ---------------------------------------------------------------------
+# Handler timing
+# ---------------------------------------------------------------------
+def _timed_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    def _record(start: int) -> None:
+        timings = current_timings()
+        if timings is not None:
+            timings.handler_end_ns = time.perf_counter_ns()
+            timings.add("handler", timings.handler_end_ns - start)
+
+    if asyncio.iscoroutinefunction(call):
+        @wraps(call)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                _record(start)
+
+        wrapper = async_wrapper
+    else:
+        @wraps(call)
+        def sync_wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                _record(start)
+
+        wrapper = sync_wrapper
+
+    wrapper._server_timing = True
+    return wrapper
+
+
+def instrument_route_handlers(routes: Iterable[Any]) -> None:
+    """
+    Wrap each APIRoute endpoint so the time spent inside it is recorded
+    as the "handler" span. FastAPI calls `route.dependant.call` for
+    every request, so swapping it after registration is enough.
+    Idempotent.
+    """
+    for route in routes:
+        if not isinstance(route, APIRoute):
+            continue
+        call = route.dependant.call
+        if call is not None and not getattr(call, "_server_timing", False):
+            route.dependant.call = _timed_endpoint(call)
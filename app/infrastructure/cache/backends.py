@@ -0,0 +1,136 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+import time
+
+
+@dataclass
+class CacheStats:
+    """Counters exposed by every cache backend."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+class CacheBackend(ABC):
+    """
+    Key/value cache port.
+
+    The in-memory implementation below is process-local; a shared
+    implementation (e.g. Redis) can be plugged in behind the same
+    interface so several workers see the same entries.
+    `get()` returns None on a miss, so None values are never stored.
+    """
+
+    stats: CacheStats
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Optional[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: Hashable) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def get_many(self, keys: Sequence[Hashable]) -> List[Optional[Any]]:
+        """
+        Optional convenience method.
+        Network backends should override with a single round trip.
+        """
+        return [await self.get(key) for key in keys]
+
+    async def delete_many(self, keys: Sequence[Hashable]) -> None:
+        for key in keys:
+            await self.delete(key)
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Bounded LRU cache with per-entry TTL.
+
+    Used as the process-wide entity cache and as an in-memory stand-in
+    for a shared backend in tests. All operations are O(1).
+    """
+
+    def __init__(self, max_entries: int = 10_000, default_ttl: Optional[float] = 300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        # key -> (expires_at or None, value); most recently used at the end
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of the stored keys (least recently used first)."""
+        return list(self._data)
+
+    # -------------------------
+    # Synchronous core (also used by non-async callers)
+    # -------------------------
+    def get_nowait(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set_nowait(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if value is None:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete_nowait(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    # -------------------------
+    # CacheBackend interface
+    # -------------------------
+    async def get(self, key: Hashable) -> Optional[Any]:
+        return self.get_nowait(key)
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self.set_nowait(key, value, ttl)
+
+    async def delete(self, key: Hashable) -> None:
+        self.delete_nowait(key)
+
+    async def clear(self) -> None:
+        self._data.clear()
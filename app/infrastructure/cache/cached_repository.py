@@ -0,0 +1,226 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from app.common.kernel.base_repository import BaseRepository, CursorPage, OrderBy
+from app.config.settings import settings
+from app.infrastructure.cache.backends import CacheBackend, InMemoryCacheBackend
+
+T = TypeVar("T")       # Domain Entity
+ID = TypeVar("ID")     # ID type
+
+
+# ---------------------------------------------------------------------
+# PROCESS-WIDE ENTITY CACHE
+# ---------------------------------------------------------------------
+_ENTITY_CACHE: InMemoryCacheBackend | None = None
+
+
+def get_entity_cache() -> InMemoryCacheBackend:
+    """Lazy-initialize the process-wide LRU/TTL entity cache."""
+    global _ENTITY_CACHE
+
+    if _ENTITY_CACHE is None:
+        _ENTITY_CACHE = InMemoryCacheBackend(
+            max_entries=settings.CACHE_MAX_ENTRIES,
+            default_ttl=settings.CACHE_TTL,
+        )
+    return _ENTITY_CACHE
+
+
+class IdentityMap:
+    """
+    Per-request map of entities already loaded in this request.
+    Guarantees one object per (namespace, id) and no repeat lookups.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Dict[str, Any] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entities
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._entities.get(key)
+
+    def put(self, key: str, entity: Any) -> None:
+        self._entities[key] = entity
+
+    def discard(self, key: str) -> None:
+        self._entities.pop(key, None)
+
+
+class CachedRepository(BaseRepository[T, ID], Generic[T, ID]):
+    """
+    Read-through caching decorator for any repository.
+
+    Lookups by id go: request identity map -> process-wide LRU/TTL
+    cache -> optional shared backend -> wrapped repository. A write made
+    through this decorator invalidates the entry in this process's cache
+    and in the shared backend. Other processes keep serving their own
+    process-wide copy until its TTL (`ttl`, else CACHE_TTL) expires, and
+    that is true with or without a shared backend. So reads can be up
+    to one TTL stale. Use it for hot reference data such as
+    institutions, schedules and users, and treat cached entities as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        inner: BaseRepository[T, ID],
+        *,
+        namespace: Optional[str] = None,
+        cache: Optional[InMemoryCacheBackend] = None,
+        shared: Optional[CacheBackend] = None,
+        identity_map: Optional[IdentityMap] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.inner = inner
+        self.namespace = namespace or self._default_namespace(inner)
+        self.cache = cache if cache is not None else get_entity_cache()
+        self.shared = shared
+        self.identity_map = identity_map if identity_map is not None else IdentityMap()
+        self.ttl = ttl
+
+    def __getattr__(self, name: str) -> Any:
+        # Slice-specific query methods are passed through uncached
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    # ------------------------------------------
+    # Reads (cached)
+    # ------------------------------------------
+    async def get_by_id(self, entity_id: ID) -> Optional[T]:
+        key = self._key(entity_id)
+        entity = await self._lookup(key)
+        if entity is not None:
+            return entity
+
+        entity = await self.inner.get_by_id(entity_id)
+        if entity is not None:
+            await self._store(key, entity)
+        return entity
+
+    async def get_by_ids(self, entity_ids: Sequence[ID]) -> List[Optional[T]]:
+        found: Dict[Any, T] = {}
+        missing: List[ID] = []
+        for entity_id in dict.fromkeys(entity_ids):
+            entity = await self._lookup(self._key(entity_id))
+            if entity is None:
+                missing.append(entity_id)
+            else:
+                found[entity_id] = entity
+
+        if missing:
+            loaded = await self.inner.get_by_ids(missing)
+            for entity_id, entity in zip(missing, loaded):
+                if entity is not None:
+                    found[entity_id] = entity
+                    await self._store(self._key(entity_id), entity)
+
+        return [found.get(entity_id) for entity_id in entity_ids]
+
+    # ------------------------------------------
+    # Reads (pass-through)
+    # ------------------------------------------
+    async def list(self, limit: int = 100, offset: int = 0) -> List[T]:
+        return await self.inner.list(limit=limit, offset=offset)
+
+    async def list_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: OrderBy = "id",
+    ) -> CursorPage[T]:
+        return await self.inner.list_after(cursor, limit=limit, order_by=order_by)
+
+    def stream(self, batch_size: int = 1000, **kwargs: Any) -> AsyncIterator[T]:
+        return self.inner.stream(batch_size, **kwargs)
+
+    # ------------------------------------------
+    # Writes (invalidate)
+    # ------------------------------------------
+    async def save(self, entity: T) -> T:
+        saved = await self.inner.save(entity)
+        await self._invalidate([self._entity_id(saved)])
+        self.identity_map.put(self._key(self._entity_id(saved)), saved)
+        return saved
+
+    async def delete(self, entity_id: ID) -> None:
+        await self.inner.delete(entity_id)
+        await self._invalidate([entity_id])
+
+    async def save_many(self, entities: Sequence[T]) -> List[T]:
+        saved = await self.inner.save_many(entities)
+        await self._invalidate([self._entity_id(e) for e in saved])
+        return saved
+
+    async def upsert_many(
+        self,
+        entities: Sequence[T],
+        conflict_columns: Sequence[str] = ("id",),
+        **kwargs: Any,
+    ) -> List[T]:
+        saved = await self.inner.upsert_many(
+            entities, conflict_columns=conflict_columns, **kwargs
+        )
+        await self._invalidate([self._entity_id(e) for e in saved])
+        return saved
+
+    async def delete_many(self, entity_ids: Sequence[ID]) -> int:
+        deleted = await self.inner.delete_many(entity_ids)
+        await self._invalidate(entity_ids)
+        return deleted
+
+    # ------------------------------------------
+    # Internal helpers
+    # ------------------------------------------
+    @staticmethod
+    def _default_namespace(inner: BaseRepository) -> str:
+        model_cls = getattr(inner, "model_cls", None)
+        if model_cls is not None:
+            return getattr(model_cls, "__tablename__", model_cls.__name__)
+        return type(inner).__name__
+
+    @staticmethod
+    def _entity_id(entity: Any) -> Any:
+        return getattr(entity, "id")
+
+    def _key(self, entity_id: Any) -> str:
+        return f"{self.namespace}:{entity_id}"
+
+    async def _lookup(self, key: str) -> Optional[T]:
+        if key in self.identity_map:
+            return self.identity_map.get(key)
+
+        entity = self.cache.get_nowait(key)
+        if entity is None and self.shared is not None:
+            entity = await self.shared.get(key)
+            if entity is not None:
+                self.cache.set_nowait(key, entity, self.ttl)
+
+        if entity is not None:
+            self.identity_map.put(key, entity)
+        return entity
+
+    async def _store(self, key: str, entity: T) -> None:
+        self.identity_map.put(key, entity)
+        self.cache.set_nowait(key, entity, self.ttl)
+        if self.shared is not None:
+            await self.shared.set(key, entity, self.ttl)
+
+    async def _invalidate(self, entity_ids: Sequence[Any]) -> None:
+        keys = [self._key(entity_id) for entity_id in entity_ids]
+        for key in keys:
+            self.identity_map.discard(key)
+            self.cache.delete_nowait(key)
+        if self.shared is not None and keys:
+            await self.shared.delete_many(keys)
@@ -0,0 +1,270 @@
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+import logging
+import time
+
+from app.common.exceptions import UseCaseBusyError
+from app.common.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FlushFn = Callable[[List[T]], Awaitable[Any]]
+
+WRITER_ROWS = metrics.counter(
+    "batch_writer_rows_total",
+    "Rows handled by a batch writer, by outcome (written, retried, failed, rejected, coalesced).",
+    labelnames=("writer", "outcome"),
+)
+WRITER_FLUSH_SECONDS = metrics.histogram(
+    "batch_writer_flush_seconds",
+    "Time spent writing one batch.",
+    labelnames=("writer",),
+)
+WRITER_BATCH_ROWS = metrics.histogram(
+    "batch_writer_batch_rows",
+    "Rows written per flush.",
+    labelnames=("writer",),
+    buckets=(1, 10, 100, 500, 1000, 5000, 10000, 50000),
+)
+WRITER_PENDING = metrics.gauge(
+    "batch_writer_pending_rows",
+    "Rows buffered and not yet flushed.",
+    labelnames=("writer",),
+)
+
+
+class BatchWriter(Generic[T]):
+    """
+    Write-behind buffer that turns many small submissions into few
+    large writes.
+
+    `submit(items)` only appends to an in-memory buffer and returns a
+    future. A single background task hands the whole buffer to `flush`
+    once `flush_interval` seconds have passed since the first pending
+    item, or as soon as `max_batch_size` items are waiting. Every
+    submitter whose items went into that flush shares its future, so
+    callers that need durability await it and the others return right
+    away.
+
+    With `key`, items with the same key are coalesced while buffered
+    (last submission wins), so one flush never writes a row twice.
+    Submissions that would grow the buffer past `max_pending` are
+    rejected with UseCaseBusyError (503) instead of growing memory.
+
+    A failed flush fails its future (waiters see the error) but its
+    items are put back in the buffer, behind newer submissions of the
+    same key, and retried with exponential backoff (`retry_backoff`
+    doubling up to `max_retry_backoff` seconds) until a flush succeeds.
+    Fire-and-forget submissions therefore survive transient database
+    errors; while the database stays down the buffer fills up and new
+    submissions get 503. Items that no longer fit under `max_pending`
+    are dropped and logged.
+
+    Buffered items live in process memory: `stop(drain=True)` must run
+    on shutdown (see stop_batch_writers()) so nothing is lost on a
+    graceful exit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush: FlushFn,
+        *,
+        key: Optional[Callable[[T], Hashable]] = None,
+        max_batch_size: int = 5000,
+        flush_interval: float = 0.05,
+        max_pending: int = 100_000,
+        retry_backoff: float = 0.1,
+        max_retry_backoff: float = 5.0,
+    ):
+        self.name = name
+        self._flush = flush
+        self._key = key
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self._failures = 0
+
+        self._buffer: Dict[Hashable, T] = {}
+        self._sequence = 0
+        self._future: Optional[asyncio.Future] = None
+        self._has_items: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._closing = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    # -------------------------
+    # Submit
+    # -------------------------
+    def submit(self, items: Sequence[T]) -> asyncio.Future:
+        """
+        Buffer `items` for the next flush. The returned future resolves
+        (with the flush result) once they are written, or raises the
+        flush error.
+        """
+        if not items:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(None)
+            return future
+        if len(self._buffer) + len(items) > self.max_pending:
+            WRITER_ROWS.inc(len(items), writer=self.name, outcome="rejected")
+            raise UseCaseBusyError(f"{self.name} write queue is full; retry shortly.")
+        self._ensure_started()
+
+        before = len(self._buffer)
+        for item in items:
+            if self._key is not None:
+                self._buffer[self._key(item)] = item
+            else:
+                self._sequence += 1
+                self._buffer[self._sequence] = item
+        coalesced = before + len(items) - len(self._buffer)
+        if coalesced:
+            WRITER_ROWS.inc(coalesced, writer=self.name, outcome="coalesced")
+        WRITER_PENDING.set(len(self._buffer), writer=self.name)
+
+        if self._future is None:
+            self._future = asyncio.get_running_loop().create_future()
+            # Fire-and-forget submitters never await it; keep asyncio quiet
+            self._future.add_done_callback(_consume_exception)
+        self._has_items.set()
+        if len(self._buffer) >= self.max_batch_size:
+            self._full.set()
+        return self._future
+
+    async def write(self, items: Sequence[T]) -> Any:
+        """Submit and wait until the items are flushed."""
+        return await asyncio.shield(self.submit(items))
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._has_items = asyncio.Event()
+            self._full = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name=f"batch-writer:{self.name}")
+            if self not in _WRITERS:
+                _WRITERS.append(self)
+
+    async def stop(self, drain: bool = True, timeout: float = 10.0) -> None:
+        """
+        Stop the flush task. With `drain`, buffered items are flushed
+        first (bounded by `timeout`); otherwise they are discarded.
+        """
+        if self._task is None:
+            return
+        if drain:
+            self._closing = True
+            self._has_items.set()
+            self._full.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "%s: %d buffered row(s) not flushed before shutdown", self.name, self.pending
+                )
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        if self in _WRITERS:
+            _WRITERS.remove(self)
+
+    async def _run(self) -> None:
+        while not (self._closing and not self._buffer):
+            await self._has_items.wait()
+            if not self._closing:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self.flush_now()
+            if self._failures:
+                await asyncio.sleep(
+                    min(self.retry_backoff * 2 ** (self._failures - 1), self.max_retry_backoff)
+                )
+
+    async def flush_now(self) -> None:
+        """Write everything buffered so far (failed items are re-buffered)."""
+        pairs, future = list(self._buffer.items()), self._future
+        batch = [item for _, item in pairs]
+        self._buffer, self._future = {}, None
+        self._has_items.clear()
+        self._full.clear()
+        WRITER_PENDING.set(0, writer=self.name)
+        if not batch:
+            return
+
+        start = time.perf_counter()
+        try:
+            result = await self._flush(batch)
+        except Exception as exc:
+            self._failures += 1
+            logger.exception(
+                "%s: flush of %d row(s) failed (attempt %d), retrying: %r",
+                self.name, len(batch), self._failures, exc,
+            )
+            self._requeue(pairs)
+            if future is not None and not future.done():
+                future.set_exception(exc)
+            return
+        self._failures = 0
+        WRITER_FLUSH_SECONDS.observe(time.perf_counter() - start, writer=self.name)
+        WRITER_BATCH_ROWS.observe(len(batch), writer=self.name)
+        WRITER_ROWS.inc(len(batch), writer=self.name, outcome="written")
+        if future is not None and not future.done():
+            future.set_result(result)
+
+
+    def _requeue(self, pairs: List[Tuple[Hashable, T]]) -> None:
+        # Items submitted meanwhile are newer: they win over failed ones
+        failed = [(k, item) for k, item in pairs if k not in self._buffer]
+        room = max(self.max_pending - len(self._buffer), 0)
+        dropped = len(failed) - room
+        if dropped > 0:
+            WRITER_ROWS.inc(dropped, writer=self.name, outcome="failed")
+            logger.error("%s: %d failed row(s) dropped, queue is full", self.name, dropped)
+            failed = failed[:room]
+        if failed:
+            WRITER_ROWS.inc(len(failed), writer=self.name, outcome="retried")
+            self._buffer = {**dict(failed), **self._buffer}
+            WRITER_PENDING.set(len(self._buffer), writer=self.name)
+            self._has_items.set()
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+# ---------------------------------------------------------------------
+# RUNNING WRITERS (drained on shutdown)
+# ---------------------------------------------------------------------
+_WRITERS: List[BatchWriter] = []
+
+
+async def stop_batch_writers(timeout: float = 10.0) -> None:
+    """Flush and stop every running writer."""
+    for writer in list(_WRITERS):
+        await writer.stop(drain=True, timeout=timeout)
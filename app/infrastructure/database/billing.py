@@ -0,0 +1,265 @@
+"""
+Monthly invoice generation.
+
+A billing run invoices every active student of every institution that
+has active fees. Work is split per institution: a bounded pool of
+workers takes institutions largest-first and bills each one chunk by
+chunk through InvoiceRepository.bill_chunk(), which writes a chunk's
+invoices and lines set-wise and advances the institution's checkpoint
+in the same transaction.
+
+A run that stops (shutdown, crash, Ctrl-C) is resumed by running the
+same period again: work restarts after the last committed chunk, and
+(student_id, period) uniqueness guarantees nobody is billed twice.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.exceptions import ConflictError, EntityNotFoundError
+from app.common.metrics import metrics
+from app.config.settings import settings
+from app.core.entities.invoice import BillingProgress, BillingRun, BillingRunStatus
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.repositories.invoice_repository import InvoiceRepository
+
+logger = logging.getLogger(__name__)
+
+BILLING_INVOICES = metrics.counter(
+    "billing_invoices_total",
+    "Invoices created by billing runs.",
+)
+BILLING_LINES = metrics.counter(
+    "billing_invoice_lines_total",
+    "Invoice lines created by billing runs.",
+)
+BILLING_CHUNK_SECONDS = metrics.histogram(
+    "billing_chunk_seconds",
+    "Time to bill one chunk of students (one transaction).",
+)
+
+
+@dataclass
+class BillingReport:
+    """What one invocation of a run did (a resumed run reports its own share)."""
+
+    run_id: uuid.UUID
+    period: date
+    status: BillingRunStatus
+    institutions: int
+    invoices: int
+    lines: int
+    elapsed: float
+
+    @property
+    def invoices_per_second(self) -> float:
+        return self.invoices / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"billing {self.period:%Y-%m} run {self.run_id} {self.status.value}: "
+            f"{self.invoices} invoices, {self.lines} lines across {self.institutions} "
+            f"institution(s) in {self.elapsed:.1f}s "
+            f"({self.invoices_per_second:,.0f} invoices/s, {self.lines_per_second:,.0f} lines/s)"
+        )
+
+
+class InvoiceGenerationJob:
+    """
+    Bills one period with `workers` institutions in flight at a time
+    (each worker holds one connection while billing a chunk) and
+    `chunk_size` students per transaction.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        *,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        progress_interval: Optional[float] = None,
+    ):
+        self._session_factory = session_factory
+        self.workers = max(1, workers or settings.BILLING_WORKERS)
+        self.chunk_size = max(1, chunk_size or settings.BILLING_CHUNK_SIZE)
+        self.progress_interval = (
+            settings.BILLING_PROGRESS_INTERVAL if progress_interval is None else progress_interval
+        )
+        self._invoices = 0
+        self._lines = 0
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        # Resolved lazily: the runtime factory is rebuilt after dispose_engines()
+        if self._session_factory is not None:
+            return self._session_factory
+        if db_session.async_session is None:
+            db_session.get_async_engine()
+        return db_session.async_session
+
+    async def run(self, period: date, run_id: Optional[uuid.UUID] = None) -> BillingReport:
+        return await self.execute(await self.prepare(period, run_id))
+
+    async def prepare(self, period: date, run_id: Optional[uuid.UUID] = None) -> BillingRun:
+        """
+        The run to execute: `run_id`, else the latest unfinished run of
+        `period`, else a new one.
+        """
+        async with self.session_factory() as session:
+            repo = InvoiceRepository(session)
+            if run_id is not None:
+                run = await repo.get_run(run_id)
+                if run is None:
+                    raise EntityNotFoundError(f"Billing run {run_id} does not exist.")
+                return run
+            return await repo.resumable_run(period) or await repo.start_run(period)
+
+    async def execute(self, run: BillingRun) -> BillingReport:
+        pending = sorted(
+            (p for p in run.institutions if not p.done),
+            key=lambda p: p.students - p.invoices,
+            reverse=True,
+        )
+        async with self.session_factory() as session:
+            await InvoiceRepository(session).set_run_status(run.id, BillingRunStatus.RUNNING)
+            # SQLite has a single writer; more workers would only wait on its lock
+            single_writer = session.get_bind().dialect.name == "sqlite"
+
+        queue: asyncio.Queue[BillingProgress] = asyncio.Queue()
+        for progress in pending:
+            queue.put_nowait(progress)
+        workers = min(1 if single_writer else self.workers, len(pending))
+
+        started = time.perf_counter()
+        status = BillingRunStatus.FAILED
+        error: Optional[str] = None
+        reporter = asyncio.create_task(self._report_progress(run, started))
+        tasks = [asyncio.create_task(self._worker(run, queue)) for _ in range(workers)]
+        try:
+            if tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+            status = BillingRunStatus.COMPLETED
+        except asyncio.CancelledError:
+            status = BillingRunStatus.INTERRUPTED
+            raise
+        except Exception as exc:
+            error = str(exc)
+            raise
+        finally:
+            for task in (*tasks, reporter):
+                task.cancel()
+            await asyncio.gather(*tasks, reporter, return_exceptions=True)
+            report = BillingReport(
+                run_id=run.id,
+                period=run.period,
+                status=status,
+                institutions=len(pending),
+                invoices=self._invoices,
+                lines=self._lines,
+                elapsed=time.perf_counter() - started,
+            )
+            async with self.session_factory() as session:
+                await InvoiceRepository(session).set_run_status(run.id, status, error)
+            log = logger.info if status is BillingRunStatus.COMPLETED else logger.warning
+            log("%s", report)
+        return report
+
+    async def _worker(self, run: BillingRun, queue: "asyncio.Queue[BillingProgress]") -> None:
+        while not queue.empty():
+            progress = queue.get_nowait()
+            done = False
+            while not done:
+                chunk_started = time.perf_counter()
+                async with self.session_factory() as session:
+                    result = await InvoiceRepository(session).bill_chunk(
+                        run.id, progress.institution_id, self.chunk_size
+                    )
+                BILLING_CHUNK_SECONDS.observe(time.perf_counter() - chunk_started)
+                BILLING_INVOICES.inc(result.invoices)
+                BILLING_LINES.inc(result.lines)
+                self._invoices += result.invoices
+                self._lines += result.lines
+                done = result.done
+
+    async def _report_progress(self, run: BillingRun, started: float) -> None:
+        if self.progress_interval <= 0:
+            return
+        remaining = sum(max(p.students - p.invoices, 0) for p in run.institutions)
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "billing %s: %d/%d invoices (%.0f/s)",
+                f"{run.period:%Y-%m}",
+                self._invoices,
+                remaining,
+                self._invoices / elapsed if elapsed else 0.0,
+            )
+
+
+# ---------------------------------------------------------------------
+# RUNS STARTED FROM THE API
+# ---------------------------------------------------------------------
+# Period -> its run's task, or a placeholder future while it is prepared
+_RUNNING: Dict[date, asyncio.Future] = {}
+
+
+async def start_billing_run(period: date) -> BillingRun:
+    """
+    Prepare (or resume) the run of `period` and execute it in the
+    background of this process. Raises ConflictError while the period
+    is already being billed (or prepared) here.
+    """
+    if period in _RUNNING:
+        raise ConflictError(f"Billing for {period:%Y-%m} is already running.")
+    # Reserve the period before the first await, so a concurrent request
+    # cannot prepare a second run of it
+    reservation = asyncio.get_running_loop().create_future()
+    _RUNNING[period] = reservation
+    try:
+        job = InvoiceGenerationJob()
+        run = await job.prepare(period)
+        if run.status is BillingRunStatus.COMPLETED:
+            del _RUNNING[period]
+            return run
+        task = asyncio.create_task(job.execute(run))
+    except BaseException:
+        if _RUNNING.get(period) is reservation:
+            del _RUNNING[period]
+        raise
+    finally:
+        reservation.cancel()
+    _RUNNING[period] = task
+    task.add_done_callback(lambda t: _finished(period, t))
+    return run
+
+
+def _finished(period: date, task: asyncio.Future) -> None:
+    if _RUNNING.get(period) is task:
+        del _RUNNING[period]
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Billing run for %s failed: %r", f"{period:%Y-%m}", task.exception())
+
+
+async def stop_billing_runs() -> None:
+    """
+    Cancel runs started from the API (shutdown). Each is marked
+    interrupted at its last committed chunk and resumes from there.
+    """
+    tasks: List[asyncio.Future] = list(_RUNNING.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
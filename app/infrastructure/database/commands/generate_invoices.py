@@ -0,0 +1,59 @@
+"""
+Generate the invoices of a billing period (one per active student).
+
+Running a period again resumes its unfinished run from the last
+checkpoint; once a run completed, it only bills students added since:
+
+    python -m app.infrastructure.database.commands.generate_invoices 2026-11
+    python -m app.infrastructure.database.commands.generate_invoices 2026-11 \\
+        --workers 8 --chunk-size 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import uuid
+
+from app.core.entities.invoice import billing_period
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.billing import BillingReport, InvoiceGenerationJob
+
+
+async def generate(
+    period: str,
+    run_id=None,
+    workers=None,
+    chunk_size=None,
+) -> BillingReport:
+    db_session.get_async_engine()
+    try:
+        job = InvoiceGenerationJob(workers=workers, chunk_size=chunk_size)
+        return await job.run(billing_period(period), run_id)
+    finally:
+        await db_session.dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("period", help="month to bill, YYYY-MM")
+    parser.add_argument(
+        "--run", type=uuid.UUID, dest="run_id",
+        help="resume this run instead of the period's latest unfinished one",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="institutions billed concurrently (default: BILLING_WORKERS)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="students per transaction/checkpoint (default: BILLING_CHUNK_SIZE)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # The job logs progress and its throughput report
+    asyncio.run(generate(args.period, args.run_id, args.workers, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Recompute grade_aggregates from the grades table.
+
+Aggregates are maintained incrementally by GradeRepository; run this
+after bulk imports that bypass the repository, after restoring grades,
+or to repair drift:
+
+    python -m app.infrastructure.database.commands.rebuild_grade_aggregates
+    python -m app.infrastructure.database.commands.rebuild_grade_aggregates \\
+        --student 1c9e... --student 7f20... --batch-size 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.repositories.grade_repository import GradeRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild(student_ids=None, batch_size: int = 1000) -> int:
+    db_session.get_async_engine()
+    try:
+        async with db_session.async_session() as session:
+            repo = GradeRepository(session)
+            repo.bulk_batch_size = batch_size
+            return await repo.rebuild_aggregates(student_ids)
+    finally:
+        await db_session.dispose_engines()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--student", action="append", type=uuid.UUID, dest="students",
+        help="only rebuild this student (repeatable); default: everyone",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000,
+        help="students recomputed per statement/transaction (default: 1000)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    rows = asyncio.run(rebuild(args.students, args.batch_size))
+    elapsed = time.perf_counter() - start
+    logger.info("Rebuilt %d aggregate row(s) in %.2fs", rows, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.settings import settings
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.session import ReplicaSet
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseHealthMonitor:
+    """
+    Background database readiness check.
+
+    A task runs `SELECT 1` on a pooled connection every `interval`
+    seconds and stores the outcome together with pool occupancy.
+    Probes only read the last snapshot, so they never touch the pool
+    and never block on a slow database.
+    """
+
+    def __init__(
+        self,
+        engine_getter: Callable[[], AsyncEngine] = db_session.get_async_engine,
+        replica_getter: Callable[[], Optional[ReplicaSet]] = db_session.get_replica_set,
+        *,
+        interval: float = 5.0,
+        timeout: float = 2.0,
+        saturation_threshold: float = 1.0,
+    ):
+        self._engine_getter = engine_getter
+        self._replica_getter = replica_getter
+        self.interval = interval
+        self.timeout = timeout
+        self.saturation_threshold = saturation_threshold
+        self._task: Optional[asyncio.Task] = None
+        self._snapshot: Dict[str, Any] = {"status": "starting"}
+        self._checked_at: Optional[float] = None
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="db-health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check_once()
+            except Exception as exc:  # keep probing; never kill the loop
+                logger.exception("Health monitor iteration failed: %r", exc)
+            await asyncio.sleep(self.interval)
+
+    # -------------------------
+    # Checks
+    # -------------------------
+    async def check_once(self) -> Dict[str, Any]:
+        engine = self._engine_getter()
+        snapshot: Dict[str, Any] = {}
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._ping(engine), timeout=self.timeout)
+            snapshot["database"] = "ok"
+            snapshot["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        except Exception as exc:
+            snapshot["database"] = "error"
+            if settings.APP_DEBUG:
+                snapshot["detail"] = str(exc) or type(exc).__name__
+            logger.warning("Database health check failed: %r", exc)
+
+        pool = db_session.pool_stats(engine)
+        if pool:
+            snapshot["pool"] = pool
+
+        replicas = self._replica_getter()
+        if replicas is not None:
+            try:
+                snapshot["replicas"] = await asyncio.wait_for(
+                    replicas.check_health(), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                snapshot["replicas"] = "timeout"
+
+        saturated = bool(pool) and pool["saturation"] >= self.saturation_threshold
+        snapshot["status"] = (
+            "ready" if snapshot["database"] == "ok" and not saturated else "unavailable"
+        )
+        if saturated:
+            snapshot["reason"] = "connection pool saturated"
+
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        return snapshot
+
+    @staticmethod
+    async def _ping(engine: AsyncEngine) -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # -------------------------
+    # Probe view
+    # -------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Last known state. Stale results (checker stuck or not running)
+        are reported as unavailable.
+        """
+        snapshot = dict(self._snapshot)
+        if self._checked_at is None:
+            return snapshot
+        age = time.monotonic() - self._checked_at
+        snapshot["age_seconds"] = round(age, 2)
+        if age > self.interval * 3 + self.timeout:
+            snapshot["status"] = "unavailable"
+            snapshot["reason"] = "health check is stale"
+        return snapshot
+
+    @property
+    def is_ready(self) -> bool:
+        return self.snapshot()["status"] == "ready"
+
+
+# ---------------------------------------------------------------------
+# PROCESS-WIDE MONITOR
+# ---------------------------------------------------------------------
+_HEALTH_MONITOR: DatabaseHealthMonitor | None = None
+
+
+def get_health_monitor() -> DatabaseHealthMonitor:
+    """Lazy-initialize the process-wide health monitor."""
+    global _HEALTH_MONITOR
+
+    if _HEALTH_MONITOR is None:
+        _HEALTH_MONITOR = DatabaseHealthMonitor(
+            interval=settings.HEALTH_CHECK_INTERVAL,
+            timeout=settings.HEALTH_CHECK_TIMEOUT,
+            saturation_threshold=settings.HEALTH_POOL_SATURATION_THRESHOLD,
+        )
+    return _HEALTH_MONITOR
@@ -0,0 +1,40 @@
+import uuid
+
+from sqlalchemy import Column, Date, DateTime, Index, SmallInteger, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.base import Base, TimestampMixin
+
+
+class AttendanceRecord(TimestampMixin, Base):
+    """
+    Attendance mark per student, class day and period.
+
+    Highest-write table of the platform: rows are written in bulk by
+    AttendanceRepository.bulk_upsert(), so it carries a single secondary
+    index, the (student_id, session_date, period) key upserts conflict on.
+    """
+
+    __tablename__ = "attendance_records"
+
+    # No extra index on id (unlike UUIDPrimaryKeyMixin): the primary key
+    # already covers lookups and every index slows down the bulk writes
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    student_id = Column(UUID(as_uuid=True), nullable=False)
+    session_date = Column(Date, nullable=False)
+    period = Column(SmallInteger, default=0, server_default="0", nullable=False)
+    status = Column(String(16), nullable=False)
+    note = Column(String(255), nullable=True)
+    recorded_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # Upsert conflict target; its (student_id, session_date) prefix
+        # also serves per-student and per-student-per-day queries
+        Index(
+            "ix_attendance_records_student_session",
+            "student_id",
+            "session_date",
+            "period",
+            unique=True,
+        ),
+    )
@@ -0,0 +1,63 @@
+import uuid
+
+from sqlalchemy import Column, DateTime, Index, Integer, Numeric, String, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.base import Base, TimestampMixin
+
+
+class GradeRecord(TimestampMixin, Base):
+    """
+    One assessment score. `percent` is stored (not derived on read) so
+    the aggregates below can be rebuilt from exactly the same values
+    they were incrementally maintained with.
+    """
+
+    __tablename__ = "grades"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    student_id = Column(UUID(as_uuid=True), nullable=False)
+    course_id = Column(UUID(as_uuid=True), nullable=False)
+    assessment = Column(String(100), nullable=False)
+    score = Column(Numeric(8, 2), nullable=False)
+    max_score = Column(Numeric(8, 2), nullable=False)
+    weight = Column(Numeric(8, 2), nullable=False)
+    percent = Column(Numeric(5, 2), nullable=False)
+    graded_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # Re-grading an assessment replaces the row
+        Index(
+            "ix_grades_student_course_assessment",
+            "student_id",
+            "course_id",
+            "assessment",
+            unique=True,
+        ),
+    )
+
+
+class GradeAggregate(Base):
+    """
+    Running totals per (student, course), maintained in the same
+    transaction as every grade write by GradeRepository and rebuildable
+    with `python -m app.infrastructure.database.commands.rebuild_grade_aggregates`.
+
+    Report cards read one row per course instead of every grade.
+    """
+
+    __tablename__ = "grade_aggregates"
+
+    student_id = Column(UUID(as_uuid=True), primary_key=True)
+    course_id = Column(UUID(as_uuid=True), primary_key=True)
+    grade_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # sum(weight), sum(weight * percent), sum(percent)
+    weight_sum = Column(Numeric(14, 2), default=0, server_default="0", nullable=False)
+    weighted_sum = Column(Numeric(18, 4), default=0, server_default="0", nullable=False)
+    percent_sum = Column(Numeric(14, 2), default=0, server_default="0", nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
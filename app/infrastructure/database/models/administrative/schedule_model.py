@@ -0,0 +1,79 @@
+import uuid
+
+from sqlalchemy import DDL, CheckConstraint, Column, DateTime, Index, event, func
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
+
+from app.infrastructure.database.base import Base, TimestampMixin
+
+
+def _not_postgresql(ddl, target, bind, **kw) -> bool:
+    return kw["dialect"].name != "postgresql"
+
+
+def _overlap_constraint_name(resource: str) -> str:
+    return f"ex_schedule_entries_{resource}_overlap"
+
+
+def _no_overlap(resource: str) -> ExcludeConstraint:
+    """
+    PostgreSQL: reject two rows booking `resource` over overlapping
+    [starts_at, ends_at) ranges (needs the btree_gist extension). Its
+    GiST index also serves the overlap lookups of ScheduleRepository.
+
+    Deferred to the end of the transaction (or SET CONSTRAINTS ...
+    IMMEDIATE), so a timetable that swaps two slots is not rejected
+    for the moment between its row updates.
+    """
+    return ExcludeConstraint(
+        (f"{resource}_id", "="),
+        (func.tstzrange(Column("starts_at"), Column("ends_at"), "[)"), "&&"),
+        name=_overlap_constraint_name(resource),
+        using="gist",
+        deferrable=True,
+        initially="DEFERRED",
+    ).ddl_if(dialect="postgresql")
+
+
+def _by_start(resource: str) -> Index:
+    """Portable fallback lookup index where exclusion constraints do not exist."""
+    return Index(
+        f"ix_schedule_entries_{resource}_starts", f"{resource}_id", "starts_at"
+    ).ddl_if(callable_=_not_postgresql)
+
+
+class ScheduleEntryRecord(TimestampMixin, Base):
+    """
+    Booked class session. On PostgreSQL double bookings of a room,
+    teacher or group are impossible at the database level; on other
+    databases ScheduleRepository checks before writing.
+    """
+
+    __tablename__ = "schedule_entries"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    room_id = Column(UUID(as_uuid=True), nullable=False)
+    teacher_id = Column(UUID(as_uuid=True), nullable=True)
+    group_id = Column(UUID(as_uuid=True), nullable=True)
+    course_id = Column(UUID(as_uuid=True), nullable=True)
+    starts_at = Column(DateTime(timezone=True), nullable=False)
+    ends_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("ends_at > starts_at", name="valid_period"),
+        _no_overlap("room"),
+        _no_overlap("teacher"),
+        _no_overlap("group"),
+        _by_start("room"),
+        _by_start("teacher"),
+        _by_start("group"),
+    )
+
+
+# `=` on UUID columns inside a GiST exclusion constraint needs btree_gist
+event.listen(
+    ScheduleEntryRecord.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
+
+OVERLAP_CONSTRAINTS = tuple(_overlap_constraint_name(r) for r in ("room", "teacher", "group"))
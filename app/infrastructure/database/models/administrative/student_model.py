@@ -0,0 +1,60 @@
+import uuid
+
+from sqlalchemy import DDL, Boolean, Column, Computed, Index, String, event, func, literal_column, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.base import Base, TimestampMixin
+
+# Same expression as app.core.entities.student.search_text()
+SEARCH_TEXT = "lower(last_name || ' ' || first_name || ' ' || student_number)"
+
+
+class StudentRecord(TimestampMixin, Base):
+    """
+    Student roster row. `search_text` is a stored generated column, so
+    the search indexes below stay current on every write without
+    triggers or application code:
+
+    - ix_students_search_text: (search_text, id) btree, the ordering and
+      keyset of autocomplete pages (all databases)
+    - ix_students_search_trgm: pg_trgm GIN for similarity / substring
+      matches (PostgreSQL)
+    - ix_students_search_vector: GIN over to_tsvector('simple',
+      search_text) for word-prefix matches (PostgreSQL)
+    """
+
+    __tablename__ = "students"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    institution_id = Column(UUID(as_uuid=True), nullable=True)
+    student_number = Column(String(32), nullable=False)
+    first_name = Column(String(100), nullable=False)
+    last_name = Column(String(100), nullable=False)
+    email = Column(String(255), nullable=True)
+    active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+    search_text = Column(String(240), Computed(SEARCH_TEXT, persisted=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_students_student_number", "student_number", unique=True),
+        Index("ix_students_search_text", "search_text", "id"),
+        # Billing walks each institution's students in id order
+        Index("ix_students_institution", "institution_id", "id"),
+        Index(
+            "ix_students_search_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_students_search_vector",
+            func.to_tsvector(literal_column("'simple'"), literal_column("search_text")),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+event.listen(
+    StudentRecord.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
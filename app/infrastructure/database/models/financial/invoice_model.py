@@ -0,0 +1,117 @@
+import uuid
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.base import Base, TimestampMixin
+
+
+class FeeRecord(TimestampMixin, Base):
+    """Monthly charge of an institution, billed to each of its active students."""
+
+    __tablename__ = "fees"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    institution_id = Column(UUID(as_uuid=True), nullable=False)
+    code = Column(String(50), nullable=False)
+    description = Column(String(255), nullable=False)
+    amount = Column(Numeric(12, 2), nullable=False)
+    active = Column(Boolean, nullable=False, default=True, server_default=text("true"))
+
+    __table_args__ = (
+        Index("ix_fees_institution_code", "institution_id", "code", unique=True),
+    )
+
+
+class InvoiceRecord(TimestampMixin, Base):
+    """
+    One student's bill for one month. (student_id, period) is unique,
+    so re-running or resuming billing never invoices a student twice.
+    """
+
+    __tablename__ = "invoices"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    institution_id = Column(UUID(as_uuid=True), nullable=False)
+    student_id = Column(UUID(as_uuid=True), nullable=False)
+    period = Column(Date, nullable=False)
+    status = Column(String(20), nullable=False)
+    total = Column(Numeric(12, 2), nullable=False)
+    issued_at = Column(DateTime(timezone=True), nullable=False)
+    billing_run_id = Column(UUID(as_uuid=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_invoices_student_period", "student_id", "period", unique=True),
+        Index("ix_invoices_institution_period", "institution_id", "period"),
+    )
+
+
+class InvoiceLineRecord(Base):
+    """Line item of an invoice, one per fee; written set-wise from `fees`."""
+
+    __tablename__ = "invoice_lines"
+
+    invoice_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("invoices.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    fee_id = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
+    description = Column(String(255), nullable=False)
+    amount = Column(Numeric(12, 2), nullable=False)
+
+
+class BillingRunRecord(Base):
+    """
+    Invoice generation run for one month. Totals are summed from the
+    checkpoints when the run finishes.
+    """
+
+    __tablename__ = "billing_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    period = Column(Date, nullable=False, index=True)
+    status = Column(String(20), nullable=False)
+    invoices = Column(Integer, nullable=False, default=0)
+    lines = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    error = Column(Text, nullable=True)
+
+
+class BillingCheckpointRecord(Base):
+    """
+    Progress of one institution within a run: students are billed in
+    id order, and `last_student_id` advances in the same transaction as
+    each chunk of invoices, so a resumed run starts right after it.
+    """
+
+    __tablename__ = "billing_checkpoints"
+
+    run_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("billing_runs.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    institution_id = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
+    students = Column(Integer, nullable=False)
+    invoices = Column(Integer, nullable=False, default=0)
+    lines = Column(Integer, nullable=False, default=0)
+    last_student_id = Column(UUID(as_uuid=True), nullable=True)
+    done = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.common.events import DomainEvent
+from app.infrastructure.database.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class OutboxMessage(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    """
+    Domain event waiting to be relayed (transactional outbox).
+
+    Rows are inserted in the same transaction as the aggregate change
+    that produced the event and picked up later by the OutboxRelay.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    event_type = Column(String(255), nullable=False)
+    payload = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    # Not claimable before this instant (retry backoff)
+    available_at = Column(
+        DateTime(timezone=True),
+        default=_utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    last_error = Column(Text, nullable=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Only pending rows are scanned by the relay; keep that index small
+        Index(
+            "ix_outbox_messages_pending",
+            "available_at",
+            "created_at",
+            postgresql_where=published_at.is_(None),
+            sqlite_where=published_at.is_(None),
+        ),
+    )
+
+    @classmethod
+    def from_event(cls, event: DomainEvent) -> "OutboxMessage":
+        return cls(
+            id=event.event_id,
+            event_type=event.event_name,
+            payload=event.to_dict(),
+            occurred_at=event.occurred_at,
+        )
+
+    def to_event(self) -> DomainEvent | None:
+        """Rebuild the event, or None when its class is not loaded here."""
+        event_cls = DomainEvent.resolve(self.event_type)
+        return event_cls.from_dict(self.payload) if event_cls else None
@@ -0,0 +1,224 @@
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Iterable, Optional, Sequence
+import asyncio
+import logging
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.events import DomainEvent, EventBus, event_bus
+from app.common.metrics import metrics
+from app.config.settings import settings
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.models.outbox_model import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+Publisher = Callable[[Sequence[OutboxMessage]], Awaitable[None]]
+
+OUTBOX_RELAYED = metrics.counter("outbox_relayed_total", "Outbox messages published.")
+OUTBOX_FAILED = metrics.counter("outbox_failed_total", "Outbox publish attempts that failed.")
+OUTBOX_BATCH_SECONDS = metrics.histogram(
+    "outbox_batch_seconds", "Time to claim, publish and mark one outbox batch."
+)
+
+
+def enqueue_events(session: AsyncSession, events: Iterable[DomainEvent]) -> int:
+    """
+    Stage outbox rows for `events` on `session`.
+
+    Nothing is written until the caller commits, so the events become
+    visible to the relay exactly when the business change does.
+    """
+    messages = [OutboxMessage.from_event(e) for e in events]
+    session.add_all(messages)
+    return len(messages)
+
+
+def event_bus_publisher(bus: EventBus = event_bus) -> Publisher:
+    """
+    Publisher that rebuilds the events and runs the bus handlers on them.
+
+    It awaits EventBus.dispatch() rather than publish(): the relay only
+    marks a row published once its handlers have finished, so a crash
+    mid-delivery leaves the row to be retried (at-least-once).
+    """
+
+    async def publish(messages: Sequence[OutboxMessage]) -> None:
+        events = []
+        for message in messages:
+            event = message.to_event()
+            if event is None:
+                logger.warning("No event class registered for %r; skipping.", message.event_type)
+                continue
+            events.append(event)
+        await bus.dispatch(events)
+
+    return publish
+
+
+class OutboxRelay:
+    """
+    Drains the outbox table.
+
+    Each iteration claims up to `batch_size` pending rows with
+    `SELECT ... FOR UPDATE SKIP LOCKED` and leases them by pushing
+    `available_at` forward by `claim_timeout`, then commits. Publishing
+    happens outside any transaction, so a slow publisher never holds
+    row locks; other relays simply skip leased rows. Rows are marked
+    published in a second transaction only after the publisher
+    returns. A relay that dies mid-batch leaves its rows to be claimed
+    again once the lease expires, so delivery is at-least-once and
+    handlers should be idempotent (event_id is stable across retries).
+    Failed batches are retried with exponential backoff until
+    `max_attempts` is reached.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        publisher: Optional[Publisher] = None,
+        *,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        max_backoff: float = 300.0,
+        claim_timeout: float = 60.0,
+        concurrency: int = 1,
+    ):
+        self._session_factory = session_factory
+        self.publisher = publisher or event_bus_publisher()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self.claim_timeout = claim_timeout
+        self.concurrency = concurrency
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is not None:
+            return self._session_factory
+        # Resolved per call: the runtime factory is rebuilt after dispose_engines()
+        if db_session.async_session is None:
+            db_session.get_async_engine()
+        return db_session.async_session
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    def start(self) -> None:
+        if self._tasks:
+            return
+        for index in range(self.concurrency):
+            self._tasks.append(
+                asyncio.create_task(self._run(), name=f"outbox-relay:{index}")
+            )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception as exc:  # keep relaying; never kill the loop
+                logger.exception("Outbox relay iteration failed: %r", exc)
+                relayed = 0
+            # A full batch means there is probably more work waiting
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    # -------------------------
+    # Relay
+    # -------------------------
+    async def relay_once(self) -> int:
+        """Claim, publish and mark one batch. Returns the rows published."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        now = datetime.now(timezone.utc)
+
+        async with self.session_factory() as session:
+            # 1. Claim: lock, lease and commit, releasing the row locks
+            async with session.begin():
+                stmt = (
+                    select(OutboxMessage)
+                    .where(
+                        OutboxMessage.published_at.is_(None),
+                        OutboxMessage.available_at <= now,
+                        OutboxMessage.attempts < self.max_attempts,
+                    )
+                    .order_by(OutboxMessage.available_at, OutboxMessage.created_at)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                messages = list((await session.scalars(stmt)).all())
+                if not messages:
+                    return 0
+                lease = now + timedelta(seconds=self.claim_timeout)
+                for message in messages:
+                    message.attempts += 1
+                    message.available_at = lease
+
+            # 2. Publish with no transaction open
+            try:
+                await self.publisher(messages)
+            except Exception as exc:
+                OUTBOX_FAILED.inc()
+                logger.warning("Outbox publish failed for %d message(s): %r", len(messages), exc)
+                async with session.begin():
+                    retry_at = datetime.now(timezone.utc)
+                    for message in messages:
+                        message.last_error = str(exc) or type(exc).__name__
+                        message.available_at = retry_at + timedelta(
+                            seconds=min(2 ** message.attempts, self.max_backoff)
+                        )
+                return 0
+
+            # 3. Mark published only after the handlers have finished
+            async with session.begin():
+                published_at = datetime.now(timezone.utc)
+                for message in messages:
+                    message.published_at = published_at
+
+        OUTBOX_RELAYED.inc(len(messages))
+        OUTBOX_BATCH_SECONDS.observe(loop.time() - start)
+        return len(messages)
+
+    async def purge_published(self, older_than: timedelta = timedelta(days=7)) -> int:
+        """Delete rows published before `older_than` ago."""
+        cutoff = datetime.now(timezone.utc) - older_than
+        async with self.session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    delete(OutboxMessage).where(
+                        OutboxMessage.published_at.is_not(None),
+                        OutboxMessage.published_at < cutoff,
+                    )
+                )
+        return result.rowcount or 0
+
+
+# ---------------------------------------------------------------------
+# PROCESS-WIDE RELAY
+# ---------------------------------------------------------------------
+_OUTBOX_RELAY: OutboxRelay | None = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """Lazy-initialize the process-wide outbox relay."""
+    global _OUTBOX_RELAY
+
+    if _OUTBOX_RELAY is None:
+        _OUTBOX_RELAY = OutboxRelay(
+            batch_size=settings.OUTBOX_BATCH_SIZE,
+            poll_interval=settings.OUTBOX_POLL_INTERVAL,
+            max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+            claim_timeout=settings.OUTBOX_CLAIM_TIMEOUT,
+            concurrency=settings.OUTBOX_RELAY_CONCURRENCY,
+        )
+    return _OUTBOX_RELAY
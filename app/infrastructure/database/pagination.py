@@ -0,0 +1,77 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, List, Sequence, Tuple
+
+from app.common.exceptions import ValidationError
+
+
+# ------------------------------------------------------------
+# Opaque cursor codec
+# ------------------------------------------------------------
+# Cursors carry the sort key of the last row of a page. They are
+# base64url-encoded JSON so clients treat them as opaque tokens, and
+# each value is tagged with its type so UUIDs/dates round-trip exactly.
+
+def _encode_value(value: Any) -> List[Any]:
+    if value is None:
+        return ["n", None]
+    if isinstance(value, bool):
+        return ["b", value]
+    if isinstance(value, uuid.UUID):
+        return ["u", str(value)]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, time):
+        return ["t", value.isoformat()]
+    if isinstance(value, Decimal):
+        return ["dec", str(value)]
+    if isinstance(value, (int, float, str)):
+        return ["v", value]
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(tagged: Sequence[Any]) -> Any:
+    tag, raw = tagged
+    if tag == "n":
+        return None
+    if tag in ("b", "v"):
+        return raw
+    if tag == "u":
+        return uuid.UUID(raw)
+    if tag == "dt":
+        return datetime.fromisoformat(raw)
+    if tag == "d":
+        return date.fromisoformat(raw)
+    if tag == "t":
+        return time.fromisoformat(raw)
+    if tag == "dec":
+        return Decimal(raw)
+    raise ValueError(f"Unknown cursor tag: {tag}")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort-key values of a row into an opaque cursor string.
+    """
+    payload = json.dumps(
+        [_encode_value(v) for v in values], separators=(",", ":")
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+    Raises ValidationError for malformed or tampered cursors.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return tuple(_decode_value(item) for item in payload)
+    except Exception as exc:
+        raise ValidationError("Invalid pagination cursor.") from exc
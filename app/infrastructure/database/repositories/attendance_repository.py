@@ -0,0 +1,176 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.exceptions import InfrastructureError
+from app.config.settings import settings
+from app.core.entities.attendance import AttendanceMark, AttendanceStatus
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.batch_writer import BatchWriter
+from app.infrastructure.database.models.academic.attendance_model import AttendanceRecord
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+    _chunks,
+)
+from app.infrastructure.database.session import REPLICA_OK
+
+CONFLICT_COLUMNS = ("student_id", "session_date", "period")
+UPDATE_COLUMNS = ("status", "note", "recorded_at")
+
+
+class AttendanceRepository(SQLAlchemyRepository[AttendanceMark, AttendanceRecord, uuid.UUID]):
+    model_cls = AttendanceRecord
+    bulk_batch_size = 5000
+
+    @staticmethod
+    def to_domain(model: AttendanceRecord) -> AttendanceMark:
+        return AttendanceMark(
+            id=model.id,
+            student_id=model.student_id,
+            session_date=model.session_date,
+            period=model.period,
+            status=AttendanceStatus(model.status),
+            note=model.note,
+            recorded_at=model.recorded_at,
+        )
+
+    @staticmethod
+    def to_model(entity: AttendanceMark) -> AttendanceRecord:
+        return AttendanceRecord(
+            id=entity.id,
+            student_id=entity.student_id,
+            session_date=entity.session_date,
+            period=entity.period,
+            status=entity.status.value,
+            note=entity.note,
+            recorded_at=entity.recorded_at,
+        )
+
+    # ------------------------------------------
+    # BULK UPSERT (ingestion path)
+    # ------------------------------------------
+    async def bulk_upsert(self, marks: Sequence[AttendanceMark]) -> int:
+        """
+        Insert-or-update marks on (student_id, session_date, period).
+
+        Unlike upsert_many() this skips ORM objects and RETURNING: rows
+        go straight from the entities into one cached INSERT ... ON
+        CONFLICT statement executed as executemany per chunk. Rows are
+        sorted by key so concurrent writers lock them in the same order.
+        Returns the number of marks written.
+        """
+        if not marks:
+            return 0
+        stmt = self._upsert_statement()
+        rows = [self._row(m) for m in sorted(marks, key=_mark_key)]
+        try:
+            for chunk in _chunks(rows, self.bulk_batch_size):
+                await self.session.execute(stmt, list(chunk))
+            await self._commit()
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+        return len(rows)
+
+    # ------------------------------------------
+    # QUERIES
+    # ------------------------------------------
+    async def for_student(
+        self, student_id: uuid.UUID, start: date, end: date
+    ) -> List[AttendanceMark]:
+        """Marks of one student between two dates (inclusive)."""
+        stmt = (
+            select(AttendanceRecord)
+            .where(
+                AttendanceRecord.student_id == student_id,
+                AttendanceRecord.session_date.between(start, end),
+            )
+            .order_by(AttendanceRecord.session_date, AttendanceRecord.period)
+            .execution_options(**REPLICA_OK)
+        )
+        result = await self.session.scalars(stmt)
+        return [self.to_domain(m) for m in result]
+
+    # ------------------------------------------
+    # Internal helpers
+    # ------------------------------------------
+    def _upsert_statement(self):
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            insert_fn = postgresql.insert
+        elif dialect_name == "sqlite":
+            insert_fn = sqlite.insert
+        else:
+            raise InfrastructureError(f"Bulk upsert is not supported on {dialect_name}.")
+        # Core insert on the table: executemany without ORM bulk bookkeeping
+        stmt = insert_fn(AttendanceRecord.__table__)
+        set_ = {name: stmt.excluded[name] for name in UPDATE_COLUMNS}
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(index_elements=list(CONFLICT_COLUMNS), set_=set_)
+
+    @staticmethod
+    def _row(mark: AttendanceMark) -> Dict[str, Any]:
+        return {
+            "id": mark.id,
+            "student_id": mark.student_id,
+            "session_date": mark.session_date,
+            "period": mark.period,
+            "status": mark.status.value,
+            "note": mark.note,
+            "recorded_at": mark.recorded_at,
+        }
+
+    # ------------------------------------------
+    # Write-behind queue
+    # ------------------------------------------
+    @classmethod
+    def bulk_writer(
+        cls,
+        session_factory: Optional[async_sessionmaker] = None,
+        **options: Any,
+    ) -> BatchWriter[AttendanceMark]:
+        """
+        BatchWriter that coalesces marks by key and flushes them with
+        bulk_upsert(), one session and one commit per flush.
+        """
+
+        async def flush(marks: List[AttendanceMark]) -> int:
+            factory = session_factory or _runtime_session_factory()
+            async with factory() as session:
+                return await cls(session).bulk_upsert(marks)
+
+        return BatchWriter("attendance", flush, key=_mark_key, **options)
+
+
+def _mark_key(mark: AttendanceMark):
+    return mark.key
+
+
+def _runtime_session_factory() -> async_sessionmaker[AsyncSession]:
+    # Resolved per flush: the runtime factory is rebuilt after dispose_engines()
+    if db_session.async_session is None:
+        db_session.get_async_engine()
+    return db_session.async_session
+
+
+# ---------------------------------------------------------------------
+# PROCESS-WIDE WRITER
+# ---------------------------------------------------------------------
+_ATTENDANCE_WRITER: BatchWriter[AttendanceMark] | None = None
+
+
+def get_attendance_writer() -> BatchWriter[AttendanceMark]:
+    """Lazy-initialize the process-wide attendance write queue."""
+    global _ATTENDANCE_WRITER
+
+    if _ATTENDANCE_WRITER is None:
+        _ATTENDANCE_WRITER = AttendanceRepository.bulk_writer(
+            max_batch_size=settings.ATTENDANCE_FLUSH_SIZE,
+            flush_interval=settings.ATTENDANCE_FLUSH_INTERVAL,
+            max_pending=settings.ATTENDANCE_MAX_PENDING,
+        )
+    return _ATTENDANCE_WRITER
@@ -0,0 +1,365 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import uuid
+
+from sqlalchemy import bindparam, delete, func, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.common.events import DomainEvent
+from app.common.exceptions import InfrastructureError
+from app.core.entities.grade import CourseAverage, Grade
+from app.infrastructure.database.models.academic.grade_model import (
+    GradeAggregate,
+    GradeRecord,
+)
+from app.infrastructure.database.outbox import enqueue_events
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+    _chunks,
+)
+from app.infrastructure.database.session import REPLICA_OK
+
+Pair = Tuple[uuid.UUID, uuid.UUID]   # (student_id, course_id)
+
+_grades = GradeRecord.__table__
+_aggregates = GradeAggregate.__table__
+
+
+class _Delta:
+    """Change to apply to one aggregate row."""
+
+    __slots__ = ("count", "weight", "weighted", "percent")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.weight = Decimal(0)
+        self.weighted = Decimal(0)
+        self.percent = Decimal(0)
+
+    def add(self, weight: Decimal, percent: Decimal, sign: int) -> None:
+        self.count += sign
+        self.weight += sign * weight
+        self.weighted += sign * weight * percent
+        self.percent += sign * percent
+
+
+class GradeRepository(SQLAlchemyRepository[Grade, GradeRecord, uuid.UUID]):
+    """
+    Grades plus their per-(student, course) aggregates.
+
+    Every write goes through save_grades()/delete_many(), which lock the
+    affected aggregate rows first, compute the difference against the
+    stored grades and apply it as increments in the same transaction.
+    Aggregates therefore never need a full recompute on read; use
+    rebuild_aggregates() only to repair or backfill them.
+    """
+
+    model_cls = GradeRecord
+
+    @staticmethod
+    def to_domain(model: GradeRecord) -> Grade:
+        return Grade(
+            id=model.id,
+            student_id=model.student_id,
+            course_id=model.course_id,
+            assessment=model.assessment,
+            score=model.score,
+            max_score=model.max_score,
+            weight=model.weight,
+            graded_at=model.graded_at,
+        )
+
+    @staticmethod
+    def to_model(entity: Grade) -> GradeRecord:
+        return GradeRecord(
+            id=entity.id,
+            student_id=entity.student_id,
+            course_id=entity.course_id,
+            assessment=entity.assessment,
+            score=entity.score,
+            max_score=entity.max_score,
+            weight=entity.weight,
+            percent=entity.percent,
+            graded_at=entity.graded_at,
+        )
+
+    # ------------------------------------------
+    # WRITES (grades + aggregates, one transaction)
+    # ------------------------------------------
+    async def save(self, entity: Grade, events: Sequence[DomainEvent] = ()) -> Grade:
+        return (await self.save_grades([entity], events))[0]
+
+    async def save_many(self, entities: Sequence[Grade]) -> List[Grade]:
+        return await self.save_grades(entities)
+
+    async def save_grades(
+        self, grades: Sequence[Grade], events: Sequence[DomainEvent] = ()
+    ) -> List[Grade]:
+        """
+        Insert or replace grades (on student, course, assessment) and
+        update their aggregates incrementally. Returns the saved grades;
+        replaced ones keep their original id.
+        """
+        latest = list({g.key: g for g in grades}.values())
+        if not latest:
+            return []
+        try:
+            deltas: Dict[Pair, _Delta] = defaultdict(_Delta)
+            await self._lock_aggregates({(g.student_id, g.course_id) for g in latest})
+            stored = await self._stored_grades([g.key for g in latest])
+
+            for grade in latest:
+                deltas[(grade.student_id, grade.course_id)].add(grade.weight, grade.percent, 1)
+                old = stored.get(grade.key)
+                if old is not None:
+                    grade.id = old.id
+                    deltas[(grade.student_id, grade.course_id)].add(old.weight, old.percent, -1)
+
+            await self.session.execute(self._upsert_statement(), [self._row(g) for g in latest])
+            await self._apply(deltas)
+            enqueue_events(self.session, [*events])
+            await self._commit()
+            return latest
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    async def delete(self, entity_id: uuid.UUID) -> None:
+        await self.delete_many([entity_id])
+
+    async def delete_many(self, entity_ids: Sequence[uuid.UUID]) -> int:
+        """Delete grades by id and subtract them from their aggregates."""
+        if not entity_ids:
+            return 0
+        try:
+            pairs_stmt = select(_grades.c.student_id, _grades.c.course_id).where(
+                _grades.c.id.in_(list(entity_ids))
+            )
+            pairs = {tuple(row) for row in await self.session.execute(pairs_stmt)}
+            await self._lock_aggregates(pairs)
+
+            # Re-read under the aggregate locks: concurrent writers are serialized now
+            rows = await self.session.execute(
+                delete(_grades)
+                .where(_grades.c.id.in_(list(entity_ids)))
+                .returning(
+                    _grades.c.student_id, _grades.c.course_id, _grades.c.weight, _grades.c.percent
+                )
+            )
+            deltas: Dict[Pair, _Delta] = defaultdict(_Delta)
+            deleted = 0
+            for row in rows:
+                deltas[(row.student_id, row.course_id)].add(row.weight, row.percent, -1)
+                deleted += 1
+            await self._apply(deltas)
+            await self._commit()
+            return deleted
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    # ------------------------------------------
+    # READS
+    # ------------------------------------------
+    async def course_averages(self, student_id: uuid.UUID) -> List[CourseAverage]:
+        """Precomputed averages of a student: one row per course."""
+        stmt = (
+            select(GradeAggregate)
+            .where(GradeAggregate.student_id == student_id, GradeAggregate.grade_count > 0)
+            .order_by(GradeAggregate.course_id)
+            .execution_options(**REPLICA_OK)
+        )
+        result = await self.session.scalars(stmt)
+        return [_to_course_average(row) for row in result]
+
+    # ------------------------------------------
+    # REBUILD (set-based, batched by student)
+    # ------------------------------------------
+    async def rebuild_aggregates(
+        self,
+        student_ids: Optional[Sequence[uuid.UUID]] = None,
+    ) -> int:
+        """
+        Recompute the aggregates of `student_ids` (every student with
+        grades when None) from the grades table with one INSERT ...
+        SELECT ... GROUP BY per batch of `bulk_batch_size` students.
+        Each batch is committed on its own. Returns the rows written.
+        """
+        written = 0
+        if student_ids is not None:
+            for chunk in _chunks(list(student_ids), self.bulk_batch_size):
+                written += await self._rebuild_batch(list(chunk))
+            return written
+
+        after: Optional[uuid.UUID] = None
+        while True:
+            stmt = select(_grades.c.student_id).distinct().order_by(_grades.c.student_id)
+            if after is not None:
+                stmt = stmt.where(_grades.c.student_id > after)
+            chunk = list(await self.session.scalars(stmt.limit(self.bulk_batch_size)))
+            if not chunk:
+                await self._drop_orphan_aggregates()
+                return written
+            written += await self._rebuild_batch(chunk)
+            after = chunk[-1]
+
+    async def _drop_orphan_aggregates(self) -> None:
+        """Remove aggregates of students that no longer have any grade."""
+        try:
+            has_grades = select(_grades.c.id).where(
+                _grades.c.student_id == _aggregates.c.student_id
+            )
+            await self.session.execute(delete(_aggregates).where(~has_grades.exists()))
+            await self._commit()
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    async def _rebuild_batch(self, student_ids: List[uuid.UUID]) -> int:
+        try:
+            await self.session.execute(
+                delete(_aggregates).where(_aggregates.c.student_id.in_(student_ids))
+            )
+            totals = (
+                select(
+                    _grades.c.student_id,
+                    _grades.c.course_id,
+                    func.count(),
+                    func.sum(_grades.c.weight),
+                    func.sum(_grades.c.weight * _grades.c.percent),
+                    func.sum(_grades.c.percent),
+                )
+                .where(_grades.c.student_id.in_(student_ids))
+                .group_by(_grades.c.student_id, _grades.c.course_id)
+            )
+            result = await self.session.execute(
+                _aggregates.insert().from_select(
+                    ["student_id", "course_id", "grade_count", "weight_sum", "weighted_sum", "percent_sum"],
+                    totals,
+                )
+            )
+            await self._commit()
+            return result.rowcount or 0
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    # ------------------------------------------
+    # Internal helpers
+    # ------------------------------------------
+    def _insert_fn(self):
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            return postgresql.insert
+        if dialect_name == "sqlite":
+            return sqlite.insert
+        raise InfrastructureError(f"Grade writes are not supported on {dialect_name}.")
+
+    async def _lock_aggregates(self, pairs) -> None:
+        """
+        Create missing aggregate rows and lock all of them, in key order,
+        so concurrent writers to the same (student, course) serialize.
+        """
+        ordered = sorted(pairs)
+        if not ordered:
+            return
+        stmt = self._insert_fn()(_aggregates).on_conflict_do_nothing(
+            index_elements=["student_id", "course_id"]
+        )
+        await self.session.execute(
+            stmt, [{"student_id": s, "course_id": c} for s, c in ordered]
+        )
+        key = tuple_(_aggregates.c.student_id, _aggregates.c.course_id)
+        for chunk in _chunks(ordered, self.bulk_batch_size):
+            await self.session.execute(
+                select(_aggregates.c.student_id)
+                .where(key.in_(list(chunk)))
+                .order_by(_aggregates.c.student_id, _aggregates.c.course_id)
+                .with_for_update()
+            )
+
+    async def _stored_grades(self, keys) -> Dict[Tuple[uuid.UUID, uuid.UUID, str], Any]:
+        key = tuple_(_grades.c.student_id, _grades.c.course_id, _grades.c.assessment)
+        stored: Dict[Tuple[uuid.UUID, uuid.UUID, str], Any] = {}
+        for chunk in _chunks(keys, self.bulk_batch_size):
+            rows = await self.session.execute(
+                select(
+                    _grades.c.id,
+                    _grades.c.student_id,
+                    _grades.c.course_id,
+                    _grades.c.assessment,
+                    _grades.c.weight,
+                    _grades.c.percent,
+                ).where(key.in_(list(chunk)))
+            )
+            for row in rows:
+                stored[(row.student_id, row.course_id, row.assessment)] = row
+        return stored
+
+    def _upsert_statement(self):
+        stmt = self._insert_fn()(_grades)
+        set_ = {
+            name: stmt.excluded[name]
+            for name in ("score", "max_score", "weight", "percent", "graded_at")
+        }
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(
+            index_elements=["student_id", "course_id", "assessment"], set_=set_
+        )
+
+    @staticmethod
+    def _row(grade: Grade) -> Dict[str, Any]:
+        return {
+            "id": grade.id,
+            "student_id": grade.student_id,
+            "course_id": grade.course_id,
+            "assessment": grade.assessment,
+            "score": grade.score,
+            "max_score": grade.max_score,
+            "weight": grade.weight,
+            "percent": grade.percent,
+            "graded_at": grade.graded_at,
+        }
+
+    async def _apply(self, deltas: Dict[Pair, _Delta]) -> None:
+        changed = [
+            {
+                "b_student": student_id,
+                "b_course": course_id,
+                "d_count": d.count,
+                "d_weight": d.weight,
+                "d_weighted": d.weighted,
+                "d_percent": d.percent,
+            }
+            for (student_id, course_id), d in sorted(deltas.items())
+            if d.count or d.weight or d.weighted or d.percent
+        ]
+        if not changed:
+            return
+        stmt = (
+            update(_aggregates)
+            .where(
+                _aggregates.c.student_id == bindparam("b_student"),
+                _aggregates.c.course_id == bindparam("b_course"),
+            )
+            .values(
+                grade_count=_aggregates.c.grade_count + bindparam("d_count"),
+                weight_sum=_aggregates.c.weight_sum + bindparam("d_weight"),
+                weighted_sum=_aggregates.c.weighted_sum + bindparam("d_weighted"),
+                percent_sum=_aggregates.c.percent_sum + bindparam("d_percent"),
+                updated_at=func.now(),
+            )
+        )
+        await self.session.execute(stmt, changed)
+
+
+def _to_course_average(row: GradeAggregate) -> CourseAverage:
+    return CourseAverage(
+        student_id=row.student_id,
+        course_id=row.course_id,
+        grade_count=row.grade_count,
+        weight_sum=Decimal(row.weight_sum),
+        weighted_sum=Decimal(row.weighted_sum),
+        percent_sum=Decimal(row.percent_sum),
+    )
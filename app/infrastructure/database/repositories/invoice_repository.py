@@ -0,0 +1,367 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import uuid
+
+from sqlalchemy import and_, func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.common.exceptions import InfrastructureError
+from app.core.entities.invoice import (
+    BillingProgress,
+    BillingRun,
+    BillingRunStatus,
+    Invoice,
+    InvoiceLine,
+    InvoiceStatus,
+)
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.models.financial.invoice_model import (
+    BillingCheckpointRecord,
+    BillingRunRecord,
+    FeeRecord,
+    InvoiceLineRecord,
+    InvoiceRecord,
+)
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+)
+from app.infrastructure.database.session import REPLICA_OK
+
+_students = StudentRecord.__table__
+_fees = FeeRecord.__table__
+_invoices = InvoiceRecord.__table__
+_lines = InvoiceLineRecord.__table__
+_runs = BillingRunRecord.__table__
+_checkpoints = BillingCheckpointRecord.__table__
+
+
+class ChunkResult(NamedTuple):
+    invoices: int
+    lines: int
+    done: bool
+
+
+class InvoiceRepository(SQLAlchemyRepository[Invoice, InvoiceRecord, uuid.UUID]):
+    model_cls = InvoiceRecord
+
+    @staticmethod
+    def to_domain(model: InvoiceRecord) -> Invoice:
+        return Invoice(
+            id=model.id,
+            student_id=model.student_id,
+            institution_id=model.institution_id,
+            period=model.period,
+            total=model.total,
+            status=InvoiceStatus(model.status),
+            issued_at=model.issued_at,
+            billing_run_id=model.billing_run_id,
+        )
+
+    @staticmethod
+    def to_model(entity: Invoice) -> InvoiceRecord:
+        return InvoiceRecord(
+            id=entity.id,
+            student_id=entity.student_id,
+            institution_id=entity.institution_id,
+            period=entity.period,
+            total=entity.total,
+            status=entity.status.value,
+            issued_at=entity.issued_at,
+            billing_run_id=entity.billing_run_id,
+        )
+
+    # ------------------------------------------
+    # QUERIES
+    # ------------------------------------------
+    async def for_student(self, student_id: uuid.UUID, limit: int = 24) -> List[Invoice]:
+        """Latest invoices of a student with their lines, in two queries."""
+        result = await self.session.scalars(
+            select(InvoiceRecord)
+            .where(InvoiceRecord.student_id == student_id)
+            .order_by(InvoiceRecord.period.desc())
+            .limit(limit)
+            .execution_options(**REPLICA_OK)
+        )
+        invoices = [self.to_domain(m) for m in result]
+        if invoices:
+            by_id: Dict[uuid.UUID, Invoice] = {i.id: i for i in invoices}
+            lines = await self.session.execute(
+                select(_lines)
+                .where(_lines.c.invoice_id.in_(list(by_id)))
+                .order_by(_lines.c.invoice_id, _lines.c.description)
+                .execution_options(**REPLICA_OK)
+            )
+            for row in lines:
+                by_id[row.invoice_id].lines.append(
+                    InvoiceLine(fee_id=row.fee_id, description=row.description, amount=row.amount)
+                )
+        return invoices
+
+    # ------------------------------------------
+    # BILLING RUNS
+    # ------------------------------------------
+    async def start_run(self, period: date) -> BillingRun:
+        """
+        Create a run for `period` with one checkpoint per institution
+        that has active students and active fees, in one INSERT ...
+        SELECT ... GROUP BY.
+        """
+        run = BillingRun(period=period)
+        has_fees = select(_fees.c.id).where(
+            _fees.c.institution_id == _students.c.institution_id, _fees.c.active
+        )
+        institutions = (
+            select(
+                func.count().label("students"),
+                _students.c.institution_id,
+            )
+            .where(_students.c.active, _students.c.institution_id.is_not(None), has_fees.exists())
+            .group_by(_students.c.institution_id)
+            .subquery()
+        )
+        try:
+            await self.session.execute(
+                _runs.insert().values(
+                    id=run.id,
+                    period=period,
+                    status=run.status.value,
+                    invoices=0,
+                    lines=0,
+                    started_at=run.started_at,
+                )
+            )
+            await self.session.execute(
+                _checkpoints.insert().from_select(
+                    ["run_id", "institution_id", "students", "invoices", "lines", "done"],
+                    select(
+                        literal(run.id, _checkpoints.c.run_id.type),
+                        institutions.c.institution_id,
+                        institutions.c.students,
+                        literal(0),
+                        literal(0),
+                        literal(False),
+                    ),
+                )
+            )
+            await self._commit()
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+        return await self.get_run(run.id)
+
+    async def get_run(self, run_id: uuid.UUID) -> Optional[BillingRun]:
+        row = (await self.session.execute(select(_runs).where(_runs.c.id == run_id))).first()
+        if row is None:
+            return None
+        checkpoints = await self.session.execute(
+            select(_checkpoints)
+            .where(_checkpoints.c.run_id == run_id)
+            .order_by(_checkpoints.c.students.desc(), _checkpoints.c.institution_id)
+        )
+        return BillingRun(
+            id=row.id,
+            period=row.period,
+            status=BillingRunStatus(row.status),
+            invoices=row.invoices,
+            lines=row.lines,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+            error=row.error,
+            institutions=[
+                BillingProgress(
+                    institution_id=cp.institution_id,
+                    students=cp.students,
+                    invoices=cp.invoices,
+                    lines=cp.lines,
+                    last_student_id=cp.last_student_id,
+                    done=cp.done,
+                )
+                for cp in checkpoints
+            ],
+        )
+
+    async def resumable_run(self, period: date) -> Optional[BillingRun]:
+        """The latest unfinished run of `period`, if any."""
+        run_id = await self.session.scalar(
+            select(_runs.c.id)
+            .where(_runs.c.period == period, _runs.c.status != BillingRunStatus.COMPLETED.value)
+            .order_by(_runs.c.started_at.desc())
+            .limit(1)
+        )
+        return None if run_id is None else await self.get_run(run_id)
+
+    async def set_run_status(
+        self,
+        run_id: uuid.UUID,
+        status: BillingRunStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the run's status; totals are summed from its checkpoints
+        and every status but RUNNING stamps `finished_at`.
+        """
+        totals = select(
+            func.coalesce(func.sum(_checkpoints.c.invoices), 0),
+            func.coalesce(func.sum(_checkpoints.c.lines), 0),
+        ).where(_checkpoints.c.run_id == run_id)
+        invoices, lines = (await self.session.execute(totals)).one()
+        finished_at = None if status is BillingRunStatus.RUNNING else datetime.now(timezone.utc)
+        try:
+            await self.session.execute(
+                update(_runs)
+                .where(_runs.c.id == run_id)
+                .values(
+                    status=status.value,
+                    invoices=invoices,
+                    lines=lines,
+                    finished_at=finished_at,
+                    error=error,
+                )
+            )
+            await self._commit()
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    # ------------------------------------------
+    # GENERATION (set-wise, one chunk per transaction)
+    # ------------------------------------------
+    async def bill_chunk(
+        self,
+        run_id: uuid.UUID,
+        institution_id: uuid.UUID,
+        limit: int = 2000,
+    ) -> ChunkResult:
+        """
+        Invoice the next `limit` active students of an institution, in
+        student id order after the checkpoint, and advance the
+        checkpoint in the same transaction:
+
+        - one executemany INSERT of the invoices (ON CONFLICT DO NOTHING
+          on (student_id, period): students already billed are skipped)
+        - one INSERT ... SELECT of every line: invoices x active fees
+        - one UPDATE setting each invoice total to the sum of its lines
+
+        The checkpoint row is locked first (PostgreSQL), so two
+        processes resuming the same run take turns instead of billing
+        the same students.
+        """
+        try:
+            checkpoint = (
+                await self.session.execute(
+                    select(_checkpoints.c.last_student_id, _checkpoints.c.done, _runs.c.period)
+                    .join(_runs, _runs.c.id == _checkpoints.c.run_id)
+                    .where(
+                        _checkpoints.c.run_id == run_id,
+                        _checkpoints.c.institution_id == institution_id,
+                    )
+                    .with_for_update(of=_checkpoints)
+                )
+            ).one()
+            if checkpoint.done:
+                await self._rollback()
+                return ChunkResult(0, 0, True)
+
+            students = (
+                select(_students.c.id)
+                .where(_students.c.institution_id == institution_id, _students.c.active)
+                .order_by(_students.c.id)
+                .limit(limit)
+            )
+            if checkpoint.last_student_id is not None:
+                students = students.where(_students.c.id > checkpoint.last_student_id)
+            student_ids = list(await self.session.scalars(students))
+
+            invoices = lines = 0
+            if student_ids:
+                invoices, lines = await self._insert_invoices(
+                    run_id, institution_id, checkpoint.period, student_ids
+                )
+
+            done = len(student_ids) < limit
+            await self.session.execute(
+                update(_checkpoints)
+                .where(
+                    _checkpoints.c.run_id == run_id,
+                    _checkpoints.c.institution_id == institution_id,
+                )
+                .values(
+                    last_student_id=student_ids[-1] if student_ids else checkpoint.last_student_id,
+                    invoices=_checkpoints.c.invoices + invoices,
+                    lines=_checkpoints.c.lines + lines,
+                    done=done,
+                    updated_at=func.now(),
+                )
+            )
+            await self._commit()
+            return ChunkResult(invoices, lines, done)
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    async def _insert_invoices(
+        self,
+        run_id: uuid.UUID,
+        institution_id: uuid.UUID,
+        period: date,
+        student_ids: List[uuid.UUID],
+    ) -> Tuple[int, int]:
+        issued_at = datetime.now(timezone.utc)
+        insert_fn = self._insert_fn()
+        await self.session.execute(
+            insert_fn(_invoices).on_conflict_do_nothing(index_elements=["student_id", "period"]),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "institution_id": institution_id,
+                    "student_id": student_id,
+                    "period": period,
+                    "status": InvoiceStatus.ISSUED.value,
+                    "total": Decimal("0"),
+                    "issued_at": issued_at,
+                    "billing_run_id": run_id,
+                }
+                for student_id in student_ids
+            ],
+        )
+
+        # Invoices this run created for the chunk (not ones billed before)
+        ours = and_(
+            _invoices.c.student_id.in_(student_ids),
+            _invoices.c.period == period,
+            _invoices.c.billing_run_id == run_id,
+        )
+        line_rows = (
+            select(_invoices.c.id, _fees.c.id, _fees.c.description, _fees.c.amount)
+            .select_from(
+                _invoices.join(
+                    _fees,
+                    and_(_fees.c.institution_id == _invoices.c.institution_id, _fees.c.active),
+                )
+            )
+            .where(ours)
+        )
+        lines = await self.session.execute(
+            insert_fn(_lines)
+            .from_select(["invoice_id", "fee_id", "description", "amount"], line_rows)
+            .on_conflict_do_nothing(index_elements=["invoice_id", "fee_id"])
+        )
+        line_total = (
+            select(func.coalesce(func.sum(_lines.c.amount), 0))
+            .where(_lines.c.invoice_id == _invoices.c.id)
+            .scalar_subquery()
+        )
+        invoices = await self.session.execute(
+            update(_invoices).where(ours).values(total=line_total, updated_at=func.now())
+        )
+        return invoices.rowcount or 0, lines.rowcount or 0
+
+    def _insert_fn(self):
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            return postgresql.insert
+        if dialect_name == "sqlite":
+            return sqlite.insert
+        raise InfrastructureError(f"Invoice generation is not supported on {dialect_name}.")
+
@@ -0,0 +1,144 @@
+from typing import List, Sequence
+import uuid
+
+from sqlalchemy import or_, select, text
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from app.common.exceptions import AppError, InfrastructureError
+from app.core.entities.schedule import (
+    ScheduleConflictError,
+    ScheduleEntry,
+    find_conflicts,
+)
+from app.infrastructure.database.models.administrative.schedule_model import (
+    OVERLAP_CONSTRAINTS,
+    ScheduleEntryRecord,
+)
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+)
+
+# SQLSTATE raised by PostgreSQL when an EXCLUDE constraint rejects a row
+EXCLUSION_VIOLATION = "23P01"
+
+
+class ScheduleRepository(SQLAlchemyRepository[ScheduleEntry, ScheduleEntryRecord, uuid.UUID]):
+    model_cls = ScheduleEntryRecord
+
+    @staticmethod
+    def to_domain(model: ScheduleEntryRecord) -> ScheduleEntry:
+        return ScheduleEntry(
+            id=model.id,
+            room_id=model.room_id,
+            teacher_id=model.teacher_id,
+            group_id=model.group_id,
+            course_id=model.course_id,
+            starts_at=model.starts_at,
+            ends_at=model.ends_at,
+        )
+
+    @staticmethod
+    def to_model(entity: ScheduleEntry) -> ScheduleEntryRecord:
+        return ScheduleEntryRecord(
+            id=entity.id,
+            room_id=entity.room_id,
+            teacher_id=entity.teacher_id,
+            group_id=entity.group_id,
+            course_id=entity.course_id,
+            starts_at=entity.starts_at,
+            ends_at=entity.ends_at,
+        )
+
+    # ------------------------------------------
+    # OVERLAP LOOKUP
+    # ------------------------------------------
+    async def overlapping(self, entries: Sequence[ScheduleEntry]) -> List[ScheduleEntry]:
+        """
+        Scheduled entries that use a room, teacher or group of `entries`
+        within the window they span, in one query. On PostgreSQL the
+        range test is served by the exclusion constraints' GiST indexes,
+        elsewhere by the (resource, starts_at) indexes.
+        """
+        if not entries:
+            return []
+        window_start = min(e.starts_at for e in entries)
+        window_end = max(e.ends_at for e in entries)
+        model = ScheduleEntryRecord
+
+        resources = {kind: set() for kind in ("room", "teacher", "group")}
+        for entry in entries:
+            for kind, resource_id in entry.resources():
+                resources[kind].add(resource_id)
+        uses_resource = or_(
+            *(
+                getattr(model, f"{kind}_id").in_(sorted(ids))
+                for kind, ids in resources.items()
+                if ids
+            )
+        )
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            in_window = func.tstzrange(model.starts_at, model.ends_at, "[)").op("&&")(
+                func.tstzrange(window_start, window_end, "[)")
+            )
+        else:
+            in_window = (model.starts_at < window_end) & (model.ends_at > window_start)
+
+        result = await self.session.scalars(select(model).where(uses_resource, in_window))
+        return [self.to_domain(m) for m in result]
+
+    # ------------------------------------------
+    # SAVE TIMETABLE (all or nothing)
+    # ------------------------------------------
+    async def save_timetable(self, entries: Sequence[ScheduleEntry]) -> List[ScheduleEntry]:
+        """
+        Insert or update `entries` unless any of them overlaps another
+        entry (proposed or scheduled) on the same resource, in which
+        case ScheduleConflictError lists every conflict.
+
+        On PostgreSQL the exclusion constraints also reject bookings
+        committed concurrently between the check and the write; other
+        databases rely on the check alone.
+        """
+        if not entries:
+            return []
+        try:
+            conflicts = find_conflicts(entries, await self.overlapping(entries))
+            if conflicts:
+                raise ScheduleConflictError(conflicts)
+
+            # Load the rows being updated in one query so merge() finds them
+            ids = [e.id for e in entries]
+            await self.session.scalars(select(self.model_cls).where(self.model_cls.id.in_(ids)))
+            for entry in entries:
+                await self.session.merge(self.to_model(entry))
+            if self.session.get_bind().dialect.name == "postgresql":
+                # The exclusion constraints are deferred (rows are updated one
+                # at a time, so a swap overlaps mid-flush); check them now that
+                # every row is in place, so violations surface here even
+                # inside a unit of work, then defer them again
+                await self.session.flush()
+                names = ", ".join(OVERLAP_CONSTRAINTS)
+                await self.session.execute(text(f"SET CONSTRAINTS {names} IMMEDIATE"))
+                await self.session.execute(text(f"SET CONSTRAINTS {names} DEFERRED"))
+            await self._commit()
+            return list(entries)
+        except AppError:
+            await self._rollback()
+            raise
+        except IntegrityError as exc:
+            await self._rollback()
+            if _sqlstate(exc) == EXCLUSION_VIOLATION:
+                raise ScheduleConflictError(
+                    [], "Conflicts with an entry scheduled concurrently; check again."
+                ) from exc
+            raise InfrastructureError(str(exc)) from exc
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+
+def _sqlstate(exc: IntegrityError):
+    orig = exc.orig
+    return getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
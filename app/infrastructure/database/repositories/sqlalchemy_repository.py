@@ -1,14 +1,53 @@
-from typing import Type, Generic, TypeVar, Optional, List, Callable
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Type,
+    Generic,
+    TypeVar,
+    Optional,
+    List,
+    Callable,
+    Sequence,
+    Tuple,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import (
+    select,
+    delete,
+    and_,
+    or_,
+    any_,
+    bindparam,
+    inspect,
+    literal_column,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 
-from app.common.kernel.base_repository import BaseRepository
-from app.common.exceptions import EntityNotFoundError, InfrastructureError
+from app.common.events import DomainEvent
+from app.common.kernel.base_repository import BaseRepository, CursorPage, OrderBy
+from app.common.exceptions import (
+    EntityNotFoundError,
+    InfrastructureError,
+    ValidationError,
+)
+from app.infrastructure.database.outbox import enqueue_events
+from app.infrastructure.database.pagination import encode_cursor, decode_cursor
+from app.infrastructure.database.session import REPLICA_OK
 
 T = TypeVar("T")       # Domain Entity
 M = TypeVar("M")       # ORM Model
 ID = TypeVar("ID")     # ID type
 
+# PostgreSQL accepts at most 32767 bind parameters per statement
+MAX_BIND_PARAMS = 32000
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class SQLAlchemyRepository(BaseRepository[T, ID], Generic[T, M, ID]):
     """
@@ -18,12 +57,22 @@ class SQLAlchemyRepository(BaseRepository[T, ID], Generic[T, M, ID]):
     - model_cls: ORM model class
     - to_domain(model) -> T
     - to_model(entity) -> ORM model
+
+    Domain events returned by `collect_events(entity)` (or passed to
+    save()) are written to the outbox in the same transaction as the
+    entity itself.
+
+    Inside a unit of work (see SQLAlchemyUnitOfWork) writes are only
+    flushed; the unit of work commits once for all repositories.
     """
 
     model_cls: Type[M]
     to_domain: Callable[[M], T]
     to_model: Callable[[T], M]
 
+    # Rows per statement for bulk operations
+    bulk_batch_size: int = 1000
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -31,34 +80,164 @@ class SQLAlchemyRepository(BaseRepository[T, ID], Generic[T, M, ID]):
     # GET BY ID
     # ------------------------------------------
     async def get_by_id(self, entity_id: ID) -> Optional[T]:
-        stmt = select(self.model_cls).where(self.model_cls.id == entity_id)
+        stmt = (
+            select(self.model_cls)
+            .where(self.model_cls.id == entity_id)
+            .execution_options(**REPLICA_OK)
+        )
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
         if not model:
             return None
         return self.to_domain(model)
 
+    # ------------------------------------------
+    # GET BY IDS (batched)
+    # ------------------------------------------
+    async def get_by_ids(self, entity_ids: Sequence[ID]) -> List[Optional[T]]:
+        """
+        Load many entities in one query.
+
+        On PostgreSQL the ids travel as a single array parameter
+        (`id = ANY(:ids)`), so the statement text is identical for any
+        batch size and stays in the prepared statement cache. Other
+        backends use chunked IN lists. Results follow the input order,
+        with None for missing ids.
+        """
+        if not entity_ids:
+            return []
+
+        unique_ids = list(dict.fromkeys(entity_ids))
+        id_column = self.model_cls.id
+        found: Dict[Any, M] = {}
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            ids_param = bindparam(
+                "entity_ids", unique_ids, type_=postgresql.ARRAY(id_column.type)
+            )
+            criteria_list: List[Any] = [id_column == any_(ids_param)]
+        else:
+            criteria_list = [
+                id_column.in_(chunk)
+                for chunk in _chunks(unique_ids, self.bulk_batch_size)
+            ]
+
+        for criteria in criteria_list:
+            stmt = select(self.model_cls).where(criteria).execution_options(**REPLICA_OK)
+            result = await self.session.execute(stmt)
+            for model in result.scalars().all():
+                found[model.id] = model
+
+        return [
+            self.to_domain(found[entity_id]) if entity_id in found else None
+            for entity_id in entity_ids
+        ]
+
     # ------------------------------------------
     # LIST
     # ------------------------------------------
     async def list(self, limit: int = 100, offset: int = 0) -> List[T]:
-        stmt = select(self.model_cls).limit(limit).offset(offset)
+        stmt = (
+            select(self.model_cls)
+            .limit(limit)
+            .offset(offset)
+            .execution_options(**REPLICA_OK)
+        )
         result = await self.session.execute(stmt)
         models = result.scalars().all()
         return [self.to_domain(m) for m in models]
 
+    # ------------------------------------------
+    # LIST AFTER (keyset / cursor pagination)
+    # ------------------------------------------
+    async def list_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        order_by: OrderBy = "id",
+    ) -> CursorPage[T]:
+        """
+        Keyset pagination: seek past the last row of the previous page
+        instead of counting OFFSET rows, so every page costs the same.
+
+        `order_by` takes column names, prefixed with "-" for descending.
+        The primary key is always appended as a tie-breaker, so the
+        sort columns should be NOT NULL for stable pages.
+        """
+        if limit < 1:
+            raise ValidationError("Page limit must be at least 1.")
+        keys = self._resolve_order_by(order_by)
+
+        stmt = (
+            select(self.model_cls)
+            .order_by(*[col.desc() if desc else col.asc() for col, desc in keys])
+            .execution_options(**REPLICA_OK)
+        )
+        if cursor is not None:
+            values = decode_cursor(cursor)
+            if len(values) != len(keys):
+                raise ValidationError("Pagination cursor does not match order_by.")
+            stmt = stmt.where(self._seek_predicate(keys, values))
+
+        # Fetch one extra row to know whether another page exists
+        result = await self.session.execute(stmt.limit(limit + 1))
+        models = list(result.scalars().all())
+
+        next_cursor = None
+        if len(models) > limit:
+            models = models[:limit]
+            last = models[-1]
+            next_cursor = encode_cursor([getattr(last, col.key) for col, _ in keys])
+
+        return CursorPage(
+            items=[self.to_domain(m) for m in models],
+            next_cursor=next_cursor,
+        )
+
+    # ------------------------------------------
+    # STREAM (server-side cursor)
+    # ------------------------------------------
+    async def stream(
+        self,
+        batch_size: int = 1000,
+        order_by: Optional[OrderBy] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over every row through a server-side cursor, fetching
+        `batch_size` rows at a time so memory stays flat regardless of
+        table size. Intended for exports and background jobs.
+        """
+        stmt = select(self.model_cls).execution_options(
+            yield_per=batch_size, **REPLICA_OK
+        )
+        if order_by is not None:
+            stmt = stmt.order_by(
+                *[
+                    col.desc() if desc else col.asc()
+                    for col, desc in self._resolve_order_by(order_by)
+                ]
+            )
+
+        result = await self.session.stream_scalars(stmt)
+        try:
+            async for model in result:
+                yield self.to_domain(model)
+        finally:
+            await result.close()
+
     # ------------------------------------------
     # SAVE (insert or update)
     # ------------------------------------------
-    async def save(self, entity: T) -> T:
+    async def save(self, entity: T, events: Sequence[DomainEvent] = ()) -> T:
         try:
             model = self.to_model(entity)
             self.session.add(model)
-            await self.session.commit()
+            enqueue_events(self.session, [*self.collect_events(entity), *events])
+            await self._commit()
             await self.session.refresh(model)
             return self.to_domain(model)
         except Exception as exc:
-            await self.session.rollback()
+            await self._rollback()
             raise InfrastructureError(str(exc)) from exc
 
     # ------------------------------------------
@@ -67,4 +246,260 @@ class SQLAlchemyRepository(BaseRepository[T, ID], Generic[T, M, ID]):
     async def delete(self, entity_id: ID) -> None:
         stmt = delete(self.model_cls).where(self.model_cls.id == entity_id)
         await self.session.execute(stmt)
-        await self.session.commit()
+        await self._commit()
+
+    # ------------------------------------------
+    # SAVE MANY (batched insert, single commit)
+    # ------------------------------------------
+    async def save_many(self, entities: Sequence[T]) -> List[T]:
+        """
+        Insert many entities with one commit.
+
+        Each chunk is flushed as a single executemany INSERT (with
+        RETURNING for generated columns where the backend supports it),
+        so no per-row refresh() round trip is needed.
+        """
+        if not entities:
+            return []
+        try:
+            models = [self.to_model(e) for e in entities]
+            for chunk in _chunks(models, self.bulk_batch_size):
+                self.session.add_all(chunk)
+                await self.session.flush()
+            enqueue_events(
+                self.session, [ev for e in entities for ev in self.collect_events(e)]
+            )
+            await self._commit()
+            return [self.to_domain(m) for m in models]
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    # ------------------------------------------
+    # UPSERT MANY (INSERT ... ON CONFLICT)
+    # ------------------------------------------
+    async def upsert_many(
+        self,
+        entities: Sequence[T],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Optional[Sequence[str]] = None,
+    ) -> List[T]:
+        """
+        Insert-or-update many entities with one commit.
+
+        Uses `INSERT ... ON CONFLICT (conflict_columns) DO UPDATE ...
+        RETURNING` on PostgreSQL and SQLite. By default every column an
+        entity actually sets is updated; columns it leaves as None keep
+        their stored value (rows are grouped by the columns they set,
+        one statement per group and chunk). Pass `update_columns` to
+        update the same columns on every row instead.
+
+        Entities sharing a conflict key are collapsed first (the last
+        one wins): PostgreSQL refuses to update the same row twice in
+        one statement. When there is nothing to update the statement
+        is `ON CONFLICT DO NOTHING`, and rows that already existed are
+        left out of the returned list.
+        """
+        if not entities:
+            return []
+
+        dialect_name = self.session.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            insert_fn = postgresql.insert
+        elif dialect_name == "sqlite":
+            insert_fn = sqlite.insert
+        else:
+            return await self._merge_many(entities)
+
+        try:
+            models = [self.to_model(e) for e in entities]
+            rows, explicit = self._row_values(models)
+            table = self.model_cls.__table__
+            skip = set(conflict_columns) | {c.key for c in table.primary_key}
+
+            def conflict_key(values) -> Tuple[Any, ...]:
+                return tuple(values[c] for c in conflict_columns)
+
+            latest = {conflict_key(row): (row, cols) for row, cols in zip(rows, explicit)}
+            groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+            for row, cols in latest.values():
+                if update_columns is None:
+                    cols = tuple(k for k in cols if k not in skip)
+                else:
+                    cols = tuple(update_columns)
+                groups.setdefault(cols, []).append(row)
+
+            batch_size = max(
+                1, min(self.bulk_batch_size, MAX_BIND_PARAMS // len(table.columns))
+            )
+            saved: List[M] = []
+            for columns, group in groups.items():
+                for chunk in _chunks(group, batch_size):
+                    stmt = insert_fn(self.model_cls).values(list(chunk))
+                    set_ = {name: stmt.excluded[name] for name in columns}
+                    for column in table.columns:
+                        onupdate = column.onupdate
+                        if onupdate is not None and column.key not in set_:
+                            set_[column.key] = (
+                                onupdate.arg(None) if onupdate.is_callable else onupdate.arg
+                            )
+                    if set_:
+                        stmt = stmt.on_conflict_do_update(
+                            index_elements=list(conflict_columns), set_=set_
+                        )
+                    else:
+                        stmt = stmt.on_conflict_do_nothing(
+                            index_elements=list(conflict_columns)
+                        )
+                    result = await self.session.scalars(
+                        stmt.returning(self.model_cls),
+                        execution_options={"populate_existing": True},
+                    )
+                    saved.extend(result.all())
+
+            # Back in input order (groups reorder the statements)
+            position = {key: i for i, key in enumerate(latest)}
+            saved.sort(
+                key=lambda m: position.get(
+                    conflict_key({c: getattr(m, c) for c in conflict_columns}), len(position)
+                )
+            )
+
+            enqueue_events(
+                self.session, [ev for e in entities for ev in self.collect_events(e)]
+            )
+            await self._commit()
+            return [self.to_domain(m) for m in saved]
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    # ------------------------------------------
+    # DELETE MANY
+    # ------------------------------------------
+    async def delete_many(self, entity_ids: Sequence[ID]) -> int:
+        """
+        Delete many rows by id with one commit.
+        Returns the number of rows actually deleted.
+        """
+        if not entity_ids:
+            return 0
+        try:
+            deleted = 0
+            for chunk in _chunks(list(entity_ids), self.bulk_batch_size):
+                stmt = delete(self.model_cls).where(self.model_cls.id.in_(chunk))
+                result = await self.session.execute(stmt)
+                deleted += result.rowcount or 0
+            await self._commit()
+            return deleted
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    # ------------------------------------------
+    # Transaction helpers
+    # ------------------------------------------
+    @property
+    def in_unit_of_work(self) -> bool:
+        return "unit_of_work" in self.session.info
+
+    async def _commit(self) -> None:
+        if self.in_unit_of_work:
+            await self.session.flush()
+        else:
+            await self.session.commit()
+
+    async def _rollback(self) -> None:
+        # The unit of work owns the transaction and rolls it back on exit
+        if not self.in_unit_of_work:
+            await self.session.rollback()
+
+    # ------------------------------------------
+    # Outbox hook
+    # ------------------------------------------
+    def collect_events(self, entity: T) -> Sequence[DomainEvent]:
+        """
+        Events to publish along with `entity`. By default drains the
+        entity's `pull_events()` when it has one; override for slices
+        that derive events differently.
+        """
+        pull_events = getattr(entity, "pull_events", None)
+        return list(pull_events()) if callable(pull_events) else []
+
+    # ------------------------------------------
+    # Internal helpers
+    # ------------------------------------------
+    async def _merge_many(self, entities: Sequence[T]) -> List[T]:
+        """Portable upsert for dialects without ON CONFLICT support."""
+        try:
+            models = [await self.session.merge(self.to_model(e)) for e in entities]
+            enqueue_events(
+                self.session, [ev for e in entities for ev in self.collect_events(e)]
+            )
+            await self._commit()
+            return [self.to_domain(m) for m in models]
+        except Exception as exc:
+            await self._rollback()
+            raise InfrastructureError(str(exc)) from exc
+
+    def _row_values(
+        self, models: Sequence[M]
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, ...]]]:
+        """
+        Convert ORM instances into uniform column dicts for a
+        multi-row INSERT, filling unset columns from their defaults.
+        Also returns, per row, the columns it explicitly sets.
+        """
+        mapper = inspect(self.model_cls)
+        rows: List[Dict[str, Any]] = []
+        explicit: List[Tuple[str, ...]] = []
+
+        for model in models:
+            row: Dict[str, Any] = {}
+            row_explicit: List[str] = []
+            for attr in mapper.column_attrs:
+                column = attr.columns[0]
+                value = getattr(model, attr.key)
+                if value is not None:
+                    row_explicit.append(column.key)
+                elif column.default is not None:
+                    default = column.default
+                    value = default.arg(None) if default.is_callable else default.arg
+                elif column.server_default is not None:
+                    arg = column.server_default.arg
+                    value = literal_column(arg) if isinstance(arg, str) else arg
+                row[column.key] = value
+            rows.append(row)
+            explicit.append(tuple(row_explicit))
+
+        return rows, explicit
+
+    def _resolve_order_by(self, order_by: OrderBy) -> List[Tuple[Any, bool]]:
+        names = [order_by] if isinstance(order_by, str) else list(order_by)
+
+        # Mapped columns only: not relationships, methods or class attributes
+        columns = inspect(self.model_cls).column_attrs
+        keys: List[Tuple[Any, bool]] = []
+        for name in names:
+            desc = name.startswith("-")
+            attr = name.lstrip("-")
+            if attr not in columns:
+                raise ValidationError(f"Cannot order by unknown field '{attr}'.")
+            keys.append((getattr(self.model_cls, attr), desc))
+
+        if not any(col.key == "id" for col, _ in keys):
+            keys.append((self.model_cls.id, keys[-1][1] if keys else False))
+        return keys
+
+    @staticmethod
+    def _seek_predicate(keys: List[Tuple[Any, bool]], values: Tuple[Any, ...]):
+        """
+        Build (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+        honouring the direction of each key.
+        """
+        clauses = []
+        for i, (col, desc) in enumerate(keys):
+            equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+            step = col < values[i] if desc else col > values[i]
+            clauses.append(and_(*equal_prefix, step))
+        return or_(*clauses)
@@ -0,0 +1,234 @@
+from itertools import chain
+from typing import Any, List, Optional, Tuple
+import uuid
+import weakref
+
+from sqlalchemy import event, func, literal, literal_column, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.common.exceptions import ValidationError
+from app.common.kernel.base_repository import CursorPage
+from app.common.kernel.single_flight import SingleFlight
+from app.common.utils.text_search import TextIndex, words
+from app.core.entities.student import Student, search_text
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.pagination import decode_cursor, encode_cursor
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+)
+from app.infrastructure.database.session import REPLICA_OK
+
+SEARCH_MODES = ("prefix", "similar")
+# Minimum share of the query's trigrams a "similar" match must contain
+# in the fallback index; PostgreSQL uses pg_trgm.word_similarity_threshold
+SIMILARITY_THRESHOLD = 0.5
+
+
+class StudentRepository(SQLAlchemyRepository[Student, StudentRecord, uuid.UUID]):
+    model_cls = StudentRecord
+
+    @staticmethod
+    def to_domain(model: StudentRecord) -> Student:
+        return Student(
+            id=model.id,
+            student_number=model.student_number,
+            first_name=model.first_name,
+            last_name=model.last_name,
+            email=model.email,
+            institution_id=model.institution_id,
+            active=model.active,
+        )
+
+    @staticmethod
+    def to_model(entity: Student) -> StudentRecord:
+        return StudentRecord(
+            id=entity.id,
+            student_number=entity.student_number,
+            first_name=entity.first_name,
+            last_name=entity.last_name,
+            email=entity.email,
+            institution_id=entity.institution_id,
+            active=entity.active,
+        )
+
+    # ------------------------------------------
+    # SEARCH
+    # ------------------------------------------
+    async def search(
+        self,
+        query: str,
+        mode: str = "prefix",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[Student]:
+        """
+        Find students by name or student number, one keyset page at a time.
+
+        - "prefix" (autocomplete): every word of `query` starts a word
+          of "last first number"; results in that order.
+        - "similar": trigram similarity, tolerant of typos and partial
+          words; best matches first. Needs three letters or digits.
+
+        On PostgreSQL both run on the GIN indexes of students.search_text;
+        elsewhere on an in-process TextIndex of the roster.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValidationError(f"Unknown search mode '{mode}'.")
+        if not words(query):
+            raise ValidationError("The search needs at least one letter or digit.")
+        if mode == "similar" and len("".join(words(query))) < 3:
+            raise ValidationError("Similarity search needs at least three letters or digits.")
+        after = decode_cursor(cursor) if cursor is not None else None
+        if after is not None and len(after) != (2 if mode == "prefix" else 3):
+            raise ValidationError("Pagination cursor does not match the search mode.")
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            return await self._search_sql(query, mode, limit, after)
+        return await self._search_index(query, mode, limit, after)
+
+    async def _search_sql(
+        self, query: str, mode: str, limit: int, after: Optional[Tuple[Any, ...]]
+    ) -> CursorPage[Student]:
+        model = StudentRecord
+        if mode == "prefix":
+            # Tokens are letters and digits only, so safe inside a tsquery
+            tsquery = " & ".join(f"{token}:*" for token in words(query))
+            match = func.to_tsvector(literal_column("'simple'"), model.search_text).op("@@")(
+                func.to_tsquery(literal_column("'simple'"), tsquery)
+            )
+            keys = [(model.search_text, False), (model.id, False)]
+        else:
+            normalized = " ".join(words(query))
+            match = literal(normalized).op("<%")(model.search_text)
+            rank = func.word_similarity(normalized, model.search_text)
+            keys = [(rank, True), (model.search_text, False), (model.id, False)]
+
+        stmt = (
+            select(model, *[col for col, _ in keys[:-2]])
+            .where(match)
+            .order_by(*[col.desc() if desc else col.asc() for col, desc in keys])
+            .limit(limit + 1)
+            .execution_options(**REPLICA_OK)
+        )
+        if after is not None:
+            stmt = stmt.where(self._seek_predicate(keys, after))
+        rows = (await self.session.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor([*last[1:], last[0].search_text, last[0].id])
+        return CursorPage(items=[self.to_domain(row[0]) for row in rows], next_cursor=next_cursor)
+
+    async def _search_index(
+        self, query: str, mode: str, limit: int, after: Optional[Tuple[Any, ...]]
+    ) -> CursorPage[Student]:
+        index = await self.fallback_index()
+        if mode == "prefix":
+            page: List[Tuple[Any, ...]] = index.prefix(query, limit + 1, after)
+        else:
+            page = index.similar(query, SIMILARITY_THRESHOLD, limit + 1, after)
+
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor(page[-1])
+        students = await self.get_by_ids([match[-1] for match in page])
+        return CursorPage(items=[s for s in students if s is not None], next_cursor=next_cursor)
+
+    # ------------------------------------------
+    # Fallback index
+    # ------------------------------------------
+    async def fallback_index(self) -> TextIndex[uuid.UUID]:
+        """
+        In-process search index of the roster behind the session's
+        engine, built on first use and dropped whenever students are
+        written through this process (see the session hooks below).
+        Writes from other processes are not seen: meant for SQLite
+        development and tests, not for production.
+        """
+        engine = self.session.get_bind()
+        index = _FALLBACK_INDEXES.get(engine)
+        if index is None:
+            index = await _INDEX_BUILDS.do(id(engine), lambda: self._build_index(engine))
+        return index
+
+    async def _build_index(self, engine: Engine) -> TextIndex[uuid.UUID]:
+        _install_invalidation_hooks()
+        generation = _generation
+        model = StudentRecord
+        index: TextIndex[uuid.UUID] = TextIndex()
+        result = await self.session.stream(
+            select(model.id, model.last_name, model.first_name, model.student_number)
+            .execution_options(yield_per=10_000, **REPLICA_OK)
+        )
+        async for row in result:
+            index.add(row.id, search_text(row.last_name, row.first_name, row.student_number))
+        # Keep it only if no student was written while it was being built
+        if generation == _generation:
+            _FALLBACK_INDEXES[engine] = index
+        return index
+
+
+# ------------------------------------------------------------
+# Fallback index invalidation
+# ------------------------------------------------------------
+_FALLBACK_INDEXES: "weakref.WeakKeyDictionary[Engine, TextIndex[uuid.UUID]]" = (
+    weakref.WeakKeyDictionary()
+)
+_INDEX_BUILDS = SingleFlight("student_search_index")
+_generation = 0
+_CHANGED = "students_changed"
+
+
+def invalidate_student_index() -> None:
+    """Drop every in-process student index; the next search rebuilds it."""
+    global _generation
+    _generation += 1
+    _FALLBACK_INDEXES.clear()
+
+
+def _students_flushed(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, StudentRecord)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[_CHANGED] = True
+
+
+def _students_executed(state) -> None:
+    # Bulk INSERT/UPDATE/DELETE statements bypass the flush
+    if (state.is_insert or state.is_update or state.is_delete) and getattr(
+        state.statement, "table", None
+    ) is StudentRecord.__table__:
+        state.session.info[_CHANGED] = True
+
+
+def _students_committed(session: Session) -> None:
+    if session.info.pop(_CHANGED, False):
+        invalidate_student_index()
+
+
+def _students_rolled_back(session: Session, previous_transaction) -> None:
+    session.info.pop(_CHANGED, None)
+
+
+_HOOKS = (
+    ("after_flush", _students_flushed),
+    ("do_orm_execute", _students_executed),
+    ("after_commit", _students_committed),
+    ("after_soft_rollback", _students_rolled_back),
+)
+
+
+def _install_invalidation_hooks() -> None:
+    """
+    Watch every session for student writes, from the first fallback
+    index build on: on PostgreSQL no index is built and flushes and
+    statements pay nothing for it.
+    """
+    for name, fn in _HOOKS:
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
@@ -4,34 +4,392 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql import Select
+from typing import Any, Dict, List, Optional, Tuple
+import itertools
+import logging
+import math
+import time
 
+from app.common.metrics import metrics
+from app.common.timing import current_timings
 from app.infrastructure.database.base import Base
 from app.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------
+# POOL TELEMETRY
+# ---------------------------------------------------------------------
+POOL_CHECKOUT_SECONDS = metrics.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting to acquire a pooled DB connection.",
+    labelnames=("pool",),
+    buckets=(
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+        0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+    ),
+)
+POOL_CHECKOUT_TIMEOUTS = metrics.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds.",
+    labelnames=("pool",),
+)
+POOL_CHECKED_OUT = metrics.gauge(
+    "db_pool_checked_out", "Connections currently in use.", labelnames=("pool",)
+)
+POOL_CHECKED_IN = metrics.gauge(
+    "db_pool_checked_in", "Idle connections held by the pool.", labelnames=("pool",)
+)
+POOL_OVERFLOW = metrics.gauge(
+    "db_pool_overflow", "Connections opened beyond pool_size.", labelnames=("pool",)
+)
+POOL_CAPACITY = metrics.gauge(
+    "db_pool_capacity", "pool_size + max_overflow.", labelnames=("pool",)
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long each checkout waits
+    and how many checkouts time out. Pools are labelled with the
+    engine's `pool_logging_name`.
+
+    It also keeps the number of waiting checkouts and a time-decayed
+    average of recent wait times, which load shedding reads.
+    """
+
+    # Time constant (seconds) for the recent wait average to fade when idle
+    WAIT_DECAY_SECONDS = 5.0
+    WAIT_SMOOTHING = 0.2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self._wait_avg = 0.0
+        self._wait_avg_at = time.monotonic()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=self.metrics_label)
+            raise
+        finally:
+            self.waiting -= 1
+            waited = time.perf_counter() - start
+            POOL_CHECKOUT_SECONDS.observe(waited, pool=self.metrics_label)
+            self._wait_avg = (
+                self.recent_wait() * (1 - self.WAIT_SMOOTHING) + waited * self.WAIT_SMOOTHING
+            )
+            self._wait_avg_at = time.monotonic()
+
+    def recent_wait(self) -> float:
+        """Smoothed checkout wait (seconds), decaying while no checkouts happen."""
+        idle = time.monotonic() - self._wait_avg_at
+        return self._wait_avg * math.exp(-idle / self.WAIT_DECAY_SECONDS)
+
+    @property
+    def metrics_label(self) -> str:
+        return self._orig_logging_name or "default"
+
+    def collect_stats(self) -> None:
+        label = self.metrics_label
+        POOL_CHECKED_OUT.set(self.checkedout(), pool=label)
+        POOL_CHECKED_IN.set(self.checkedin(), pool=label)
+        POOL_OVERFLOW.set(max(self.overflow(), 0), pool=label)
+        POOL_CAPACITY.set(self.size() + self._max_overflow, pool=label)
+
+
+def build_engine_config(database_url: str, name: str) -> Tuple[URL, Dict[str, Any]]:
+    """
+    Translate Settings into create_async_engine() arguments.
+    Pool options only apply to server databases; SQLite keeps
+    SQLAlchemy's defaults.
+    """
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"echo": settings.DB_ECHO, "future": True}
+
+    if url.get_backend_name() == "sqlite":
+        return url, options
+
+    options.update(
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    if url.get_driver_name() == "asyncpg":
+        cache_size = settings.DB_STATEMENT_CACHE_SIZE
+        # SQLAlchemy's own prepared statement LRU + asyncpg's cache
+        url = url.update_query_dict({"prepared_statement_cache_size": str(cache_size)})
+        options["connect_args"] = {"statement_cache_size": cache_size}
+
+    return url, options
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """Snapshot of an engine's pool occupancy (used by health checks)."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return {}
+    capacity = pool.size() + pool._max_overflow
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "waiting": pool.waiting,
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": checked_out / capacity if capacity else 0.0,
+    }
+
+
+def primary_pool_wait() -> float:
+    """
+    Recent checkout wait (seconds) of the primary pool; 0.0 before the
+    engine exists or for non-instrumented pools (SQLite).
+    """
+    if _ASYNC_ENGINE is None:
+        return 0.0
+    pool = _ASYNC_ENGINE.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return 0.0
+    return pool.recent_wait()
+
+
+# ---------------------------------------------------------------------
+# QUERY TIMING (feeds the per-request Server-Timing breakdown)
+# ---------------------------------------------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and current_timings() is not None:
+        context._query_start_ns = time.perf_counter_ns()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = current_timings()
+    start = getattr(context, "_query_start_ns", None)
+    if timings is not None and start is not None:
+        timings.add_query(time.perf_counter_ns() - start)
+
+
+def instrument_query_timing(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ---------------------------------------------------------------------
+# READ REPLICAS
+# ---------------------------------------------------------------------
+# Statements carrying this execution option may be served by a replica.
+# SQLAlchemyRepository tags its read methods with it.
+REPLICA_OK = {"use_replica": True}
+
+
+class _ReplicaState:
+    __slots__ = ("engine", "failures", "ejected_until")
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.failures = 0
+        self.ejected_until = 0.0
+
+
+class ReplicaSet:
+    """
+    Chooses a read replica per session.
+
+    Strategies: "round_robin" or "least_connections" (fewest checked-out
+    connections). Replicas are ejected after `failure_threshold`
+    consecutive connection errors and retried after `eject_seconds`.
+    When every replica is ejected, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        strategy: str = "round_robin",
+        failure_threshold: int = 3,
+        eject_seconds: float = 30.0,
+    ):
+        if strategy not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+        self.strategy = strategy
+        self.failure_threshold = failure_threshold
+        self.eject_seconds = eject_seconds
+        self._replicas = [_ReplicaState(e) for e in engines]
+        self._by_sync_engine = {id(r.engine.sync_engine): r for r in self._replicas}
+        self._counter = itertools.count()
+
+        for replica in self._replicas:
+            event.listen(replica.engine.sync_engine, "handle_error", self._on_error)
+            event.listen(replica.engine.sync_engine, "engine_connect", self._on_connect)
+
+    @property
+    def engines(self) -> List[AsyncEngine]:
+        return [r.engine for r in self._replicas]
+
+    def healthy(self) -> List[_ReplicaState]:
+        now = time.monotonic()
+        return [r for r in self._replicas if r.ejected_until <= now]
+
+    def choose(self) -> Optional[Engine]:
+        """Return the sync engine of the replica to use, or None for primary."""
+        candidates = self.healthy()
+        if not candidates:
+            return None
+        if self.strategy == "least_connections":
+            chosen = min(candidates, key=lambda r: _checked_out(r.engine))
+        else:
+            chosen = candidates[next(self._counter) % len(candidates)]
+        return chosen.engine.sync_engine
+
+    def mark_failure(self, sync_engine: Engine) -> None:
+        replica = self._by_sync_engine.get(id(sync_engine))
+        if replica is None:
+            return
+        replica.failures += 1
+        if replica.failures >= self.failure_threshold:
+            replica.ejected_until = time.monotonic() + self.eject_seconds
+            replica.failures = 0
+            logger.warning(
+                "Ejecting read replica %s for %.0fs", sync_engine.url, self.eject_seconds
+            )
+
+    def mark_success(self, sync_engine: Engine) -> None:
+        replica = self._by_sync_engine.get(id(sync_engine))
+        if replica is not None:
+            replica.failures = 0
+
+    async def check_health(self) -> Dict[str, bool]:
+        """Actively probe every replica with SELECT 1 (used by readiness checks)."""
+        status: Dict[str, bool] = {}
+        for index, replica in enumerate(self._replicas):
+            sync_engine = replica.engine.sync_engine
+            try:
+                async with replica.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                replica.ejected_until = 0.0
+                status[f"replica-{index}"] = True
+            except Exception:
+                self.mark_failure(sync_engine)
+                status[f"replica-{index}"] = False
+        return status
+
+    async def dispose(self) -> None:
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+    # -------------------------
+    # Engine event hooks
+    # -------------------------
+    def _on_error(self, context) -> None:
+        if context.is_disconnect or isinstance(
+            context.original_exception, (OSError, sa_exc.InterfaceError)
+        ):
+            self.mark_failure(context.engine)
+
+    def _on_connect(self, connection) -> None:
+        self.mark_success(connection.engine)
+
+
+def _checked_out(engine: AsyncEngine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+class RoutingSession(Session):
+    """
+    Session that sends eligible reads to a replica.
+
+    A SELECT goes to a replica when it is tagged with REPLICA_OK or the
+    session was opened read-only (see get_read_session). Everything else
+    goes to the primary, including locking reads (FOR UPDATE). Once a
+    session has locked rows, flushed or executed DML it sticks to the
+    primary so it always reads its own writes. The chosen replica is
+    also sticky for the session's lifetime.
+    """
+
+    def __init__(self, *args: Any, replicas: Optional[ReplicaSet] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self.replicas is None or self.info.get("_wrote"):
+            return primary
+
+        # Row locks (SELECT ... FOR UPDATE) only mean something on the primary
+        locking = getattr(clause, "_for_update_arg", None) is not None
+        if self._flushing or locking or getattr(clause, "is_dml", False):
+            self.info["_wrote"] = True
+            return primary
+
+        if not isinstance(clause, Select) or not (
+            self.info.get("read_only")
+            or clause.get_execution_options().get("use_replica", False)
+        ):
+            return primary
+
+        replica = self.info.get("_replica")
+        if replica is None:
+            replica = self.replicas.choose()
+            if replica is None:
+                return primary
+            self.info["_replica"] = replica
+        return replica
+
 
 # ---------------------------------------------------------------------
 # ASYNC ENGINE (Primary runtime)
 # ---------------------------------------------------------------------
 _ASYNC_ENGINE: AsyncEngine | None = None
+_REPLICA_SET: ReplicaSet | None = None
 async_session: async_sessionmaker[AsyncSession] | None = None
 
 
 def get_async_engine() -> AsyncEngine:
-    """Lazy-initialize the async SQLAlchemy engine."""
-    global _ASYNC_ENGINE, async_session
+    """Lazy-initialize the async SQLAlchemy engine (and replica engines)."""
+    global _ASYNC_ENGINE, _REPLICA_SET, async_session
 
     if _ASYNC_ENGINE is None:
-        _ASYNC_ENGINE = create_async_engine(
-            settings.DATABASE_URL,
-            echo=settings.DB_ECHO,
-            future=True,
-            pool_pre_ping=True,
-        )
+        url, options = build_engine_config(settings.DATABASE_URL, "primary")
+        _ASYNC_ENGINE = create_async_engine(url, **options)
+        instrument_query_timing(_ASYNC_ENGINE)
+
+        replica_engines = []
+        for index, replica_url in enumerate(settings.replica_urls):
+            url, options = build_engine_config(replica_url, f"replica-{index}")
+            replica_engine = create_async_engine(url, **options)
+            instrument_query_timing(replica_engine)
+            replica_engines.append(replica_engine)
+        if replica_engines:
+            _REPLICA_SET = ReplicaSet(
+                replica_engines,
+                strategy=settings.DB_REPLICA_STRATEGY,
+                failure_threshold=settings.DB_REPLICA_FAILURE_THRESHOLD,
+                eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+            )
 
         async_session = async_sessionmaker(
             bind=_ASYNC_ENGINE,
+            sync_session_class=RoutingSession,
+            replicas=_REPLICA_SET,
             expire_on_commit=False,
             autoflush=False,
             autocommit=False,
@@ -40,6 +398,34 @@ def get_async_engine() -> AsyncEngine:
     return _ASYNC_ENGINE
 
 
+def get_replica_set() -> Optional[ReplicaSet]:
+    get_async_engine()
+    return _REPLICA_SET
+
+
+async def dispose_engines() -> None:
+    """Close the primary and replica connection pools."""
+    global _ASYNC_ENGINE, _REPLICA_SET, async_session
+
+    if _REPLICA_SET is not None:
+        await _REPLICA_SET.dispose()
+    if _ASYNC_ENGINE is not None:
+        await _ASYNC_ENGINE.dispose()
+    _ASYNC_ENGINE, _REPLICA_SET, async_session = None, None, None
+
+
+def _collect_pool_stats() -> None:
+    engines = [_ASYNC_ENGINE] if _ASYNC_ENGINE is not None else []
+    if _REPLICA_SET is not None:
+        engines.extend(_REPLICA_SET.engines)
+    for engine in engines:
+        if isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool):
+            engine.pool.collect_stats()
+
+
+metrics.register_collector(_collect_pool_stats)
+
+
 # ---------------------------------------------------------------------
 # SYNC ENGINE (Used for Alembic or scripts)
 # ---------------------------------------------------------------------
@@ -81,6 +467,22 @@ async def get_async_session() -> AsyncSession:
         yield session
 
 
+# ---------------------------------------------------------------------
+# FastAPI Dependency: get_read_session
+# ---------------------------------------------------------------------
+async def get_read_session() -> AsyncSession:
+    """
+    Provide a session whose SELECTs are served by a read replica
+    (falls back to the primary when no replica is configured/healthy).
+    Use for report-style endpoints that tolerate replication lag.
+    """
+    if async_session is None:
+        get_async_engine()  # initialize factory
+
+    async with async_session(info={"read_only": True}) as session:
+        yield session
+
+
 # ---------------------------------------------------------------------
 # Helper for synchronous scripts (rarely used)
 # ---------------------------------------------------------------------
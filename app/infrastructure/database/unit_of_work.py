@@ -0,0 +1,125 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Type, TypeVar
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.kernel.unit_of_work import UnitOfWork
+from app.common.metrics import metrics
+from app.infrastructure.database import session as db_session
+
+R = TypeVar("R")
+
+UOW_STATEMENTS = metrics.histogram(
+    "uow_statements_per_transaction",
+    "SQL statements executed on the primary per unit of work.",
+    labelnames=("outcome",),
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+UOW_SECONDS = metrics.histogram(
+    "uow_transaction_seconds",
+    "Duration of a unit of work from begin to commit/rollback.",
+    labelnames=("outcome",),
+)
+
+# Key in Connection.info holding the statement counter of the active unit of work
+_STATEMENTS_KEY = "uow_statements"
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    count = conn.info.get(_STATEMENTS_KEY)
+    if count is not None:
+        conn.info[_STATEMENTS_KEY] = count + 1
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """
+    Unit of work owning one AsyncSession.
+
+    The session is tagged through `session.info["unit_of_work"]`, which
+    makes SQLAlchemyRepository flush instead of commit. Pass `session`
+    to wrap a session managed elsewhere (e.g. a FastAPI dependency);
+    otherwise one is opened from `session_factory` and closed on exit.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        *,
+        session: Optional[AsyncSession] = None,
+    ):
+        super().__init__()
+        self._session_factory = session_factory
+        self._owns_session = session is None
+        self._session = session
+        self._repositories: Dict[type, object] = {}
+        self._started_at = 0.0
+        self._statement_counter: Optional[dict] = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("Unit of work is not active.")
+        return self._session
+
+    def repository(self, repository_cls: Type[R]) -> R:
+        """Repository bound to this unit of work's session (one per class)."""
+        repository = self._repositories.get(repository_cls)
+        if repository is None:
+            repository = self._repositories[repository_cls] = repository_cls(self.session)
+        return repository
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+    async def _begin(self) -> None:
+        if self._session is None:
+            factory = self._session_factory
+            if factory is None:
+                if db_session.async_session is None:
+                    db_session.get_async_engine()
+                factory = db_session.async_session
+            self._session = factory()
+        self.session.info["unit_of_work"] = self
+        self._started_at = time.perf_counter()
+        # Count statements on the primary connection of this transaction
+        connection = await self.session.connection()
+        self._statement_counter = connection.sync_connection.info
+        self._statement_counter[_STATEMENTS_KEY] = 0
+
+    async def commit(self) -> None:
+        statements = self._take_statement_count()
+        await self.session.commit()
+        self._observe("commit", statements)
+
+    async def rollback(self) -> None:
+        statements = self._take_statement_count()
+        await self.session.rollback()
+        self._observe("rollback", statements)
+
+    async def _close(self) -> None:
+        session, self._session = self._session, None
+        self._repositories.clear()
+        if session is None:
+            return
+        session.info.pop("unit_of_work", None)
+        if self._owns_session:
+            await session.close()
+        else:
+            self._session = session
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        async with self.session.begin_nested():
+            yield
+
+    def _take_statement_count(self) -> int:
+        counter, self._statement_counter = self._statement_counter, None
+        return counter.pop(_STATEMENTS_KEY, 0) if counter is not None else 0
+
+    def _observe(self, outcome: str, statements: int) -> None:
+        UOW_STATEMENTS.observe(statements, outcome=outcome)
+        UOW_SECONDS.observe(time.perf_counter() - self._started_at, outcome=outcome)
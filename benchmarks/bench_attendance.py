@@ -0,0 +1,151 @@
+"""
+Benchmark: sustained attendance ingestion (rows/sec).
+
+Writes `marks` attendance marks in request-sized batches through:
+
+- upsert_many() per request: the generic ORM upsert (RETURNING rows)
+- bulk_upsert() per request: Core executemany, no RETURNING
+- BatchWriter: `clients` concurrent submitters sharing the write-behind
+  queue, each awaiting durability (`?wait=true`), so flushes span
+  several requests
+
+plus the one-pass validation of a request body. Every path rewrites the
+same keys, so all but the first pass exercise the ON CONFLICT update.
+
+Run from the project root (SQLite file by default; point
+BENCH_DATABASE_URL at PostgreSQL for representative numbers):
+
+    python -m benchmarks.bench_attendance [marks] [per_request] [clients]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+import orjson
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.entities.attendance import AttendanceMark, AttendanceStatus
+from app.infrastructure.api.routers.academic_router import AttendanceBatchDTO
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.batch_writer import WRITER_BATCH_ROWS
+from app.infrastructure.database.models.academic.attendance_model import AttendanceRecord
+from app.infrastructure.database.repositories.attendance_repository import (
+    AttendanceRepository,
+)
+
+STATUSES = list(AttendanceStatus)
+
+
+def _marks(count: int):
+    # A school day: students x periods x days
+    students = [uuid.uuid4() for _ in range(max(1, count // 40))]
+    start = date(2026, 9, 1)
+    marks = []
+    for i in range(count):
+        marks.append(
+            AttendanceMark(
+                student_id=students[i % len(students)],
+                session_date=start + timedelta(days=(i // len(students)) // 8),
+                period=(i // len(students)) % 8,
+                status=STATUSES[i % len(STATUSES)],
+            )
+        )
+    return marks
+
+
+def _requests(marks, per_request):
+    return [marks[i:i + per_request] for i in range(0, len(marks), per_request)]
+
+
+def _report(name: str, rows: int, elapsed: float) -> None:
+    print(f"{name:<40}{elapsed:>10.2f}{rows / elapsed:>14,.0f}")
+
+
+async def _per_request(factory, requests, method: str) -> None:
+    for batch in requests:
+        async with factory() as session:
+            repo = AttendanceRepository(session)
+            if method == "upsert_many":
+                await repo.upsert_many(
+                    batch, conflict_columns=("student_id", "session_date", "period")
+                )
+            else:
+                await repo.bulk_upsert(batch)
+
+
+async def _queued(factory, requests, clients: int) -> int:
+    writer = AttendanceRepository.bulk_writer(factory, max_pending=10_000_000)
+    flushes_before = WRITER_BATCH_ROWS.count(writer=writer.name)
+    pending = list(reversed(requests))
+
+    async def client() -> None:
+        while pending:
+            await writer.write(pending.pop())
+
+    await asyncio.gather(*(client() for _ in range(clients)))
+    await writer.stop()
+    return WRITER_BATCH_ROWS.count(writer=writer.name) - flushes_before
+
+
+def _bench_validation(marks, per_request: int) -> None:
+    body = orjson.dumps(
+        {
+            "marks": [
+                {
+                    "student_id": str(m.student_id),
+                    "session_date": m.session_date.isoformat(),
+                    "period": m.period,
+                    "status": m.status.value,
+                }
+                for m in marks[:per_request]
+            ]
+        }
+    )
+    rounds = 50
+    start = time.perf_counter()
+    for _ in range(rounds):
+        AttendanceBatchDTO.model_validate_json(body)
+    _report("validate body (model_validate_json)", per_request * rounds, time.perf_counter() - start)
+
+
+async def main(count: int, per_request: int, clients: int) -> None:
+    tmpdir = tempfile.mkdtemp()
+    url = os.getenv(
+        "BENCH_DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    )
+    engine = create_async_engine(url)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[AttendanceRecord.__table__])
+        await conn.run_sync(Base.metadata.create_all, tables=[AttendanceRecord.__table__])
+
+    marks = _marks(count)
+    requests = _requests(marks, per_request)
+    print(f"{count} marks, {per_request}/request, {clients} clients ({engine.dialect.name})")
+    print(f"{'path':<40}{'seconds':>10}{'rows/s':>14}")
+    _bench_validation(marks, per_request)
+
+    try:
+        for name, method in (
+            ("upsert_many() per request", "upsert_many"),
+            ("bulk_upsert() per request", "bulk_upsert"),
+        ):
+            start = time.perf_counter()
+            await _per_request(factory, requests, method)
+            _report(name, count, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        flushes = await _queued(factory, requests, clients)
+        _report(f"BatchWriter ({flushes} flushes)", count, time.perf_counter() - start)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    asyncio.run(main(*(args + [100_000, 1000, 8][len(args):])))
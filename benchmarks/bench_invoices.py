@@ -0,0 +1,129 @@
+"""
+Benchmark: monthly invoice generation throughput.
+
+Loads `students` synthetic active students spread over `institutions`
+institutions of uneven size, each with a handful of active fees, then
+bills one period with InvoiceGenerationJob and prints its report
+(invoices/s, lines/s). A second run of the same period is timed too:
+a top-up run that walks every student again but finds them all billed.
+
+Run from the project root (point BENCH_DATABASE_URL at PostgreSQL for
+representative numbers; SQLite runs a single writer):
+
+    python -m benchmarks.bench_invoices [students] [institutions] [workers]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.billing import InvoiceGenerationJob
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.models.financial.invoice_model import (
+    BillingCheckpointRecord,
+    BillingRunRecord,
+    FeeRecord,
+    InvoiceLineRecord,
+    InvoiceRecord,
+)
+
+TABLES = [
+    StudentRecord.__table__,
+    FeeRecord.__table__,
+    InvoiceRecord.__table__,
+    InvoiceLineRecord.__table__,
+    BillingRunRecord.__table__,
+    BillingCheckpointRecord.__table__,
+]
+FEES = [("tuition", "Tuition", "320.00"), ("lunch", "Lunch", "45.50"), ("transport", "Transport", "60.00")]
+INSERT_CHUNK = 10_000
+PERIOD = date(2026, 11, 1)
+
+
+def _institutions(count: int):
+    rng = random.Random(2026)
+    schools = [uuid.uuid4() for _ in range(count)]
+    # Uneven sizes: a few large institutions and a long tail
+    weights = [rng.paretovariate(1.5) for _ in schools]
+    return schools, weights
+
+
+async def _load(factory, students: int, institutions: int) -> None:
+    rng = random.Random(2026)
+    schools, weights = _institutions(institutions)
+    async with factory() as session:
+        await session.execute(
+            insert(FeeRecord),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "institution_id": school,
+                    "code": code,
+                    "description": description,
+                    "amount": Decimal(amount),
+                }
+                for school in schools
+                for code, description, amount in FEES[: 1 + rng.randrange(len(FEES))]
+            ],
+        )
+        rows = []
+        for i, school in enumerate(rng.choices(schools, weights, k=students)):
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "institution_id": school,
+                    "student_number": f"S{i:07d}",
+                    "first_name": "Student",
+                    "last_name": f"N{i}",
+                }
+            )
+            if len(rows) == INSERT_CHUNK:
+                await session.execute(insert(StudentRecord), rows)
+                rows = []
+        if rows:
+            await session.execute(insert(StudentRecord), rows)
+        await session.commit()
+
+
+async def main(students: int, institutions: int, workers: int) -> None:
+    tmpdir = tempfile.mkdtemp()
+    url = os.getenv(
+        "BENCH_DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    )
+    engine = create_async_engine(url)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    try:
+        start = time.perf_counter()
+        await _load(factory, students, institutions)
+        print(
+            f"{students} students in {institutions} institutions loaded in "
+            f"{time.perf_counter() - start:.1f}s ({engine.dialect.name})"
+        )
+
+        job = InvoiceGenerationJob(factory, workers=workers, progress_interval=0)
+        print(await job.run(PERIOD))
+
+        start = time.perf_counter()
+        again = await InvoiceGenerationJob(factory, workers=workers, progress_interval=0).run(PERIOD)
+        print(f"top-up run: {again.invoices} new invoices in {time.perf_counter() - start:.2f}s")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    asyncio.run(main(*(args + [500_000, 200, 4][len(args):])))
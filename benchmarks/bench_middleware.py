@@ -0,0 +1,132 @@
+"""
+Micro-benchmark: per-request overhead of the API middleware.
+
+Compares the pure ASGI middleware in app/infrastructure/api/middleware.py
+with the previous BaseHTTPMiddleware implementations (kept below as a
+baseline) by driving a minimal Starlette app in-process, without any
+network or server in the way.
+
+Run from the project root:
+
+    python -m benchmarks.bench_middleware [requests]
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from app.infrastructure.api.middleware import (
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+
+# ---------------------------------------------------------
+# Baseline: the former BaseHTTPMiddleware versions
+# ---------------------------------------------------------
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response: Response = await call_next(request)
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Cross-Origin-Opener-Policy"] = "same-origin"
+        return response
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start = time.time()
+        response = await call_next(request)
+        duration = (time.time() - start) * 1000
+        logging.getLogger(__name__).debug(
+            f"{request.method} {request.url.path} completed in {duration:.2f}ms "
+            f"status={response.status_code}"
+        )
+        return response
+
+
+async def _endpoint(request):
+    return PlainTextResponse("ok")
+
+
+def _build(middleware):
+    return Starlette(routes=[Route("/", _endpoint)], middleware=middleware)
+
+
+async def _drive(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/",
+        "raw_path": b"/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    never = asyncio.Event()
+
+    def make_receive():
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Like a real server: block until the client disconnects
+            await never.wait()
+
+        return receive
+
+    async def send(message):
+        pass
+
+    for _ in range(200):  # warm-up
+        await app(dict(scope), make_receive(), send)
+
+    start = time.perf_counter_ns()
+    for _ in range(requests):
+        await app(dict(scope), make_receive(), send)
+    return (time.perf_counter_ns() - start) / requests / 1000
+
+
+async def main(requests: int) -> None:
+    variants = {
+        "no middleware": [],
+        "BaseHTTPMiddleware": [
+            Middleware(LegacyRequestLoggingMiddleware),
+            Middleware(LegacySecurityHeadersMiddleware),
+        ],
+        "pure ASGI": [
+            Middleware(RequestLoggingMiddleware),
+            Middleware(SecurityHeadersMiddleware),
+        ],
+    }
+
+    results = {name: await _drive(_build(mw), requests) for name, mw in variants.items()}
+    base = results["no middleware"]
+
+    print(f"{requests} requests per variant")
+    print(f"{'variant':<22}{'us/request':>12}{'overhead us':>14}")
+    for name, micros in results.items():
+        print(f"{name:<22}{micros:>12.1f}{micros - base:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
@@ -0,0 +1,88 @@
+"""
+Benchmark: serializing a 10k-item list endpoint payload.
+
+Compares FastAPI's default path (jsonable_encoder + json.dumps, what
+JSONResponse does), to_dict() + orjson, and the pydantic-core path used
+by FastJSONResponse (BaseDTO.list_to_json_bytes).
+
+Run from the project root:
+
+    python -m benchmarks.bench_serialization [items] [rounds]
+"""
+
+import sys
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from app.common.dto import BaseDTO
+from app.infrastructure.api.responses import FastJSONResponse
+
+
+class StudentDTO(BaseDTO):
+    id: uuid.UUID
+    first_name: str
+    last_name: str
+    birth_date: date
+    grade_level: int
+    average: float
+    active: bool
+    enrolled_at: datetime
+
+
+def _payload(items: int):
+    now = datetime.now(timezone.utc)
+    return [
+        StudentDTO(
+            id=uuid.uuid4(),
+            first_name=f"Name{i}",
+            last_name=f"Surname{i}",
+            birth_date=date(2010, 1 + i % 12, 1 + i % 28),
+            grade_level=i % 12,
+            average=3.5 + (i % 10) / 10,
+            active=i % 7 != 0,
+            enrolled_at=now,
+        )
+        for i in range(items)
+    ]
+
+
+def _bench(name, fn, rounds, items):
+    fn()  # warm-up (builds cached serializers)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        body = fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{name:<36}{elapsed * 1000:>10.2f}{items / elapsed:>14,.0f}{len(body):>12,}")
+    return elapsed
+
+
+def main(items: int, rounds: int) -> None:
+    dtos = _payload(items)
+    fast = FastJSONResponse(content=None)
+
+    print(f"{items} items, {rounds} rounds")
+    print(f"{'path':<36}{'ms/resp':>10}{'items/s':>14}{'bytes':>12}")
+    baseline = _bench(
+        "jsonable_encoder + json.dumps",
+        lambda: JSONResponse(content=None).render(jsonable_encoder(dtos)),
+        rounds,
+        items,
+    )
+    _bench(
+        "to_dict() + orjson",
+        lambda: orjson.dumps([d.model_dump(mode="json") for d in dtos]),
+        rounds,
+        items,
+    )
+    best = _bench("FastJSONResponse (pydantic-core)", lambda: fast.render(dtos), rounds, items)
+    print(f"speed-up vs default: {baseline / best:.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [10_000, 20][len(args):]))
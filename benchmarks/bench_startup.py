@@ -0,0 +1,83 @@
+"""
+Benchmark: cold-start import cost of the web app.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters
+(what an autoscaled worker pays before serving its first request) and
+reports the cumulative import time plus the most expensive modules.
+Also lists heavy modules that should not be loaded at import time.
+
+Run from the project root:
+
+    python -m benchmarks.bench_startup [runs] [top]
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+APP_MODULE = "app.infrastructure.api.main"
+
+# Only needed by Alembic/scripts or created lazily on first use
+LAZY_MODULES = ("psycopg2", "alembic", "asyncpg")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(module: str = APP_MODULE) -> Tuple[float, Dict[str, float], List[str]]:
+    """
+    Import `module` in a fresh interpreter. Returns the cumulative
+    import time (seconds), cumulative seconds per module, and the
+    LAZY_MODULES that were loaded.
+    """
+    probe = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        check=True,
+    )
+
+    per_module: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        _self_us, cumulative_us, name = fields
+        per_module[name.strip()] = int(cumulative_us) / 1e6
+
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return per_module.get(module, 0.0), per_module, loaded
+
+
+def main(runs: int, top: int) -> None:
+    totals = []
+    for _ in range(runs):
+        total, per_module, loaded = import_times()
+        totals.append(total)
+
+    print(f"import {APP_MODULE}: best {min(totals) * 1000:.0f}ms, "
+          f"worst {max(totals) * 1000:.0f}ms over {runs} runs")
+    print(f"\n{'module':<60}{'cumulative ms':>14}")
+    heaviest = sorted(
+        ((n, t) for n, t in per_module.items() if "." not in n or n.startswith("app.")),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    for name, seconds in heaviest[:top]:
+        print(f"{name:<60}{seconds * 1000:>14.1f}")
+    print(f"\nlazy modules loaded at import: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*(args + [5, 20][len(args):]))
@@ -0,0 +1,149 @@
+"""
+Benchmark: student search latency on a synthetic roster.
+
+Loads `students` synthetic students (names built from syllables, so
+they repeat the way real names do) and times StudentRepository.search()
+for typical staff queries:
+
+- autocomplete prefixes as they are typed ("g", "ga", "gar", ...)
+- two-word prefixes ("ana gar") and student-number prefixes
+- typo-tolerant similarity queries
+- the fifth page of a common prefix, through the keyset cursor
+
+reporting p50/p95/max per query kind. On PostgreSQL these run on the
+trigram / tsvector GIN indexes; on SQLite (the default) on the
+in-process fallback index, whose build time is reported too.
+
+Run from the project root (point BENCH_DATABASE_URL at PostgreSQL for
+representative numbers):
+
+    python -m benchmarks.bench_student_search [students] [rounds]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.repositories.student_repository import StudentRepository
+
+SYLLABLES = ["an", "ar", "be", "ca", "da", "el", "go", "ia", "lo", "ma", "na", "ri", "sa", "to", "vi", "za"]
+INSERT_CHUNK = 10_000
+
+
+def _names(rng: random.Random, count: int, syllables: int):
+    names = set()
+    while len(names) < count:
+        names.add("".join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize())
+    return sorted(names)
+
+
+def _pools():
+    rng = random.Random(2026)
+    return _names(rng, 200, 2), _names(rng, 5000, 4)
+
+
+def _roster(count: int):
+    rng = random.Random(2026)
+    first, last = _pools()
+    for i in range(count):
+        yield {
+            "id": uuid.uuid4(),
+            "student_number": f"S{2019 + i % 8}-{i:07d}",
+            "first_name": rng.choice(first),
+            "last_name": rng.choice(last),
+        }
+
+
+async def _load(factory, count: int) -> None:
+    rows = []
+    async with factory() as session:
+        for row in _roster(count):
+            rows.append(row)
+            if len(rows) == INSERT_CHUNK:
+                await session.execute(insert(StudentRecord), rows)
+                rows = []
+        if rows:
+            await session.execute(insert(StudentRecord), rows)
+        await session.commit()
+
+
+def _queries(count: int):
+    rng = random.Random(7)
+    first, last = (rng.sample(pool, 50) for pool in _pools())
+    return {
+        "prefix, 1-3 chars": [n[:k].lower() for n in last for k in (1, 2, 3)],
+        "prefix, full word": [n.lower() for n in last],
+        "prefix, two words": [f"{f[:2]} {l[:3]}".lower() for f, l in zip(first, last)],
+        "prefix, student number": [f"S{2019 + i % 8}-{i:07d}"[:10] for i in range(0, count, max(1, count // 50))],
+        "similar (one typo)": [n.lower()[:-1] + "x" for n in last],
+    }
+
+
+def _report(name: str, timings) -> None:
+    timings = sorted(t * 1000 for t in timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"{name:<28}{len(timings):>8}{statistics.median(timings):>10.2f}{p95:>10.2f}{timings[-1]:>10.2f}")
+
+
+async def main(count: int, rounds: int) -> None:
+    tmpdir = tempfile.mkdtemp()
+    url = os.getenv(
+        "BENCH_DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'bench.db')}"
+    )
+    engine = create_async_engine(url)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[StudentRecord.__table__])
+        await conn.run_sync(Base.metadata.create_all, tables=[StudentRecord.__table__])
+
+    try:
+        start = time.perf_counter()
+        await _load(factory, count)
+        print(f"{count} students loaded in {time.perf_counter() - start:.1f}s ({engine.dialect.name})")
+
+        async with factory() as session:
+            repo = StudentRepository(session)
+            if engine.dialect.name != "postgresql":
+                start = time.perf_counter()
+                await repo.fallback_index()
+                print(f"fallback index built in {time.perf_counter() - start:.1f}s")
+
+            print(f"{'query':<28}{'n':>8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+            for name, queries in _queries(count).items():
+                mode = "similar" if name.startswith("similar") else "prefix"
+                timings = []
+                for _ in range(rounds):
+                    for query in queries:
+                        start = time.perf_counter()
+                        await repo.search(query, mode=mode, limit=20)
+                        timings.append(time.perf_counter() - start)
+                _report(name, timings)
+
+            timings = []
+            for query in _queries(count)["prefix, 1-3 chars"][2::3]:
+                page = await repo.search(query, limit=20)
+                for _ in range(4):
+                    if page.next_cursor is None:
+                        break
+                    start = time.perf_counter()
+                    page = await repo.search(query, limit=20, cursor=page.next_cursor)
+                    timings.append(time.perf_counter() - start)
+            if timings:
+                _report("next page (keyset cursor)", timings)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    asyncio.run(main(*(args + [1_000_000, 3][len(args):])))
@@ -11,7 +11,10 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.infrastructure.api.main import app
-from app.infrastructure.database.session import get_async_session
+from app.infrastructure.database.session import (
+    get_async_session,
+    instrument_query_timing,
+)
 from app.config.settings import settings
 
 
@@ -47,6 +50,8 @@ async def async_engine():
         echo=False,
         future=True,
     )
+    # Same SQL timing hooks as the runtime engine (Server-Timing db span)
+    instrument_query_timing(engine)
     yield engine
     await engine.dispose()
 
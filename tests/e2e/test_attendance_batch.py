@@ -0,0 +1,101 @@
+import uuid
+from datetime import date
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from app.infrastructure.api.main import app
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.academic.attendance_model import AttendanceRecord
+from app.infrastructure.database.repositories.attendance_repository import (
+    AttendanceRepository,
+    get_attendance_writer,
+)
+
+
+@pytest.fixture
+async def writer(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[AttendanceRecord.__table__])
+    writer = AttendanceRepository.bulk_writer(async_session_factory, flush_interval=0.01)
+    app.dependency_overrides[get_attendance_writer] = lambda: writer
+    yield writer
+    app.dependency_overrides.clear()
+    await writer.stop()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[AttendanceRecord.__table__])
+
+
+async def _post(payload, wait=True):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        return await client.post(
+            "/api/academic/attendance/batch", params={"wait": wait}, json=payload
+        )
+
+
+async def _stored(session_factory):
+    async with session_factory() as session:
+        rows = await session.execute(
+            select(AttendanceRecord.student_id, AttendanceRecord.period, AttendanceRecord.status)
+        )
+        return {(r.student_id, r.period): r.status for r in rows}
+
+
+@pytest.mark.e2e
+async def test_batch_is_upserted_on_student_date_and_period(writer, async_session_factory):
+    first, second = str(uuid.uuid4()), str(uuid.uuid4())
+    marks = [
+        {"student_id": first, "session_date": "2026-10-19", "status": "absent"},
+        {"student_id": second, "session_date": "2026-10-19", "status": "present"},
+        # Same key as the first mark: last one wins
+        {"student_id": first, "session_date": "2026-10-19", "status": "late"},
+        {"student_id": first, "session_date": "2026-10-19", "period": 2, "status": "present"},
+    ]
+
+    response = await _post({"marks": marks})
+    assert response.status_code == 200
+    assert response.json() == {"accepted": 4, "stored": True}
+
+    correction = [{"student_id": second, "session_date": "2026-10-19", "status": "excused"}]
+    accepted = await _post({"marks": correction}, wait=False)
+    assert accepted.status_code == 202
+    await writer.stop()
+
+    assert await _stored(async_session_factory) == {
+        (uuid.UUID(first), 0): "late",
+        (uuid.UUID(first), 2): "present",
+        (uuid.UUID(second), 0): "excused",
+    }
+
+
+@pytest.mark.e2e
+async def test_one_invalid_mark_rejects_the_whole_batch(writer, async_session_factory):
+    marks = [
+        {"student_id": str(uuid.uuid4()), "session_date": "2026-10-19", "status": "present"},
+        {"student_id": str(uuid.uuid4()), "session_date": "2026-10-19", "status": "asleep"},
+    ]
+
+    response = await _post({"marks": marks})
+
+    assert response.status_code == 422
+    assert [e["loc"] for e in response.json()["detail"]] == [["body", "marks", 1, "status"]]
+    async with async_session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(AttendanceRecord)) == 0
+
+
+@pytest.mark.e2e
+async def test_student_history_is_read_back_in_order(writer, async_session_factory):
+    student = uuid.uuid4()
+    marks = [
+        {"student_id": str(student), "session_date": day, "period": period, "status": "present"}
+        for day, period in (("2026-10-20", 1), ("2026-10-19", 2), ("2026-10-19", 1))
+    ]
+    assert (await _post({"marks": marks})).status_code == 200
+
+    async with async_session_factory() as session:
+        history = await AttendanceRepository(session).for_student(
+            student, date(2026, 10, 19), date(2026, 10, 19)
+        )
+
+    assert [(m.session_date.day, m.period) for m in history] == [(19, 1), (19, 2)]
@@ -0,0 +1,85 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+
+from app.infrastructure.api.main import app
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.billing import InvoiceGenerationJob
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.models.financial.invoice_model import (
+    BillingCheckpointRecord,
+    BillingRunRecord,
+    FeeRecord,
+    InvoiceLineRecord,
+    InvoiceRecord,
+)
+from app.infrastructure.database.session import get_read_session
+
+TABLES = [
+    StudentRecord.__table__,
+    FeeRecord.__table__,
+    InvoiceRecord.__table__,
+    InvoiceLineRecord.__table__,
+    BillingRunRecord.__table__,
+    BillingCheckpointRecord.__table__,
+]
+
+
+@pytest.fixture
+async def api(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    async def session():
+        async with async_session_factory() as s:
+            yield s
+
+    app.dependency_overrides[get_read_session] = session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+    app.dependency_overrides.clear()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+
+
+@pytest.mark.e2e
+async def test_billing_run_progress_and_student_invoices(api, async_session_factory):
+    school, student = uuid.uuid4(), uuid.uuid4()
+    async with async_session_factory() as session:
+        await session.execute(
+            insert(StudentRecord),
+            [{"id": student, "institution_id": school, "student_number": "S1",
+              "first_name": "Ana", "last_name": "Garcia"}],
+        )
+        await session.execute(
+            insert(FeeRecord),
+            [
+                {"id": uuid.uuid4(), "institution_id": school, "code": "tuition",
+                 "description": "Tuition", "amount": Decimal("300.00")},
+                {"id": uuid.uuid4(), "institution_id": school, "code": "lunch",
+                 "description": "Lunch", "amount": Decimal("45.50")},
+            ],
+        )
+        await session.commit()
+    report = await InvoiceGenerationJob(async_session_factory).run(date(2026, 11, 1))
+
+    run = await api.get(f"/api/financial/billing-runs/{report.run_id}")
+    assert run.status_code == 200
+    body = run.json()
+    assert (body["status"], body["period"], body["invoices"], body["lines"]) == ("completed", "2026-11-01", 1, 2)
+    assert body["institutions"][0]["done"] is True
+
+    invoices = await api.get(f"/api/financial/students/{student}/invoices")
+    assert invoices.status_code == 200
+    [invoice] = invoices.json()
+    assert invoice["total"] == "345.50"
+    assert [line["description"] for line in invoice["lines"]] == ["Lunch", "Tuition"]
+
+    missing = await api.get(f"/api/financial/billing-runs/{uuid.uuid4()}")
+    assert missing.status_code == 404
+    bad_period = await api.post("/api/financial/billing-runs", json={"period": "2026-13"})
+    assert bad_period.status_code == 422
@@ -0,0 +1,78 @@
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.infrastructure.api.compression import CompressionMiddleware
+from app.infrastructure.api.http_cache import (
+    HTTPCacheMiddleware,
+    HTTPResponseCache,
+    cache_control,
+    etag_from_timestamps,
+    not_modified,
+)
+
+calls = {"roster": 0}
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(HTTPCacheMiddleware, cache=HTTPResponseCache(max_entries=2))
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/roster")
+    @cache_control(max_age=60, shared=True)
+    async def roster():
+        calls["roster"] += 1
+        return {"students": [f"student-{i}" for i in range(100)]}
+
+    @app.get("/me")
+    @cache_control(max_age=0)
+    async def me(request: Request):
+        etag = etag_from_timestamps("user-1", "2026-01-01T00:00:00")
+        response = not_modified(request, etag)
+        return response if response is not None else {"name": "Ana"}
+
+    return app
+
+
+@pytest.fixture
+async def cache_client():
+    calls["roster"] = 0
+    async with AsyncClient(transport=ASGITransport(app=_build_app()), base_url="http://t") as ac:
+        yield ac
+
+
+@pytest.mark.e2e
+async def test_shared_route_is_served_from_store_and_revalidated(cache_client):
+    first = await cache_client.get("/roster", headers={"accept-encoding": "gzip"})
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] in ("br", "zstd", "gzip")
+    assert etag.startswith('W/"')   # weakened by the compression layer
+    assert first.headers["cache-control"] == "public, max-age=60"
+    assert first.json()["students"][0] == "student-0"
+
+    again = await cache_client.get("/roster", headers={"accept-encoding": "identity"})
+    revalidated = await cache_client.get("/roster", headers={"if-none-match": etag})
+
+    assert again.json() == first.json()
+    assert again.headers["etag"] == etag[2:]
+    assert "content-encoding" not in again.headers
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert calls["roster"] == 1
+
+    # Credentialed requests bypass the shared store
+    await cache_client.get("/roster", headers={"authorization": "Bearer x"})
+    assert calls["roster"] == 2
+
+
+@pytest.mark.e2e
+async def test_private_route_gets_etag_and_handler_level_304(cache_client):
+    first = await cache_client.get("/me")
+
+    assert first.headers["cache-control"] == "private, max-age=0"
+    second = await cache_client.get("/me", headers={"if-none-match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.mark.e2e
+async def test_internal_metrics_endpoint(client):
+    response = await client.get("/internal/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "db_pool_checkout_seconds" in response.text
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.mark.e2e
+async def test_security_headers_are_added(client):
+    response = await client.get("/api/health")
+
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
@@ -0,0 +1,53 @@
+import pytest
+
+from app.infrastructure.api.main import app
+from app.infrastructure.database.health import (
+    DatabaseHealthMonitor,
+    get_health_monitor,
+)
+
+
+@pytest.fixture
+def monitor(async_engine, client):
+    monitor = DatabaseHealthMonitor(lambda: async_engine, lambda: None, interval=60)
+    app.dependency_overrides[get_health_monitor] = lambda: monitor
+    return monitor
+
+
+@pytest.mark.e2e
+async def test_livez_is_dependency_free(client):
+    response = await client.get("/api/livez")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.e2e
+async def test_readyz_is_503_until_first_check_then_ready(client, monitor):
+    response = await client.get("/api/readyz")
+    assert response.status_code == 503
+    assert response.json()["status"] == "starting"
+
+    await monitor.check_once()
+
+    response = await client.get("/api/readyz")
+    assert response.status_code == 200
+    assert response.json()["database"] == "ok"
+
+
+@pytest.mark.e2e
+async def test_readyz_reports_unreachable_database(client):
+    class _BrokenEngine:
+        def connect(self):
+            raise ConnectionRefusedError("db down")
+
+        pool = None
+
+    monitor = DatabaseHealthMonitor(lambda: _BrokenEngine(), lambda: None, interval=60)
+    app.dependency_overrides[get_health_monitor] = lambda: monitor
+    await monitor.check_once()
+
+    response = await client.get("/api/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["database"] == "error"
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.infrastructure.api.rate_limit import (
+    LoadShedder,
+    RateLimit,
+    RateLimitMiddleware,
+    forwarded_client_key,
+    rate_limit,
+)
+
+
+def _build_app(limits, shedder=None) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits=limits,
+        shedder=shedder,
+        exempt_paths=["/livez"],
+    )
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    @app.post("/reports")
+    @rate_limit(per_minute=60, burst=1)
+    async def reports():
+        return {"ok": True}
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.05)
+        return {}
+
+    @app.get("/livez")
+    async def livez():
+        return {}
+
+    return app
+
+
+def _client(app):
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://t")
+
+
+@pytest.mark.e2e
+async def test_client_and_route_buckets_return_429_with_retry_after():
+    app = _build_app([RateLimit.per_minute(60, burst=3)])
+    async with _client(app) as client:
+        statuses = [(await client.get("/items")).status_code for _ in range(4)]
+        limited = await client.get("/items")
+        probe = await client.get("/livez")
+
+    assert statuses == [200, 200, 200, 429]
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
+    assert probe.status_code == 200
+
+    app = _build_app([RateLimit.per_minute(600)])
+    async with _client(app) as client:
+        first = await client.post("/reports")
+        second = await client.post("/reports")
+        other = await client.get("/items")
+
+    assert (first.status_code, second.status_code, other.status_code) == (200, 429, 200)
+
+
+@pytest.mark.e2e
+async def test_load_shedding_on_in_flight_and_pool_wait():
+    shedder = LoadShedder(max_in_flight=1, pool_wait_getter=lambda: 0.0)
+    app = _build_app([], shedder)
+    async with _client(app) as client:
+        responses = await asyncio.gather(client.get("/slow"), client.get("/slow"))
+
+    assert sorted(r.status_code for r in responses) == [200, 503]
+    assert shedder.in_flight == 0
+
+    shedder = LoadShedder(max_pool_wait=0.5, pool_wait_getter=lambda: 2.0)
+    async with _client(_build_app([], shedder)) as client:
+        shed = await client.get("/items")
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+
+
+@pytest.mark.e2e
+async def test_clients_behind_a_trusted_proxy_get_their_own_buckets():
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits=[RateLimit.per_minute(60, burst=2)],
+        key_func=forwarded_client_key(["10.0.0.5"]),
+    )
+
+    @app.get("/items")
+    async def items():
+        return []
+
+    # Every request arrives from the proxy's address
+    transport = ASGITransport(app=app, client=("10.0.0.5", 40000))
+    async with AsyncClient(transport=transport, base_url="http://t") as client:
+        statuses = [
+            (await client.get("/items", headers={"x-forwarded-for": f"203.0.113.{i}"})).status_code
+            for i in range(50)
+            for _ in range(2)
+        ]
+        repeat = await client.get("/items", headers={"x-forwarded-for": "203.0.113.7"})
+        # A spoofed left-most entry does not escape the bucket of the real client
+        spoofed = await client.get(
+            "/items", headers={"x-forwarded-for": "198.51.100.1, 203.0.113.7"}
+        )
+
+    assert set(statuses) == {200}
+    assert (repeat.status_code, spoofed.status_code) == (429, 429)
+
+
+@pytest.mark.e2e
+def test_forwarded_client_key_ignores_headers_from_untrusted_peers():
+    key = forwarded_client_key(["10.0.0.0/8"])
+    scope = {"client": ("192.0.2.1", 1), "headers": [(b"x-forwarded-for", b"203.0.113.9")]}
+    assert key(scope) == "192.0.2.1"
+    scope["client"] = ("10.1.2.3", 1)
+    assert key(scope) == "203.0.113.9"
@@ -0,0 +1,74 @@
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.infrastructure.api.dependencies import get_db_session
+from app.infrastructure.api.main import app
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.academic.grade_model import (
+    GradeAggregate,
+    GradeRecord,
+)
+from app.infrastructure.database.session import get_read_session
+
+TABLES = [GradeRecord.__table__, GradeAggregate.__table__]
+
+
+@pytest.fixture
+async def api(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    async def session():
+        async with async_session_factory() as s:
+            yield s
+
+    app.dependency_overrides[get_db_session] = session
+    app.dependency_overrides[get_read_session] = session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+    app.dependency_overrides.clear()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+
+
+@pytest.mark.e2e
+async def test_grades_feed_the_report_card(api):
+    student, math, art = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+    grades = [
+        {"student_id": student, "course_id": math, "assessment": "exam", "score": "92", "weight": "2"},
+        {"student_id": student, "course_id": math, "assessment": "quiz", "score": "80"},
+        {"student_id": student, "course_id": art, "assessment": "project", "score": 17, "max_score": 25},
+    ]
+
+    created = await api.post("/api/academic/grades", json={"grades": grades})
+    assert created.status_code == 201
+    assert created.json()["saved"] == 3
+
+    response = await api.get(f"/api/academic/students/{student}/report-card")
+    assert response.status_code == 200
+    card = response.json()
+    by_course = {c["course_id"]: c for c in card["courses"]}
+    assert by_course[math]["weighted_average"] == "88.00"
+    assert by_course[art]["average"] == "68.00"
+    assert card["gpa"] == "2.00"    # B (3) and D (1)
+
+    etag = response.headers["etag"]
+    cached = await api.get(
+        f"/api/academic/students/{student}/report-card", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.e2e
+async def test_invalid_grade_is_rejected(api):
+    grade = {
+        "student_id": str(uuid.uuid4()),
+        "course_id": str(uuid.uuid4()),
+        "assessment": "exam",
+        "score": "120",
+        "max_score": "100",
+    }
+    response = await api.post("/api/academic/grades", json={"grades": [grade]})
+    assert response.status_code == 422
@@ -0,0 +1,103 @@
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.infrastructure.api.dependencies import get_db_session
+from app.infrastructure.api.main import app
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.administrative.schedule_model import (
+    ScheduleEntryRecord,
+)
+from app.infrastructure.database.session import get_read_session
+
+TABLES = [ScheduleEntryRecord.__table__]
+
+
+@pytest.fixture
+async def api(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    async def session():
+        async with async_session_factory() as s:
+            yield s
+
+    app.dependency_overrides[get_db_session] = session
+    app.dependency_overrides[get_read_session] = session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+    app.dependency_overrides.clear()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+
+
+def _entry(room, starts, ends, **ids):
+    body = {
+        "room_id": str(room),
+        "starts_at": f"2026-10-19T{starts}:00Z",
+        "ends_at": f"2026-10-19T{ends}:00Z",
+    }
+    body.update({k: str(v) for k, v in ids.items()})
+    return body
+
+
+@pytest.mark.e2e
+async def test_timetable_is_saved_only_without_conflicts(api):
+    room_a, room_b, teacher = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    first = [
+        _entry(room_a, "09:00", "10:00", teacher_id=teacher),
+        _entry(room_a, "10:00", "11:00"),
+    ]
+    created = await api.post("/api/admin/schedule", json={"entries": first})
+    assert created.status_code == 201
+    assert created.json()["saved"] == 2
+    stored_id = created.json()["ids"][0]
+
+    # The teacher is already in room A at 09:30
+    clash = [_entry(room_b, "09:30", "10:30", teacher_id=teacher)]
+    checked = await api.post("/api/admin/schedule/conflicts", json={"entries": clash})
+    assert checked.status_code == 200
+    conflicts = checked.json()["conflicts"]
+    assert [(c["resource"], c["scheduled_id"]) for c in conflicts] == [("teacher", stored_id)]
+
+    rejected = await api.post("/api/admin/schedule", json={"entries": clash})
+    assert rejected.status_code == 409
+    assert rejected.json()["conflicts"] == conflicts
+
+    # Moving the stored entry out of the way makes room for it
+    moved = _entry(room_a, "08:00", "09:00", teacher_id=teacher, id=stored_id)
+    saved = await api.post("/api/admin/schedule", json={"entries": [moved] + clash})
+    assert saved.status_code == 201
+
+
+@pytest.mark.e2e
+async def test_swapping_two_slots_is_not_a_conflict(api):
+    room, teacher = uuid.uuid4(), uuid.uuid4()
+    first = [
+        _entry(room, "09:00", "10:00", teacher_id=teacher),
+        _entry(room, "10:00", "11:00", teacher_id=teacher),
+    ]
+    created = await api.post("/api/admin/schedule", json={"entries": first})
+    early, late = created.json()["ids"]
+
+    swap = [
+        _entry(room, "10:00", "11:00", teacher_id=teacher, id=early),
+        _entry(room, "09:00", "10:00", teacher_id=teacher, id=late),
+    ]
+    swapped = await api.post("/api/admin/schedule", json={"entries": swap})
+
+    assert swapped.status_code == 201
+    assert swapped.json()["ids"] == [early, late]
+
+
+@pytest.mark.e2e
+async def test_timetable_validation_errors(api):
+    room = uuid.uuid4()
+    naive = {"room_id": str(room), "starts_at": "2026-10-19T09:00:00", "ends_at": "2026-10-19T10:00:00"}
+    response = await api.post("/api/admin/schedule/conflicts", json={"entries": [naive]})
+    assert response.status_code == 422
+
+    backwards = _entry(room, "10:00", "09:00")
+    response = await api.post("/api/admin/schedule/conflicts", json={"entries": [backwards]})
+    assert response.status_code == 422
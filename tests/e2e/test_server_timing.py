@@ -0,0 +1,37 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.common.metrics import metrics
+from app.config.settings import settings
+from app.infrastructure.api.main import app, create_app
+
+
+@pytest.fixture
+async def timed_client(override_get_async_session, monkeypatch):
+    # The header is off by default; build an app with it enabled
+    monkeypatch.setattr(settings, "SERVER_TIMING_HEADER", True)
+    timed_app = create_app()
+    timed_app.dependency_overrides.update(app.dependency_overrides)
+    async with AsyncClient(transport=ASGITransport(app=timed_app), base_url="http://testserver") as client:
+        yield client
+
+
+@pytest.mark.e2e
+async def test_server_timing_breakdown_and_route_histogram(timed_client):
+    response = await timed_client.get("/api/health")
+
+    header = response.headers["server-timing"]
+    assert 'db;dur=' in header and '1 queries' in header
+    assert "handler;dur=" in header
+    assert "total;dur=" in header
+
+    histogram = metrics.get("http_request_duration_seconds")
+    assert histogram.count(method="GET", route="/api/health") >= 1
+    assert "http_request_duration_quantile_seconds" in metrics.render_prometheus()
+
+
+@pytest.mark.e2e
+async def test_server_timing_header_is_off_by_default(client):
+    response = await client.get("/api/health")
+
+    assert "server-timing" not in response.headers
@@ -0,0 +1,106 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.entities.student import Student
+from app.infrastructure.api.dependencies import get_db_session
+from app.infrastructure.api.main import app
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.repositories import student_repository
+from app.infrastructure.database.repositories.student_repository import StudentRepository
+from app.infrastructure.database.session import get_read_session
+
+TABLES = [StudentRecord.__table__]
+
+ROSTER = [
+    ("S2024-0001", "Ana", "Garcia"),
+    ("S2024-0002", "Luis", "Garcia"),
+    ("S2023-0107", "Ana", "Garrido"),
+    ("S2024-0110", "Maria", "Ortiz"),
+    ("S2022-0042", "Pedro", "Gallardo"),
+]
+
+
+@pytest.fixture
+async def api(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+    async with async_session_factory() as session:
+        await StudentRepository(session).save_many(
+            [Student(student_number=n, first_name=f, last_name=l) for n, f, l in ROSTER]
+        )
+
+    async def session():
+        async with async_session_factory() as s:
+            yield s
+
+    app.dependency_overrides[get_db_session] = session
+    app.dependency_overrides[get_read_session] = session
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+    app.dependency_overrides.clear()
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+
+
+def _names(response):
+    return [f"{s['last_name']} {s['first_name']}" for s in response.json()["items"]]
+
+
+@pytest.mark.e2e
+async def test_prefix_search_pages_with_a_cursor(api):
+    first = await api.get("/api/admin/students/search", params={"q": "ga", "limit": 2})
+    assert first.status_code == 200
+    assert _names(first) == ["Gallardo Pedro", "Garcia Ana"]
+
+    cursor = first.json()["next_cursor"]
+    second = await api.get("/api/admin/students/search", params={"q": "ga", "limit": 2, "cursor": cursor})
+    assert _names(second) == ["Garcia Luis", "Garrido Ana"]
+    assert second.json()["next_cursor"] is None
+
+    by_number = await api.get("/api/admin/students/search", params={"q": "s2024-01"})
+    assert _names(by_number) == ["Ortiz Maria"]
+    both_words = await api.get("/api/admin/students/search", params={"q": "ana gar"})
+    assert _names(both_words) == ["Garcia Ana", "Garrido Ana"]
+
+
+@pytest.mark.e2e
+async def test_similar_search_and_new_students_are_found(api, async_session_factory):
+    typo = await api.get("/api/admin/students/search", params={"q": "ortis", "mode": "similar"})
+    assert _names(typo)[0] == "Ortiz Maria"
+
+    async with async_session_factory() as session:
+        await StudentRepository(session).save(
+            Student(student_number="S2025-0001", first_name="Olga", last_name="Ortega")
+        )
+    fresh = await api.get("/api/admin/students/search", params={"q": "orte"})
+    assert _names(fresh) == ["Ortega Olga"]
+
+
+@pytest.mark.e2e
+async def test_search_validation(api):
+    short = await api.get("/api/admin/students/search", params={"q": "or", "mode": "similar"})
+    assert short.status_code == 422
+    too_many = await api.get("/api/admin/students/search", params={"q": "ga", "limit": 1000})
+    assert too_many.status_code == 422
+    bad_cursor = await api.get("/api/admin/students/search", params={"q": "ga", "cursor": "nope"})
+    assert bad_cursor.status_code == 422
+
+
+@pytest.mark.e2e
+async def test_write_hooks_are_installed_by_the_first_fallback_index_build(api):
+    def installed():
+        return [event.contains(Session, name, fn) for name, fn in student_repository._HOOKS]
+
+    for name, fn in student_repository._HOOKS:
+        if event.contains(Session, name, fn):
+            event.remove(Session, name, fn)
+    student_repository.invalidate_student_index()
+    assert not any(installed())
+
+    response = await api.get("/api/admin/students/search", params={"q": "ortiz"})
+
+    assert _names(response) == ["Ortiz Maria"]
+    assert all(installed())
@@ -0,0 +1,97 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.core.entities.grade import Grade
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.models.academic.grade_model import (
+    GradeAggregate,
+    GradeRecord,
+)
+from app.infrastructure.database.repositories.grade_repository import GradeRepository
+
+TABLES = [GradeRecord.__table__, GradeAggregate.__table__]
+
+
+@pytest.fixture
+async def grade_tables(async_engine):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+    yield
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+
+
+def _grade(student, course, assessment, score, weight="1", max_score="100"):
+    return Grade(
+        student_id=student,
+        course_id=course,
+        assessment=assessment,
+        score=Decimal(score),
+        weight=Decimal(weight),
+        max_score=Decimal(max_score),
+    )
+
+
+async def _aggregates(session):
+    rows = await session.scalars(
+        select(GradeAggregate).order_by(GradeAggregate.student_id, GradeAggregate.course_id)
+    )
+    return [
+        (r.student_id, r.course_id, r.grade_count, Decimal(r.weight_sum), Decimal(r.percent_sum))
+        for r in rows
+        if r.grade_count
+    ]
+
+
+@pytest.mark.integration
+async def test_aggregates_follow_inserts_regrades_and_deletes(grade_tables, async_session_factory):
+    student, math, art = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    async with async_session_factory() as session:
+        repo = GradeRepository(session)
+        saved = await repo.save_grades(
+            [
+                _grade(student, math, "quiz", "80", weight="1"),
+                _grade(student, math, "exam", "45", weight="3", max_score="50"),
+                _grade(student, art, "project", "70"),
+            ]
+        )
+        # Re-grading replaces the score and keeps the row id
+        regraded = await repo.save_grades([_grade(student, math, "quiz", "100")])
+        assert regraded[0].id == saved[0].id
+
+        (math_avg,) = [a for a in await repo.course_averages(student) if a.course_id == math]
+        assert math_avg.grade_count == 2
+        assert math_avg.average == Decimal("95.00")             # (100 + 90) / 2
+        assert math_avg.weighted_average == Decimal("92.50")    # (100 + 3 * 90) / 4
+
+        await repo.delete(saved[2].id)
+        assert [a.course_id for a in await repo.course_averages(student)] == [math]
+
+
+@pytest.mark.integration
+async def test_rebuild_matches_incremental_maintenance(grade_tables, async_session_factory):
+    students = [uuid.uuid4() for _ in range(5)]
+    courses = [uuid.uuid4() for _ in range(3)]
+
+    async with async_session_factory() as session:
+        repo = GradeRepository(session)
+        for round_ in range(3):
+            await repo.save_grades(
+                [
+                    _grade(s, c, f"a{(i + round_) % 4}", str(50 + (i * 7 + round_) % 50), weight=str(1 + i % 3))
+                    for i, (s, c) in enumerate((s, c) for s in students for c in courses)
+                ]
+            )
+        incremental = await _aggregates(session)
+
+        # Drift the table, then rebuild it in small batches
+        await session.execute(GradeAggregate.__table__.update().values(grade_count=99))
+        await session.commit()
+        repo.bulk_batch_size = 2
+        await repo.rebuild_aggregates()
+
+        assert await _aggregates(session) == incremental
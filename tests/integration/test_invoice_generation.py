@@ -0,0 +1,175 @@
+import asyncio
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.common.exceptions import ConflictError
+from app.core.entities.invoice import BillingRunStatus
+from app.infrastructure.database import session as db_session
+from app.infrastructure.database.base import Base
+from app.infrastructure.database.billing import (
+    InvoiceGenerationJob,
+    start_billing_run,
+    stop_billing_runs,
+)
+from app.infrastructure.database.models.administrative.student_model import StudentRecord
+from app.infrastructure.database.models.financial.invoice_model import (
+    BillingCheckpointRecord,
+    BillingRunRecord,
+    FeeRecord,
+    InvoiceLineRecord,
+    InvoiceRecord,
+)
+from app.infrastructure.database.repositories.invoice_repository import InvoiceRepository
+
+TABLES = [
+    StudentRecord.__table__,
+    FeeRecord.__table__,
+    InvoiceRecord.__table__,
+    InvoiceLineRecord.__table__,
+    BillingRunRecord.__table__,
+    BillingCheckpointRecord.__table__,
+]
+NOVEMBER = date(2026, 11, 1)
+
+
+@pytest.fixture
+async def billing_tables(async_engine):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+    yield
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+
+
+async def _enroll(session, institution, count, active=True, start=0):
+    await session.execute(
+        insert(StudentRecord),
+        [
+            {
+                "id": uuid.uuid4(),
+                "institution_id": institution,
+                "student_number": f"{str(institution)[:8]}-{start + i:05d}",
+                "first_name": "Test",
+                "last_name": f"Student{start + i}",
+                "active": active,
+            }
+            for i in range(count)
+        ],
+    )
+
+
+async def _fee(session, institution, code, amount, active=True):
+    await session.execute(
+        insert(FeeRecord),
+        [{
+            "id": uuid.uuid4(),
+            "institution_id": institution,
+            "code": code,
+            "description": code.title(),
+            "amount": Decimal(amount),
+            "active": active,
+        }],
+    )
+
+
+async def _count(session, model, *where):
+    return await session.scalar(select(func.count()).select_from(model).where(*where))
+
+
+@pytest.mark.integration
+async def test_billing_run_invoices_every_active_student(billing_tables, async_session_factory):
+    school, college, no_fees = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    async with async_session_factory() as session:
+        await _enroll(session, school, 25)
+        await _enroll(session, school, 3, active=False, start=100)
+        await _enroll(session, college, 7)
+        await _enroll(session, no_fees, 4)
+        await _fee(session, school, "tuition", "300.00")
+        await _fee(session, school, "lunch", "45.50")
+        await _fee(session, school, "trip", "80.00", active=False)
+        await _fee(session, college, "tuition", "900.00")
+        await session.commit()
+
+    report = await InvoiceGenerationJob(async_session_factory, workers=3, chunk_size=10).run(NOVEMBER)
+
+    assert report.status is BillingRunStatus.COMPLETED
+    assert (report.institutions, report.invoices, report.lines) == (2, 32, 57)
+    async with async_session_factory() as session:
+        totals = dict(
+            (await session.execute(
+                select(InvoiceRecord.institution_id, func.sum(InvoiceRecord.total))
+                .group_by(InvoiceRecord.institution_id)
+            )).all()
+        )
+        assert Decimal(totals[school]) == Decimal("345.50") * 25
+        assert Decimal(totals[college]) == Decimal("900.00") * 7
+
+        run = await InvoiceRepository(session).get_run(report.run_id)
+        assert run.status is BillingRunStatus.COMPLETED
+        assert (run.invoices, run.lines) == (32, 57)
+        assert all(p.done for p in run.institutions)
+
+
+@pytest.mark.integration
+async def test_interrupted_run_resumes_from_its_checkpoint(billing_tables, async_session_factory):
+    school = uuid.uuid4()
+    async with async_session_factory() as session:
+        await _enroll(session, school, 12)
+        await _fee(session, school, "tuition", "100.00")
+        await session.commit()
+
+    # One chunk committed, then the process "dies"
+    job = InvoiceGenerationJob(async_session_factory, chunk_size=5)
+    run = await job.prepare(NOVEMBER)
+    async with async_session_factory() as session:
+        first = await InvoiceRepository(session).bill_chunk(run.id, school, 5)
+    assert (first.invoices, first.done) == (5, False)
+
+    resumed = await InvoiceGenerationJob(async_session_factory, chunk_size=5).run(NOVEMBER)
+    assert resumed.run_id == run.id
+    assert resumed.invoices == 7
+
+    async with async_session_factory() as session:
+        assert await _count(session, InvoiceRecord) == 12
+
+        # A later run of the same month bills only students enrolled since
+        await _enroll(session, school, 2, start=50)
+        await session.commit()
+    top_up = await InvoiceGenerationJob(async_session_factory).run(NOVEMBER)
+    assert top_up.run_id != run.id
+    assert top_up.invoices == 2
+    async with async_session_factory() as session:
+        assert await _count(session, InvoiceRecord) == 14
+        assert await _count(session, InvoiceLineRecord) == 14
+
+
+@pytest.mark.integration
+async def test_concurrent_starts_of_a_period_prepare_a_single_run(
+    billing_tables, async_session_factory, monkeypatch
+):
+    school = uuid.uuid4()
+    async with async_session_factory() as session:
+        await _enroll(session, school, 3)
+        await _fee(session, school, "tuition", "100.00")
+        await session.commit()
+    monkeypatch.setattr(db_session, "async_session", async_session_factory)
+
+    started, rejected = await asyncio.gather(
+        start_billing_run(NOVEMBER), start_billing_run(NOVEMBER), return_exceptions=True
+    )
+    assert isinstance(rejected, ConflictError)
+
+    for _ in range(100):
+        async with async_session_factory() as session:
+            run = await InvoiceRepository(session).get_run(started.id)
+        if run.status is BillingRunStatus.COMPLETED:
+            break
+        await asyncio.sleep(0.01)
+    assert run.invoices == 3
+    async with async_session_factory() as session:
+        assert await _count(session, BillingRunRecord) == 1
+    await stop_billing_runs()
@@ -0,0 +1,209 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+from sqlalchemy import Column, String, select
+from sqlalchemy.orm import DeclarativeBase
+
+from app.common.events import DomainEvent, EventBus
+from app.common.exceptions import InfrastructureError
+from app.infrastructure.database.base import Base, UUIDPrimaryKeyMixin
+from app.infrastructure.database.models.outbox_model import OutboxMessage
+from app.infrastructure.database.outbox import OutboxRelay, event_bus_publisher
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+)
+
+
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class PaymentModel(UUIDPrimaryKeyMixin, _TestBase):
+    __tablename__ = "outbox_test_payments"
+
+    reference = Column(String(50), nullable=False)
+
+
+@dataclass(frozen=True, kw_only=True)
+class PaymentReceived(DomainEvent):
+    payment_id: uuid.UUID
+    reference: str
+
+
+@dataclass
+class Payment:
+    reference: str
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    _events: List[DomainEvent] = field(default_factory=list)
+
+    def receive(self) -> None:
+        self._events.append(PaymentReceived(payment_id=self.id, reference=self.reference))
+
+    def pull_events(self) -> List[DomainEvent]:
+        events, self._events = self._events, []
+        return events
+
+
+class PaymentRepository(SQLAlchemyRepository[Payment, PaymentModel, uuid.UUID]):
+    model_cls = PaymentModel
+
+    @staticmethod
+    def to_domain(model: PaymentModel) -> Payment:
+        return Payment(id=model.id, reference=model.reference)
+
+    @staticmethod
+    def to_model(entity: Payment) -> PaymentModel:
+        return PaymentModel(id=entity.id, reference=entity.reference)
+
+
+@pytest.fixture
+async def outbox_tables(async_engine):
+    tables = [OutboxMessage.__table__]
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_TestBase.metadata.create_all)
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    yield
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_TestBase.metadata.drop_all)
+        await conn.run_sync(Base.metadata.drop_all, tables=tables)
+
+
+@pytest.mark.integration
+async def test_save_writes_outbox_rows_and_relay_publishes_them_once(
+    outbox_tables, async_session_factory
+):
+    payment = Payment(reference="INV-1")
+    payment.receive()
+    async with async_session_factory() as session:
+        await PaymentRepository(session).save(payment)
+
+    published: List[DomainEvent] = []
+
+    async def publisher(messages):
+        published.extend(m.to_event() for m in messages)
+
+    relay = OutboxRelay(async_session_factory, publisher, batch_size=10)
+
+    assert await relay.relay_once() == 1
+    assert await relay.relay_once() == 0
+    assert published == [
+        PaymentReceived(
+            event_id=published[0].event_id,
+            occurred_at=published[0].occurred_at,
+            payment_id=payment.id,
+            reference="INV-1",
+        )
+    ]
+    assert isinstance(published[0].payment_id, uuid.UUID)
+
+
+@pytest.mark.integration
+async def test_failed_entity_save_leaves_no_outbox_row_and_failed_publish_backs_off(
+    outbox_tables, async_session_factory
+):
+    async with async_session_factory() as session:
+        repo = PaymentRepository(session)
+        with pytest.raises(InfrastructureError):
+            # reference is NOT NULL: the whole transaction rolls back
+            await repo.save(Payment(reference=None), events=[
+                PaymentReceived(payment_id=uuid.uuid4(), reference="lost")
+            ])
+        await repo.save(Payment(reference="INV-2"), events=[
+            PaymentReceived(payment_id=uuid.uuid4(), reference="INV-2")
+        ])
+
+    async def failing_publisher(messages):
+        raise RuntimeError("broker down")
+
+    relay = OutboxRelay(async_session_factory, failing_publisher)
+    assert await relay.relay_once() == 0
+
+    async with async_session_factory() as session:
+        rows = (await session.scalars(select(OutboxMessage))).all()
+    assert [r.payload["reference"] for r in rows] == ["INV-2"]
+    assert rows[0].attempts == 1
+    assert rows[0].published_at is None
+    assert rows[0].last_error == "broker down"
+
+
+@pytest.mark.integration
+async def test_upsert_many_writes_outbox_rows_in_the_same_transaction(
+    outbox_tables, async_session_factory
+):
+    first, second = Payment(reference="INV-3"), Payment(reference="INV-4")
+    first.receive()
+    second.receive()
+    async with async_session_factory() as session:
+        await PaymentRepository(session).upsert_many([first, second])
+
+    async with async_session_factory() as session:
+        rows = (await session.scalars(select(OutboxMessage))).all()
+    assert sorted(r.payload["reference"] for r in rows) == ["INV-3", "INV-4"]
+    assert first.pull_events() == []
+
+
+@pytest.mark.integration
+async def test_rows_are_marked_published_only_after_bus_handlers_finish(
+    outbox_tables, async_session_factory
+):
+    async with async_session_factory() as session:
+        await PaymentRepository(session).save(Payment(reference="INV-5"), events=[
+            PaymentReceived(payment_id=uuid.uuid4(), reference="INV-5")
+        ])
+
+    bus = EventBus()
+    handled: List[str] = []
+    fail = True
+
+    @bus.subscriber(PaymentReceived)
+    async def record(events):
+        if fail:
+            raise RuntimeError("handler down")
+        handled.extend(e.reference for e in events)
+
+    # The bus is never started: delivery must not depend on its workers
+    relay = OutboxRelay(async_session_factory, event_bus_publisher(bus), max_backoff=0)
+    assert await relay.relay_once() == 0
+    async with async_session_factory() as session:
+        row = await session.scalar(select(OutboxMessage))
+    assert row.published_at is None
+    assert row.last_error == "handler down"
+
+    fail = False
+    assert await relay.relay_once() == 1
+    assert handled == ["INV-5"]
+
+
+@pytest.mark.integration
+async def test_publishing_holds_no_transaction_and_a_crash_leaves_rows_pending(
+    outbox_tables, async_session_factory
+):
+    async with async_session_factory() as session:
+        await PaymentRepository(session).save(Payment(reference="INV-6"), events=[
+            PaymentReceived(payment_id=uuid.uuid4(), reference="INV-6")
+        ])
+
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def stuck_publisher(messages):
+        started.set()
+        await release.wait()
+
+    relay = OutboxRelay(async_session_factory, stuck_publisher)
+    task = asyncio.create_task(relay.relay_once())
+    await started.wait()
+
+    # The claim is committed: a second relay skips the leased row at once
+    other = OutboxRelay(async_session_factory, stuck_publisher)
+    assert await asyncio.wait_for(other.relay_once(), timeout=1) == 0
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    async with async_session_factory() as session:
+        row = await session.scalar(select(OutboxMessage))
+    assert row.published_at is None
+    assert row.attempts == 1
@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.infrastructure.database.session import REPLICA_OK, ReplicaSet, RoutingSession
+
+
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class NoteModel(_TestBase):
+    __tablename__ = "replica_test_notes"
+
+    id = Column(Integer, primary_key=True)
+    origin = Column(String(20), nullable=False)
+
+
+@pytest.fixture
+async def engines():
+    primary = create_async_engine("sqlite+aiosqlite:///:memory:")
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+    for engine, origin in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(_TestBase.metadata.create_all)
+            await conn.execute(NoteModel.__table__.insert().values(id=1, origin=origin))
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+def _factory(primary, replicas):
+    return async_sessionmaker(
+        bind=primary,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+        expire_on_commit=False,
+    )
+
+
+async def _origins(session, tagged=True):
+    stmt = select(NoteModel.origin)
+    if tagged:
+        stmt = stmt.execution_options(**REPLICA_OK)
+    return list((await session.execute(stmt)).scalars())
+
+
+@pytest.mark.integration
+async def test_tagged_reads_use_replica_until_session_writes(engines):
+    primary, replica = engines
+    factory = _factory(primary, ReplicaSet([replica]))
+
+    async with factory() as session:
+        assert await _origins(session, tagged=False) == ["primary"]
+        assert await _origins(session) == ["replica"]
+
+        session.add(NoteModel(id=2, origin="primary"))
+        await session.flush()
+
+        assert await _origins(session) == ["primary", "primary"]
+
+
+@pytest.mark.integration
+async def test_read_only_sessions_route_untagged_selects(engines):
+    primary, replica = engines
+    factory = _factory(primary, ReplicaSet([replica]))
+
+    async with factory(info={"read_only": True}) as session:
+        assert await _origins(session, tagged=False) == ["replica"]
+
+
+@pytest.mark.integration
+async def test_locking_selects_go_to_primary_even_in_read_only_sessions(engines):
+    primary, replica = engines
+    factory = _factory(primary, ReplicaSet([replica]))
+
+    async with factory(info={"read_only": True}) as session:
+        stmt = select(NoteModel.origin).with_for_update().execution_options(**REPLICA_OK)
+        assert list((await session.execute(stmt)).scalars()) == ["primary"]
+        # The session now holds locks on the primary and keeps reading there
+        assert await _origins(session) == ["primary"]
+
+
+@pytest.mark.integration
+async def test_ejected_replicas_fall_back_to_primary(engines):
+    primary, replica = engines
+    replicas = ReplicaSet([replica], failure_threshold=2, eject_seconds=60)
+    replicas.mark_failure(replica.sync_engine)
+    replicas.mark_failure(replica.sync_engine)
+
+    async with _factory(primary, replicas)() as session:
+        assert await _origins(session) == ["primary"]
+
+    assert (await replicas.check_health()) == {"replica-0": True}
+    assert replicas.choose() is replica.sync_engine
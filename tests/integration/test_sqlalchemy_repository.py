@@ -0,0 +1,192 @@
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import DeclarativeBase
+
+from app.common.exceptions import ValidationError
+from app.infrastructure.database.base import UUIDPrimaryKeyMixin
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+)
+
+
+# ---------------------------------------------------------
+# Minimal slice used only by these tests
+# ---------------------------------------------------------
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class ItemModel(UUIDPrimaryKeyMixin, _TestBase):
+    __tablename__ = "repo_test_items"
+
+    name = Column(String(50), nullable=False)
+    rank = Column(Integer, nullable=False)
+    note = Column(String(50), nullable=True)
+    tag = Column(String(20), nullable=False, default="plain")
+
+
+@dataclass
+class Item:
+    name: str
+    rank: int
+    id: Optional[uuid.UUID] = None
+    note: Optional[str] = None
+    tag: Optional[str] = None
+
+
+class ItemRepository(SQLAlchemyRepository[Item, ItemModel, uuid.UUID]):
+    model_cls = ItemModel
+
+    @staticmethod
+    def to_domain(model: ItemModel) -> Item:
+        return Item(id=model.id, name=model.name, rank=model.rank, note=model.note, tag=model.tag)
+
+    @staticmethod
+    def to_model(entity: Item) -> ItemModel:
+        return ItemModel(
+            id=entity.id, name=entity.name, rank=entity.rank, note=entity.note, tag=entity.tag
+        )
+
+
+@pytest.fixture
+async def repo(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_TestBase.metadata.create_all)
+
+    async with async_session_factory() as session:
+        yield ItemRepository(session)
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_TestBase.metadata.drop_all)
+
+
+async def _seed(repo: ItemRepository, count: int) -> None:
+    for i in range(count):
+        repo.session.add(ItemModel(name=f"item-{i:03d}", rank=i % 3))
+    await repo.session.commit()
+
+
+# ---------------------------------------------------------
+# Keyset pagination / streaming
+# ---------------------------------------------------------
+@pytest.mark.integration
+async def test_list_after_walks_all_rows_without_overlap(repo):
+    await _seed(repo, 25)
+
+    seen, cursor = [], None
+    while True:
+        page = await repo.list_after(cursor, limit=10, order_by=["-rank", "name"])
+        seen.extend(page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == 25
+    assert len({item.id for item in seen}) == 25
+    keys = [(-item.rank, item.name) for item in seen]
+    assert keys == sorted(keys)
+
+
+@pytest.mark.integration
+async def test_list_after_rejects_malformed_cursor(repo):
+    with pytest.raises(ValidationError):
+        await repo.list_after("not-a-cursor", limit=5)
+
+
+@pytest.mark.integration
+async def test_list_after_rejects_bad_limits_and_non_column_order_by(repo):
+    await repo.save_many([Item(name="a", rank=1)])
+
+    for limit in (0, -1):
+        with pytest.raises(ValidationError):
+            await repo.list_after(limit=limit)
+    for field in ("metadata", "__tablename__", "to_domain", "-missing"):
+        with pytest.raises(ValidationError):
+            await repo.list_after(order_by=field)
+
+
+@pytest.mark.integration
+async def test_stream_yields_every_row(repo):
+    await _seed(repo, 12)
+
+    names = [item.name async for item in repo.stream(batch_size=5, order_by="name")]
+
+    assert names == sorted(names)
+    assert len(names) == 12
+
+
+# ---------------------------------------------------------
+# Bulk operations
+# ---------------------------------------------------------
+@pytest.mark.integration
+async def test_save_many_inserts_all_rows(repo):
+    saved = await repo.save_many([Item(name=f"bulk-{i}", rank=i) for i in range(30)])
+
+    assert len(saved) == 30
+    assert all(item.id is not None for item in saved)
+    assert len(await repo.list(limit=100)) == 30
+
+
+@pytest.mark.integration
+async def test_upsert_many_updates_existing_and_inserts_new(repo):
+    existing = await repo.save_many([Item(name="a", rank=1), Item(name="b", rank=2)])
+
+    changed = [Item(id=existing[0].id, name="a", rank=10), Item(name="c", rank=3)]
+    result = await repo.upsert_many(changed, conflict_columns=["id"])
+
+    assert len(result) == 2
+    ranks = {item.name: item.rank for item in await repo.list(limit=10)}
+    assert ranks == {"a": 10, "b": 2, "c": 3}
+
+
+@pytest.mark.integration
+async def test_upsert_many_keeps_stored_values_of_columns_each_row_leaves_unset(repo):
+    a, b = await repo.save_many([
+        Item(name="a", rank=1, note="a-note", tag="gold"),
+        Item(name="b", rank=2, note="b-note", tag="gold"),
+    ])
+
+    result = await repo.upsert_many([
+        Item(id=a.id, name="a", rank=10, note="changed"),   # leaves tag unset
+        Item(id=b.id, name="b", rank=20, tag="silver"),     # leaves note unset
+    ])
+
+    assert [item.id for item in result] == [a.id, b.id]
+    stored = {item.name: (item.rank, item.note, item.tag) for item in await repo.list(limit=10)}
+    assert stored == {"a": (10, "changed", "gold"), "b": (20, "b-note", "silver")}
+
+
+@pytest.mark.integration
+async def test_upsert_many_collapses_duplicate_conflict_keys_last_wins(repo):
+    item_id = uuid.uuid4()
+
+    result = await repo.upsert_many(
+        [Item(id=item_id, name="x", rank=1), Item(id=item_id, name="x", rank=2)]
+    )
+
+    assert [(item.id, item.rank) for item in result] == [(item_id, 2)]
+    assert [item.rank for item in await repo.list(limit=10)] == [2]
+
+
+@pytest.mark.integration
+async def test_delete_many_returns_deleted_count(repo):
+    saved = await repo.save_many([Item(name=f"d-{i}", rank=i) for i in range(5)])
+
+    deleted = await repo.delete_many([item.id for item in saved[:3]] + [uuid.uuid4()])
+
+    assert deleted == 3
+    assert len(await repo.list(limit=10)) == 2
+
+
+@pytest.mark.integration
+async def test_get_by_ids_preserves_input_order_and_misses(repo):
+    saved = await repo.save_many([Item(name=f"g-{i}", rank=i) for i in range(3)])
+    missing = uuid.uuid4()
+
+    found = await repo.get_by_ids([saved[2].id, missing, saved[0].id])
+
+    assert [item.name if item else None for item in found] == ["g-2", None, "g-0"]
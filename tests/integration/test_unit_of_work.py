@@ -0,0 +1,114 @@
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column, String, event, func, select
+from sqlalchemy.orm import DeclarativeBase
+
+from app.common.exceptions import InfrastructureError
+from app.common.kernel.base_use_case import BaseUseCase
+from app.infrastructure.database.base import UUIDPrimaryKeyMixin
+from app.infrastructure.database.repositories.sqlalchemy_repository import (
+    SQLAlchemyRepository,
+)
+from app.infrastructure.database.unit_of_work import (
+    UOW_STATEMENTS,
+    SQLAlchemyUnitOfWork,
+)
+
+
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class NoteModel(UUIDPrimaryKeyMixin, _TestBase):
+    __tablename__ = "uow_test_notes"
+
+    text = Column(String(50), nullable=False)
+
+
+@dataclass
+class Note:
+    text: Optional[str]
+    id: Optional[uuid.UUID] = None
+
+
+class NoteRepository(SQLAlchemyRepository[Note, NoteModel, uuid.UUID]):
+    model_cls = NoteModel
+
+    @staticmethod
+    def to_domain(model: NoteModel) -> Note:
+        return Note(id=model.id, text=model.text)
+
+    @staticmethod
+    def to_model(entity: Note) -> NoteModel:
+        return NoteModel(id=entity.id, text=entity.text)
+
+
+class AddNotes(BaseUseCase[list, int]):
+    def __init__(self, uow: SQLAlchemyUnitOfWork):
+        self.unit_of_work = uow
+
+    async def perform(self, texts: list) -> int:
+        notes = self.unit_of_work.repository(NoteRepository)
+        for text in texts:
+            await notes.save(Note(text=text))
+        return len(texts)
+
+
+@pytest.fixture
+async def uow(async_engine, async_session_factory):
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_TestBase.metadata.create_all)
+
+    commits = []
+    listener = lambda conn: commits.append(conn)  # noqa: E731
+    event.listen(async_engine.sync_engine, "commit", listener)
+
+    unit = SQLAlchemyUnitOfWork(async_session_factory)
+    unit.commits = commits
+    yield unit
+
+    event.remove(async_engine.sync_engine, "commit", listener)
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_TestBase.metadata.drop_all)
+
+
+async def _count(factory) -> int:
+    async with factory() as session:
+        return await session.scalar(select(func.count()).select_from(NoteModel))
+
+
+@pytest.mark.integration
+async def test_use_case_commits_once_for_all_repository_writes(uow, async_session_factory):
+    before = UOW_STATEMENTS.count(outcome="commit")
+
+    result = await AddNotes(uow).execute(["a", "b", "c"])
+
+    assert result.is_ok and result.value == 3
+    assert len(uow.commits) == 1
+    assert await _count(async_session_factory) == 3
+    assert UOW_STATEMENTS.count(outcome="commit") == before + 1
+
+
+@pytest.mark.integration
+async def test_failure_rolls_back_everything_and_savepoint_isolates_nested_work(
+    uow, async_session_factory
+):
+    result = await AddNotes(uow).execute(["a", None])   # second save violates NOT NULL
+
+    assert result.is_err
+    assert uow.commits == []
+    assert await _count(async_session_factory) == 0
+
+    async with uow:
+        notes = uow.repository(NoteRepository)
+        await notes.save(Note(text="kept"))
+        with pytest.raises(InfrastructureError):
+            async with uow.savepoint():
+                await notes.save(Note(text=None))
+        await notes.save(Note(text="also kept"))
+
+    assert len(uow.commits) == 1
+    assert await _count(async_session_factory) == 2
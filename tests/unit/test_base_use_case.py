@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from app.common.exceptions import UseCaseBusyError, UseCaseTimeoutError
+from app.common.kernel.base_use_case import (
+    USE_CASE_EXECUTIONS,
+    BaseUseCase,
+    register_use_case_hook,
+    unregister_use_case_hook,
+)
+
+
+class SlowReport(BaseUseCase[float, str]):
+    max_concurrency = 2
+
+    async def perform(self, delay: float) -> str:
+        await asyncio.sleep(delay)
+        return "done"
+
+
+class TimedReport(SlowReport):
+    timeout = 0.02
+
+
+class BusyReport(SlowReport):
+    max_concurrency = 1
+    reject_when_busy = True
+
+
+class Failing(BaseUseCase[None, None]):
+    async def perform(self, _):
+        raise KeyError("missing")
+
+
+class DriverTimeout(BaseUseCase[None, None]):
+    timeout = 5.0
+
+    async def perform(self, _):
+        raise TimeoutError("connect timed out")
+
+
+@pytest.fixture
+def executions():
+    seen = []
+    register_use_case_hook(seen.append)
+    yield seen
+    unregister_use_case_hook(seen.append)
+
+
+@pytest.mark.unit
+async def test_timeout_and_errors_are_reported_to_hooks(executions):
+    timed_out = await TimedReport().execute(1.0)
+    failed = await Failing().execute(None)
+
+    assert isinstance(timed_out.error, UseCaseTimeoutError)
+    assert isinstance(failed.error, KeyError)
+    assert [(e.use_case, e.outcome, e.error_type) for e in executions] == [
+        ("TimedReport", "timeout", "TimeoutError"),
+        ("Failing", "error", "KeyError"),
+    ]
+    assert executions[0].total_seconds < 0.5
+    assert USE_CASE_EXECUTIONS.value(use_case="Failing", outcome="error", error_type="KeyError") >= 1
+
+
+@pytest.mark.unit
+async def test_timeout_raised_by_perform_is_an_error_not_the_deadline(executions):
+    result = await DriverTimeout().execute(None)
+
+    assert type(result.error) is TimeoutError
+    assert str(result.error) == "connect timed out"
+    assert [(e.outcome, e.error_type) for e in executions] == [("error", "TimeoutError")]
+
+
+@pytest.mark.unit
+async def test_concurrency_limit_queues_or_rejects(executions):
+    running = 0
+    peak = 0
+
+    class Tracked(SlowReport):
+        async def perform(self, delay):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await super().perform(delay)
+            finally:
+                running -= 1
+
+    results = await asyncio.gather(*(Tracked().execute(0.01) for _ in range(6)))
+    assert all(r.is_ok for r in results)
+    assert peak == 2
+    assert any(e.wait_seconds > 0 for e in executions)
+
+    busy = await asyncio.gather(BusyReport().execute(0.02), BusyReport().execute(0.02))
+    assert busy[0].is_ok
+    assert isinstance(busy[1].error, UseCaseBusyError)
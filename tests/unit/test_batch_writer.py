@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from app.common.exceptions import UseCaseBusyError
+from app.infrastructure.database.batch_writer import BatchWriter, stop_batch_writers
+
+
+@pytest.mark.unit
+async def test_submissions_are_coalesced_into_one_flush():
+    flushed = []
+
+    async def flush(items):
+        flushed.append(list(items))
+        return len(items)
+
+    writer = BatchWriter("test", flush, key=lambda item: item[0], flush_interval=0.01)
+    first = writer.submit([("a", 1), ("b", 1)])
+    second = writer.submit([("a", 2)])
+
+    assert first is second
+    assert await first == 2
+    assert flushed == [[("a", 2), ("b", 1)]]
+    await writer.stop()
+
+
+@pytest.mark.unit
+async def test_full_batch_flushes_early_and_full_queue_rejects():
+    flushed = []
+    release = asyncio.Event()
+
+    async def flush(items):
+        flushed.append(len(items))
+        await release.wait()
+
+    writer = BatchWriter("test", flush, max_batch_size=2, flush_interval=60, max_pending=3)
+    writer.submit([1, 2])
+    await asyncio.sleep(0.01)
+    assert flushed == [2]  # did not wait for the 60s interval
+
+    writer.submit([3, 4, 5])
+    with pytest.raises(UseCaseBusyError):
+        writer.submit([6])
+
+    release.set()
+    await stop_batch_writers()
+    assert flushed == [2, 3]
+
+
+@pytest.mark.unit
+async def test_flush_errors_reach_waiters():
+    async def flush(items):
+        raise RuntimeError("db down")
+
+    writer = BatchWriter("test", flush, flush_interval=0.01)
+    with pytest.raises(RuntimeError, match="db down"):
+        await writer.write([1])
+    assert writer.pending == 1  # kept for the next attempt
+    await writer.stop(drain=False)
+
+
+@pytest.mark.unit
+async def test_failed_flush_is_retried_with_backoff_instead_of_dropped():
+    attempts, flushed = [], []
+
+    async def flush(items):
+        attempts.append(list(items))
+        if len(attempts) == 1:
+            raise RuntimeError("connection reset")
+        flushed.append(list(items))
+
+    writer = BatchWriter(
+        "test", flush, key=lambda item: item[0], flush_interval=0.01, retry_backoff=0.02
+    )
+    accepted = writer.submit([("a", 1), ("b", 1)])  # fire and forget, like a 202
+    with pytest.raises(RuntimeError):
+        await accepted
+    writer.submit([("b", 2)])  # newer than the failed ("b", 1)
+    await writer.stop()
+
+    assert attempts[0] == [("a", 1), ("b", 1)]
+    assert flushed == [[("a", 1), ("b", 2)]]
+    assert writer.pending == 0
@@ -0,0 +1,114 @@
+import asyncio
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from app.common.kernel.base_repository import BaseRepository
+from app.infrastructure.cache.backends import InMemoryCacheBackend
+from app.infrastructure.cache.cached_repository import CachedRepository, IdentityMap
+
+
+@dataclass
+class Institution:
+    id: uuid.UUID
+    name: str
+
+
+class FakeRepository(BaseRepository[Institution, uuid.UUID]):
+    def __init__(self, rows):
+        self.rows = {row.id: row for row in rows}
+        self.reads = 0
+
+    async def get_by_id(self, entity_id):
+        self.reads += 1
+        return self.rows.get(entity_id)
+
+    async def save(self, entity):
+        self.rows[entity.id] = entity
+        return entity
+
+    async def delete(self, entity_id):
+        self.rows.pop(entity_id, None)
+
+
+@pytest.fixture
+def rows():
+    return [Institution(id=uuid.uuid4(), name=f"school-{i}") for i in range(3)]
+
+
+@pytest.mark.unit
+async def test_reads_are_served_from_cache_across_requests(rows):
+    inner = FakeRepository(rows)
+    cache = InMemoryCacheBackend(max_entries=10)
+
+    first = CachedRepository(inner, namespace="inst", cache=cache)
+    await first.get_by_id(rows[0].id)
+    await first.get_by_id(rows[0].id)
+
+    second = CachedRepository(inner, namespace="inst", cache=cache, identity_map=IdentityMap())
+    assert (await second.get_by_id(rows[0].id)).name == "school-0"
+
+    assert inner.reads == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.unit
+async def test_save_invalidates_cached_entry(rows):
+    inner = FakeRepository(rows)
+    cache = InMemoryCacheBackend(max_entries=10)
+    repo = CachedRepository(inner, namespace="inst", cache=cache)
+    await repo.get_by_id(rows[0].id)
+
+    await repo.save(Institution(id=rows[0].id, name="renamed"))
+
+    other_request = CachedRepository(inner, namespace="inst", cache=cache)
+    assert (await other_request.get_by_id(rows[0].id)).name == "renamed"
+
+
+@pytest.mark.unit
+async def test_shared_backend_and_lru_eviction(rows):
+    shared = InMemoryCacheBackend(max_entries=100)
+    worker_a = CachedRepository(
+        FakeRepository(rows), namespace="inst", cache=InMemoryCacheBackend(2), shared=shared
+    )
+    for row in rows:
+        await worker_a.get_by_id(row.id)
+
+    assert worker_a.cache.stats.evictions == 1
+
+    inner_b = FakeRepository(rows)
+    worker_b = CachedRepository(
+        inner_b, namespace="inst", cache=InMemoryCacheBackend(2), shared=shared
+    )
+    found = await worker_b.get_by_ids([row.id for row in rows])
+
+    assert [e.name for e in found] == ["school-0", "school-1", "school-2"]
+    assert inner_b.reads == 0
+
+
+@pytest.mark.unit
+async def test_other_workers_serve_their_local_copy_until_the_ttl_expires(rows):
+    inner = FakeRepository(rows)
+    shared = InMemoryCacheBackend(max_entries=100)
+    worker_a = CachedRepository(
+        inner, namespace="inst", cache=InMemoryCacheBackend(10), shared=shared, ttl=0.05
+    )
+    worker_b = CachedRepository(
+        inner, namespace="inst", cache=InMemoryCacheBackend(10), shared=shared, ttl=0.05
+    )
+    await worker_b.get_by_id(rows[0].id)
+
+    await worker_a.save(Institution(id=rows[0].id, name="renamed"))
+
+    # The shared entry is gone, but worker B's process cache is not invalidated
+    later_b = CachedRepository(
+        inner, namespace="inst", cache=worker_b.cache, shared=shared, ttl=0.05
+    )
+    assert (await later_b.get_by_id(rows[0].id)).name == "school-0"
+
+    await asyncio.sleep(0.06)
+    expired_b = CachedRepository(
+        inner, namespace="inst", cache=worker_b.cache, shared=shared, ttl=0.05
+    )
+    assert (await expired_b.get_by_id(rows[0].id)).name == "renamed"
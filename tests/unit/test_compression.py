@@ -0,0 +1,108 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from httpx import ASGITransport, AsyncClient
+
+from app.infrastructure.api.compression import (
+    CompressionMiddleware,
+    available_encodings,
+    negotiate,
+)
+
+BIG = {"rows": ["x" * 50] * 100}
+
+
+@pytest.mark.unit
+def test_negotiation_honours_q_values_and_server_preference():
+    encodings = available_encodings()
+    names = [e.name for e in encodings]
+
+    assert negotiate("gzip", encodings).name == "gzip"
+    assert negotiate("identity", encodings) is None
+    excluded = negotiate("gzip;q=0, *;q=0.5", encodings)
+    assert excluded is None or excluded.name != "gzip"
+    assert negotiate("deflate, gzip;q=0.8, zstd;q=0", encodings).name == "gzip"
+    assert negotiate("gzip;q=0.5, br;q=1.0", encodings).name == (
+        "br" if "br" in names else "gzip"
+    )
+    assert negotiate("*", encodings).name == names[0]
+
+
+def _app(middleware: CompressionMiddleware = None):
+    async def big(request):
+        return JSONResponse(BIG, headers={"etag": '"v1"'})
+
+    async def small(request):
+        return JSONResponse({"ok": True})
+
+    async def image(request):
+        return Response(b"\x89PNG" * 500, media_type="image/png")
+
+    async def stream(request):
+        async def chunks():
+            for i in range(3):
+                yield ("line %d\n" % i * 200).encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def other(request):
+        # Same ETag as /big (e.g. same max updated_at), different resource
+        return JSONResponse({"other": ["y" * 50] * 100}, headers={"etag": '"v1"'})
+
+    app = Starlette(routes=[
+        Route("/big", big), Route("/other", other), Route("/small", small),
+        Route("/image", image), Route("/stream", stream),
+    ])
+    return CompressionMiddleware(
+        app, encodings=[e for e in available_encodings() if e.name == "gzip"],
+        offload_threshold=1024,
+    )
+
+
+@pytest.mark.unit
+async def test_compresses_only_worthwhile_bodies_and_caches_variants_by_etag():
+    app = _app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        headers = {"accept-encoding": "gzip"}
+        big = await client.get("/big", headers=headers)
+        await client.get("/big", headers=headers)
+        small = await client.get("/small", headers=headers)
+        image = await client.get("/image", headers=headers)
+        stream = await client.get("/stream", headers=headers)
+
+    assert big.headers["content-encoding"] == "gzip"
+    assert big.headers["etag"] == 'W/"v1"'
+    assert "accept-encoding" in big.headers["vary"].lower()
+    assert big.json() == BIG
+    assert len(app.variants) == 1
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in image.headers
+
+    assert stream.headers["content-encoding"] == "gzip"
+    assert stream.text.startswith("line 0")
+
+
+@pytest.mark.unit
+def test_gzip_output_is_deterministic():
+    encoding = available_encodings()[-1]
+    assert encoding.name == "gzip"
+    assert encoding.compress(b"abc" * 100) == encoding.compress(b"abc" * 100)
+    assert gzip.decompress(encoding.compress(b"abc")) == b"abc"
+
+
+@pytest.mark.unit
+async def test_variants_are_not_shared_between_resources_with_the_same_etag():
+    app = _app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        headers = {"accept-encoding": "gzip"}
+        big = await client.get("/big", headers=headers)
+        other = await client.get("/other", headers=headers)
+        filtered = await client.get("/big", params={"page": 2}, headers=headers)
+
+    assert big.json() == BIG
+    assert other.json() == {"other": ["y" * 50] * 100}
+    assert filtered.json() == BIG
+    assert len(app.variants) == 3
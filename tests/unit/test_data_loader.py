@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from app.common.kernel.data_loader import DataLoader
+
+
+@pytest.mark.unit
+async def test_concurrent_loads_are_coalesced_into_one_batch():
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(list(keys))
+        return [f"value-{k}" if k != 3 else None for k in keys]
+
+    loader = DataLoader(batch_load)
+
+    results = await asyncio.gather(*(loader.load(k) for k in [1, 2, 3, 1]))
+
+    assert results == ["value-1", "value-2", None, "value-1"]
+    assert calls == [[1, 2, 3]]
+
+
+@pytest.mark.unit
+async def test_cached_keys_are_not_reloaded_and_failures_are_not_cached():
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(list(keys))
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+        return keys
+
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(RuntimeError):
+        await loader.load(7)
+
+    assert await loader.load(7) == 7
+    assert await loader.load(7) == 7
+    assert calls == [[7], [7]]
+
+
+@pytest.mark.unit
+async def test_cancelled_batch_releases_waiters_instead_of_leaving_them_pending():
+    started = asyncio.Event()
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(list(keys))
+        if len(calls) == 1:
+            started.set()
+            await asyncio.Event().wait()
+        return keys
+
+    loader = DataLoader(batch_load)
+    waiter = asyncio.create_task(loader.load(1))
+    await started.wait()
+
+    # The loader holds the batch task, so it can be found and cancelled
+    (batch_task,) = loader._tasks
+    batch_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(waiter, timeout=1)
+    await asyncio.sleep(0)
+    assert not loader._tasks
+    assert await loader.load(1) == 1
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+import asyncio
+
+import pytest
+
+from app.common.events import Backpressure, DomainEvent, EventBus
+
+
+@dataclass(frozen=True, kw_only=True)
+class GradePosted(DomainEvent):
+    student: str
+    score: float
+
+
+@pytest.mark.unit
+async def test_events_are_delivered_in_micro_batches_and_drained_on_stop():
+    batches = []
+
+    async def handler(events):
+        batches.append([e.student for e in events])
+
+    bus = EventBus()
+    bus.subscribe(GradePosted, handler, batch_size=3, max_batch_wait=0.05)
+    await bus.start()
+
+    await bus.publish_many([GradePosted(student=f"s{i}", score=1.0) for i in range(7)])
+    await bus.stop(drain=True)
+
+    assert [s for batch in batches for s in batch] == [f"s{i}" for i in range(7)]
+    assert max(len(b) for b in batches) == 3
+    assert GradePosted.event_name == "GradePosted"
+
+
+@pytest.mark.unit
+async def test_drop_policies_bound_the_queue():
+    bus = EventBus()
+    received = []
+
+    async def handler(events):
+        received.extend(e.student for e in events)
+
+    newest = bus.subscribe(
+        GradePosted, handler, name="newest", max_queue_size=2,
+        backpressure=Backpressure.DROP_NEWEST,
+    )
+    oldest = bus.subscribe(
+        GradePosted, handler, name="oldest", max_queue_size=2,
+        backpressure=Backpressure.DROP_OLDEST,
+    )
+
+    # Not started: nothing is consumed, so the queues fill up
+    for i in range(4):
+        await bus.publish(GradePosted(student=f"s{i}", score=0))
+
+    assert [e.student for e in newest.queue._queue] == ["s0", "s1"]
+    assert [e.student for e in oldest.queue._queue] == ["s2", "s3"]
+
+
+@pytest.mark.unit
+async def test_block_policy_applies_backpressure_and_handler_errors_are_isolated():
+    release = asyncio.Event()
+    handled = []
+
+    async def slow_handler(events):
+        await release.wait()
+        if events[0].student == "boom":
+            raise RuntimeError("handler failed")
+        handled.extend(e.student for e in events)
+
+    bus = EventBus()
+    bus.subscribe(GradePosted, slow_handler, max_queue_size=1)
+    await bus.start()
+
+    await bus.publish(GradePosted(student="boom", score=0))   # taken by the worker
+    await bus.publish(GradePosted(student="a", score=0))      # fills the queue
+    blocked = asyncio.create_task(bus.publish(GradePosted(student="b", score=0)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await asyncio.wait_for(blocked, 1)
+    await bus.stop(drain=True)
+
+    assert handled == ["a", "b"]
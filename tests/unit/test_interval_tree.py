@@ -0,0 +1,88 @@
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.common.exceptions import ValidationError
+from app.common.utils.interval_tree import IntervalTree
+from app.core.entities.schedule import ScheduleEntry, find_conflicts
+
+MONDAY = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return MONDAY + timedelta(hours=hour, minutes=minute)
+
+
+@pytest.mark.unit
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for i in range(500):
+        start = rng.randrange(0, 1000)
+        intervals.append((start, start + rng.randrange(1, 50), i))
+    tree = IntervalTree(intervals)
+
+    for _ in range(200):
+        start = rng.randrange(0, 1000)
+        end = start + rng.randrange(1, 80)
+        expected = {v for s, e, v in intervals if s < end and e > start}
+        assert set(tree.overlapping(start, end)) == expected
+
+
+@pytest.mark.unit
+def test_interval_tree_treats_intervals_as_half_open():
+    tree = IntervalTree([(9, 10, "first"), (10, 11, "second")])
+    assert tree.overlapping(10, 11) == ["second"]
+    assert tree.overlapping(11, 12) == []
+    assert IntervalTree([]).overlapping(0, 1) == []
+
+
+@pytest.mark.unit
+def test_find_conflicts_within_a_proposal():
+    room, teacher = uuid.uuid4(), uuid.uuid4()
+    entries = [
+        ScheduleEntry(room_id=room, teacher_id=teacher, starts_at=_at(9), ends_at=_at(10)),
+        # Back to back in the same room: fine
+        ScheduleEntry(room_id=room, starts_at=_at(10), ends_at=_at(11)),
+        # Same teacher, another room, overlapping the first entry
+        ScheduleEntry(room_id=uuid.uuid4(), teacher_id=teacher, starts_at=_at(9, 30), ends_at=_at(10, 30)),
+    ]
+
+    conflicts = find_conflicts(entries)
+
+    assert len(conflicts) == 1
+    conflict = conflicts[0]
+    assert (conflict.resource, conflict.resource_id) == ("teacher", teacher)
+    assert (conflict.entry, conflict.other_entry) == (0, 2)
+    assert (conflict.starts_at, conflict.ends_at) == (_at(9, 30), _at(10))
+
+
+@pytest.mark.unit
+def test_find_conflicts_against_the_stored_schedule():
+    room, group = uuid.uuid4(), uuid.uuid4()
+    stored = ScheduleEntry(room_id=room, group_id=group, starts_at=_at(8), ends_at=_at(9))
+    moved = ScheduleEntry(id=stored.id, room_id=room, group_id=group, starts_at=_at(8, 30), ends_at=_at(9, 30))
+    clash = ScheduleEntry(room_id=uuid.uuid4(), group_id=group, starts_at=_at(8, 45), ends_at=_at(9, 15))
+
+    # Replacing an entry does not conflict with its old self
+    assert find_conflicts([moved], [stored]) == []
+
+    conflicts = find_conflicts([clash], [stored])
+    assert [(c.resource, c.scheduled_id) for c in conflicts] == [("group", stored.id)]
+
+
+@pytest.mark.unit
+def test_schedule_entry_normalizes_to_utc_and_rejects_empty_periods():
+    local = timezone(timedelta(hours=-5))
+    entry = ScheduleEntry(
+        room_id=uuid.uuid4(),
+        starts_at=datetime(2026, 10, 19, 8, tzinfo=local),
+        ends_at=datetime(2026, 10, 19, 14),
+    )
+    assert entry.starts_at == _at(13)
+    assert entry.ends_at.tzinfo is timezone.utc
+
+    with pytest.raises(ValidationError):
+        ScheduleEntry(room_id=uuid.uuid4(), starts_at=_at(9), ends_at=_at(9))
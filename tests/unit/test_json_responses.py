@@ -0,0 +1,41 @@
+import json
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.common.dto import BaseDTO
+from app.infrastructure.api.responses import FastJSONResponse
+
+
+class GradeDTO(BaseDTO):
+    id: uuid.UUID
+    subject: str
+    score: float
+    posted_on: date
+
+
+def _grades(count):
+    return [
+        GradeDTO(id=uuid.uuid4(), subject=f"s{i}", score=float(i), posted_on=date(2025, 1, 1))
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+def test_dto_json_bytes_match_model_dump():
+    grade = _grades(1)[0]
+
+    assert json.loads(grade.to_json_bytes()) == grade.model_dump(mode="json")
+
+
+@pytest.mark.unit
+def test_response_renders_dto_lists_and_plain_content():
+    grades = _grades(3)
+
+    body = FastJSONResponse(grades).body
+    assert json.loads(body) == [g.model_dump(mode="json") for g in grades]
+
+    plain = FastJSONResponse({"total": Decimal("0.10") + Decimal("0.20"), 1: "a"}).body
+    assert json.loads(plain) == {"total": "0.30", "1": "a"}
@@ -0,0 +1,33 @@
+import pytest
+
+from app.common.metrics import MetricsRegistry
+
+
+@pytest.mark.unit
+def test_histogram_quantiles_and_prometheus_rendering():
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "request_seconds", "Request latency.", labelnames=("route",), buckets=(0.1, 0.2, 0.5)
+    )
+    for _ in range(90):
+        latency.observe(0.05, route="/a")
+    for _ in range(10):
+        latency.observe(0.4, route="/a")
+
+    assert latency.count(route="/a") == 100
+    assert latency.quantile(0.5, route="/a") <= 0.1
+    assert 0.2 < latency.quantile(0.99, route="/a") <= 0.5
+
+    text = registry.render_prometheus()
+    assert "# TYPE request_seconds histogram" in text
+    assert 'request_seconds_bucket{route="/a",le="+Inf"} 100' in text
+    assert 'request_seconds_count{route="/a"} 100' in text
+
+
+@pytest.mark.unit
+def test_collectors_run_before_rendering():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("in_use", "Connections in use.")
+    registry.register_collector(lambda: gauge.set(3))
+
+    assert "in_use 3" in registry.render_prometheus()
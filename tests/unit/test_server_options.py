@@ -0,0 +1,38 @@
+import pytest
+
+from app.config.settings import Settings
+from app.infrastructure.api import server
+
+
+@pytest.mark.unit
+def test_production_options_come_from_settings(monkeypatch):
+    monkeypatch.setattr(server.os, "cpu_count", lambda: 6)
+    settings = Settings(
+        APP_DEBUG=False,
+        WEB_WORKERS=0,
+        WEB_BACKLOG=4096,
+        WEB_KEEPALIVE_TIMEOUT=20,
+        WEB_LIMIT_CONCURRENCY=0,
+        WEB_TIMEOUT_GRACEFUL_SHUTDOWN=15,
+    )
+
+    options = server.server_options(settings)
+
+    assert options["workers"] == 6
+    assert "reload" not in options
+    assert options["backlog"] == 4096
+    assert options["timeout_keep_alive"] == 20
+    assert options["limit_concurrency"] is None
+    assert options["timeout_graceful_shutdown"] == 15
+    assert options["loop"] in ("uvloop", "asyncio")
+    assert options["http"] in ("httptools", "h11")
+
+
+@pytest.mark.unit
+def test_reload_mode_runs_a_single_process(monkeypatch):
+    monkeypatch.setattr(server, "_installed", lambda module: True)
+    options = server.server_options(Settings(WEB_WORKERS=4), reload=True)
+
+    assert options["reload"] is True
+    assert "workers" not in options
+    assert (options["loop"], options["http"]) == ("uvloop", "httptools")
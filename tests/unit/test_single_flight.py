@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from app.common.kernel.base_use_case import BaseUseCase
+from app.common.kernel.single_flight import SINGLE_FLIGHT_CALLS, single_flight
+
+
+class GetTimetable(BaseUseCase[dict, list]):
+    calls = 0
+
+    @single_flight(name="test.timetable", key=lambda self, query: query["group"])
+    async def perform(self, query: dict) -> list:
+        type(self).calls += 1
+        await asyncio.sleep(0.01)
+        return [query["group"]]
+
+
+@pytest.mark.unit
+async def test_identical_concurrent_calls_share_one_execution():
+    before = SINGLE_FLIGHT_CALLS.value(name="test.timetable", role="deduplicated")
+
+    results = await asyncio.gather(
+        *(GetTimetable().execute({"group": "A"}) for _ in range(10)),
+        GetTimetable().execute({"group": "B"}),
+    )
+
+    assert [r.value for r in results] == [["A"]] * 10 + [["B"]]
+    assert GetTimetable.calls == 2
+    assert SINGLE_FLIGHT_CALLS.value(name="test.timetable", role="deduplicated") == before + 9
+    assert GetTimetable.perform.single_flight.in_flight == 0
+
+    # Nothing is cached once the flight lands
+    await GetTimetable().execute({"group": "A"})
+    assert GetTimetable.calls == 3
+
+
+class Repository:
+    def __init__(self, session: str):
+        self.session = session
+
+    @single_flight(name="test.repository")
+    async def load(self, group: str) -> tuple:
+        await asyncio.sleep(0.01)
+        return self.session, group
+
+
+@pytest.mark.unit
+async def test_methods_coalesce_per_instance_by_default():
+    shared, other = Repository("s1"), Repository("s2")
+
+    results = await asyncio.gather(shared.load("A"), shared.load("A"), other.load("A"))
+
+    assert results == [("s1", "A"), ("s1", "A"), ("s2", "A")]
+    assert results[0] is results[1]
+
+
+class GetGroupReport:
+    executions = 0
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    @single_flight(name="test.report", key=lambda self, group: group)
+    async def perform(self, group: str) -> tuple:
+        type(self).executions += 1
+        session = self.session_factory()
+        await asyncio.sleep(0.01)
+        return session, group
+
+
+@pytest.mark.unit
+async def test_separate_instances_coalesce_through_key():
+    opened = []
+
+    def session_factory():
+        opened.append(object())
+        return opened[-1]
+
+    first, second = GetGroupReport(session_factory), GetGroupReport(session_factory)
+
+    results = await asyncio.gather(first.perform("A"), second.perform("A"))
+
+    assert GetGroupReport.executions == 1
+    assert len(opened) == 1
+    assert results[0] is results[1]
+    assert GetGroupReport.perform.single_flight.in_flight == 0
+
+
+@pytest.mark.unit
+async def test_errors_are_shared_and_one_cancelled_waiter_does_not_cancel_others():
+    started = asyncio.Event()
+    attempts = 0
+
+    @single_flight
+    async def load(key):
+        nonlocal attempts
+        attempts += 1
+        started.set()
+        await asyncio.sleep(0.02)
+        if key == "bad":
+            raise LookupError(key)
+        return key
+
+    leader = asyncio.create_task(load("ok"))
+    await started.wait()
+    follower = asyncio.create_task(load("ok"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "ok"
+    assert attempts == 1
+
+    results = await asyncio.gather(load("bad"), load("bad"), return_exceptions=True)
+    assert all(isinstance(r, LookupError) for r in results)
+    assert attempts == 2
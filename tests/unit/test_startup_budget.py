@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from benchmarks.bench_startup import APP_MODULE, import_times
+
+# Cold-import budget for the web app; override on slow CI runners
+STARTUP_IMPORT_BUDGET = float(os.getenv("STARTUP_IMPORT_BUDGET", "2.5"))
+
+
+@pytest.mark.unit
+def test_app_import_defers_heavy_modules():
+    _, per_module, loaded = import_times()
+
+    assert per_module, "no -X importtime output captured"
+    assert loaded == []
+
+
+@pytest.mark.benchmark
+def test_app_import_stays_within_budget():
+    # Wall-clock: excluded by default, run with `pytest -m benchmark`
+    best = min(import_times()[0] for _ in range(2))
+
+    assert best <= STARTUP_IMPORT_BUDGET, (
+        f"importing {APP_MODULE} took {best:.2f}s (budget {STARTUP_IMPORT_BUDGET}s); "
+        "run `python -m benchmarks.bench_startup` to find the culprit"
+    )
+
+
+@pytest.mark.unit
+def test_container_builds_resources_on_first_resolve():
+    from app.config.container import Container
+
+    built = []
+    container = Container()
+    container.register_factory("report_client", lambda: built.append(1) or object())
+
+    assert built == []
+    first = container.resolve("report_client")
+    assert container.resolve("report_client") is first
+    assert built == [1]
+
+    with pytest.raises(RuntimeError):
+        container.resolve("missing")
+
+
+@pytest.mark.unit
+def test_broken_router_fails_startup_unless_disabled(monkeypatch):
+    from fastapi import FastAPI
+
+    from app.config.settings import settings
+    from app.infrastructure.api import main
+
+    monkeypatch.setattr(main, "ROUTERS", [
+        ("health", "app.infrastructure.api.routers.health", "/api", ["health"]),
+        ("broken", "app.infrastructure.api.routers.does_not_exist", "/api/broken", ["broken"]),
+    ])
+    with pytest.raises(ModuleNotFoundError):
+        main.include_routers(FastAPI())
+
+    monkeypatch.setattr(settings, "ENABLED_ROUTERS", "health")
+    app = FastAPI()
+    main.include_routers(app)
+    assert any(route.path == "/api/health" for route in app.routes)
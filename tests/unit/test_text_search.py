@@ -0,0 +1,47 @@
+import pytest
+
+from app.common.utils.text_search import TextIndex, trigrams, words
+
+
+def _index():
+    index = TextIndex()
+    index.add(1, "garcia ana s2024-0001")
+    index.add(2, "garcia luis s2024-0002")
+    index.add(3, "garrido ana s2023-0107")
+    index.add(4, "ortiz maria s2024-0110")
+    return index
+
+
+@pytest.mark.unit
+def test_words_and_trigrams_follow_pg_trgm():
+    assert words("O'Neil, Ana-María S2024-01") == ["o", "neil", "ana", "maría", "s2024", "01"]
+    assert trigrams("Ana") == {"  a", " an", "ana", "na "}
+
+
+@pytest.mark.unit
+def test_prefix_matches_every_query_word_in_sort_order():
+    index = _index()
+    assert [key for _, key in index.prefix("gar")] == [1, 2, 3]
+    assert [key for _, key in index.prefix("ANA gar")] == [1, 3]
+    assert [key for _, key in index.prefix("s2024-01")] == [4]
+    assert index.prefix("zz") == []
+    assert index.prefix("  ,, ") == []
+
+
+@pytest.mark.unit
+def test_similar_tolerates_typos_and_ranks_best_first():
+    index = _index()
+    found = index.similar("garcya", threshold=0.5)
+    assert [key for _, _, key in found][:2] == [1, 2]
+    assert all(score >= 0.5 for score, _, _ in found)
+    assert index.similar("xyzzy") == []
+
+
+@pytest.mark.unit
+def test_add_replaces_and_remove_hides_entries():
+    index = _index()
+    index.add(2, "gomez luis s2024-0002")
+    index.remove(3)
+    assert len(index) == 3
+    assert [key for _, key in index.prefix("gar")] == [1]
+    assert [key for _, key in index.prefix("gom")] == [2]